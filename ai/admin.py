@@ -1,13 +1,36 @@
 # ai/admin.py
-from django.contrib import admin
+from django.contrib import admin, messages
+from portfolio.exports import StreamingExportMixin
+from .answer_cache import hit_stats
 from .models import AIQuery, AIContext
 
 @admin.register(AIQuery)
-class AIQueryAdmin(admin.ModelAdmin):
-    list_display = ('question', 'has_attachment', 'created_at')
-    list_filter = ('created_at',)
-    search_fields = ('question',)
-    readonly_fields = ('created_at',)
+class AIQueryAdmin(StreamingExportMixin, admin.ModelAdmin):
+    list_display = ('question', 'has_attachment', 'cache_hit', 'response_ms', 'created_at')
+    list_filter = ('cache_hit', 'created_at')
+    search_fields = ('question', 'answer')
+    readonly_fields = (
+        'created_at', 'cache_hit', 'similarity', 'response_ms', 'first_token_ms', 'saved_ms',
+    )
+    actions = ['export_as_csv', 'export_as_jsonl']
+    export_fields = (
+        'id', 'question', 'attachment', 'answer', 'cache_hit', 'similarity',
+        'response_ms', 'first_token_ms', 'saved_ms', 'created_at',
+    )
+
+    def changelist_view(self, request, extra_context=None):
+        # Hit ratio over the filtered rows, shown above the list
+        response = super().changelist_view(request, extra_context)
+        changelist = getattr(response, 'context_data', {}).get('cl')
+        if changelist is not None:
+            stats = hit_stats(changelist.queryset)
+            self.message_user(
+                request,
+                f"Answer cache: {stats['hits']}/{stats['answered']} answered from cache "
+                f"({stats['hit_ratio']:.0%}), {stats['saved_ms'] / 1000:.1f}s of generation saved",
+                level=messages.INFO,
+            )
+        return response
 
     def has_attachment(self, obj):
         return bool(obj.attachment)
@@ -0,0 +1,202 @@
+"""
+Answer cache for repeated AI questions.
+
+Many visitors ask the same few things ("what is your tech stack?"). Answers
+are cached per process under the normalized question text and the hash of
+the prompt context they were generated from (ai.utils.PortfolioContextCache),
+so editing an FAQ or AI context row retires every answer built on the old
+context without any explicit invalidation.
+
+Entries expire after AI_ANSWER_CACHE_TTL seconds and the least recently used
+one is evicted once AI_ANSWER_CACHE_SIZE is reached. When
+AI_ANSWER_CACHE_SIMILARITY is set (e.g. 0.85), a question with no exact
+match can also be answered from the cached question with the highest TF-IDF
+cosine similarity above that threshold, computed locally over the cached
+questions.
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.db.models import Count, Q, Sum
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_question(text):
+    """Case, accent-compatible and whitespace/punctuation-insensitive form."""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return " ".join(_WORD_RE.findall(text))
+
+
+class CachedAnswer:
+    """A cached answer and what it cost to generate."""
+
+    def __init__(self, question, answer, generation_ms, expires_at):
+        self.question = question
+        self.answer = answer
+        self.generation_ms = generation_ms
+        self.expires_at = expires_at
+        self.terms = Counter(question.split())
+
+
+class AnswerMatch:
+    """Result of a successful lookup."""
+
+    def __init__(self, entry, similarity):
+        self.answer = entry.answer
+        self.question = entry.question
+        self.generation_ms = entry.generation_ms
+        self.similarity = similarity
+
+
+class AnswerCache:
+    """Per-process TTL/LRU cache of AI answers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self):
+        return getattr(settings, "AI_ANSWER_CACHE_SIZE", 256)
+
+    @property
+    def ttl(self):
+        return getattr(settings, "AI_ANSWER_CACHE_TTL", 86400)
+
+    @property
+    def threshold(self):
+        return getattr(settings, "AI_ANSWER_CACHE_SIMILARITY", None)
+
+    def get(self, question, context_version):
+        """Return an AnswerMatch for `question`, or None."""
+        normalized = normalize_question(question)
+        if not normalized:
+            return None
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get((context_version, normalized))
+            if entry is not None:
+                self._entries.move_to_end((context_version, normalized))
+                self.hits += 1
+                return AnswerMatch(entry, 1.0)
+
+            match = None
+            if self.threshold:
+                match = self._nearest(normalized, context_version)
+            if match is None:
+                self.misses += 1
+                return None
+            key, similarity = match
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return AnswerMatch(self._entries[key], similarity)
+
+    def put(self, question, context_version, answer, generation_ms=None):
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        key = (context_version, normalized)
+        with self._lock:
+            self._entries[key] = CachedAnswer(
+                normalized, answer, generation_ms, time.monotonic() + self.ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _expire(self, now):
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    def _nearest(self, normalized, context_version):
+        """(key, similarity) of the most similar cached question, if any
+        clears the threshold. TF-IDF is fitted on the cached questions for
+        this context plus the new one."""
+        candidates = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if key[0] == context_version
+        ]
+        if not candidates:
+            return None
+
+        query_terms = Counter(normalized.split())
+        documents = [entry.terms for _, entry in candidates] + [query_terms]
+        document_frequency = Counter()
+        for terms in documents:
+            document_frequency.update(terms.keys())
+        total = len(documents)
+        # Smoothed idf, as in scikit-learn's TfidfVectorizer
+        idf = {
+            term: math.log((1 + total) / (1 + count)) + 1
+            for term, count in document_frequency.items()
+        }
+
+        def vector(terms):
+            weights = {term: count * idf[term] for term, count in terms.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            return weights, norm
+
+        query, query_norm = vector(query_terms)
+        best_key, best_similarity = None, 0.0
+        for key, entry in candidates:
+            weights, norm = vector(entry.terms)
+            if not norm or not query_norm:
+                continue
+            dot = sum(w * weights.get(term, 0.0) for term, w in query.items())
+            similarity = dot / (query_norm * norm)
+            if similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is not None and best_similarity >= self.threshold:
+            return best_key, round(best_similarity, 4)
+        return None
+
+
+answer_cache = AnswerCache()
+
+
+def hit_stats(queryset=None):
+    """
+    Hit ratio and latency saved over answered AIQuery rows (all of them, or
+    `queryset`, e.g. the last week's).
+    """
+    from .models import AIQuery
+
+    queryset = AIQuery.objects.all() if queryset is None else queryset
+    totals = queryset.exclude(answer="").aggregate(
+        answered=Count("pk"),
+        hits=Count("pk", filter=Q(cache_hit=True)),
+        saved_ms=Sum("saved_ms"),
+    )
+    answered = totals["answered"]
+    return {
+        "answered": answered,
+        "hits": totals["hits"],
+        "hit_ratio": round(totals["hits"] / answered, 4) if answered else 0.0,
+        "saved_ms": round(totals["saved_ms"] or 0, 2),
+    }
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ai'
+
+    def ready(self):
+        """Rebuild the cached prompt context when its source rows change"""
+        from .utils import portfolio_context
+
+        portfolio_context.connect()
@@ -0,0 +1,24 @@
+"""Scheduled jobs for the AI app (see scheduler.registry)."""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from scheduler.registry import job
+from scheduler.utils import delete_in_chunks
+
+from .models import AIQuery
+
+
+@job("30 2 * * *")
+def prune_ai_queries():
+    """Delete AI queries (and their attachments) older than AI_QUERY_RETENTION_DAYS."""
+    days = getattr(settings, "AI_QUERY_RETENTION_DAYS", 180)
+    old = AIQuery.objects.filter(created_at__lt=timezone.now() - timedelta(days=days))
+
+    # Deleting rows leaves uploaded files behind
+    for query in old.exclude(attachment="").exclude(attachment__isnull=True).iterator():
+        query.attachment.delete(save=False)
+
+    deleted = delete_in_chunks(old)
+    return f"Deleted {deleted} queries older than {days} days"
@@ -1,103 +1,402 @@
+"""
+Gemini client helpers.
+
+ask_gemini() used to call genai.configure() and genai.list_models() (a full
+network round trip) on every question and then try model names one by one.
+GeminiModelRegistry does that work once per process instead:
+
+* the first call lists the available models and keeps the preferred usable
+  one as a ready GenerativeModel;
+* after GEMINI_MODEL_TTL seconds the list is refreshed on a background
+  thread while callers keep using the current model;
+* a model whose calls fail with a model-level error (retired, no access,
+  quota used up) is marked unhealthy for GEMINI_MODEL_COOLDOWN seconds and
+  the next candidate takes over at once.
+
+Async calls get a model per event loop (see get_async()): the SDK's async
+gRPC client only works on the loop it was first used from.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+
 import google.generativeai as genai
+from google.generativeai import client as genai_client
+from asgiref.sync import sync_to_async
 from django.conf import settings
-import logging
+from django.core.exceptions import ImproperlyConfigured
+from google.api_core import exceptions as google_exceptions
 
 logger = logging.getLogger(__name__)
 
+# Returned by ask_gemini() instead of an answer; never cached
+NOT_CONFIGURED_MESSAGE = "I'm sorry, but the AI service is not properly configured. Please contact the administrator."
+EMPTY_RESPONSE_MESSAGE = "I apologize, but I couldn't generate a response. Please try again."
+ERROR_MESSAGE = "I'm experiencing technical difficulties. Please try again later."
+FALLBACK_MESSAGES = (NOT_CONFIGURED_MESSAGE, EMPTY_RESPONSE_MESSAGE, ERROR_MESSAGE)
+
+# Preferred models, best first; used as-is when listing models fails
+DEFAULT_MODEL_PREFERENCES = (
+    "models/gemini-1.5-flash",
+    "models/gemini-1.5-pro",
+    "models/gemini-pro",
+    "models/gemini-1.0-pro",
+)
+
+# Errors that say the model itself is unusable, rather than the request
+MODEL_ERRORS = (
+    google_exceptions.NotFound,
+    google_exceptions.PermissionDenied,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.FailedPrecondition,
+)
+
+
+def _model_path(name):
+    return name if name.startswith("models/") else f"models/{name}"
+
 
 def list_available_models():
     """
     List available Gemini models for debugging purposes.
     """
     try:
-        if not hasattr(settings, "GEMINI_API_KEY") or not settings.GEMINI_API_KEY:
+        if not getattr(settings, "GEMINI_API_KEY", None):
             return []
-
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        models = []
-
-        for model in genai.list_models():
-            if "generateContent" in model.supported_generation_methods:
-                models.append(model.name)
-                logger.info(f"Available model: {model.name}")
-
+        model_registry.configure()
+        models = [
+            model.name
+            for model in genai.list_models()
+            if "generateContent" in model.supported_generation_methods
+        ]
+        for name in models:
+            logger.info(f"Available model: {name}")
         return models
     except Exception as e:
         logger.error(f"Error listing models: {str(e)}")
         return []
 
 
+class GeminiModelRegistry:
+    """Per-process choice of Gemini model, resolved once and kept fresh."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held while listing models, so concurrent first calls list once
+        self._resolve_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget the resolved model (e.g. after changing the API key)."""
+        with self._lock:
+            self._configured_key = None
+            self._candidates = []
+            self._clients = {}
+            # Event loop -> {model name: GenerativeModel}; dropped with the loop
+            self._loop_clients = weakref.WeakKeyDictionary()
+            self._unhealthy = {}
+            self._expires_at = None
+            self._refreshing = None
+
+    @property
+    def ttl(self):
+        return getattr(settings, "GEMINI_MODEL_TTL", 3600)
+
+    @property
+    def cooldown(self):
+        return getattr(settings, "GEMINI_MODEL_COOLDOWN", 300)
+
+    def configure(self):
+        """Configure the SDK once per API key."""
+        api_key = settings.GEMINI_API_KEY
+        if self._configured_key != api_key:
+            genai.configure(api_key=api_key)
+            self._configured_key = api_key
+
+    def _list_candidates(self):
+        """
+        Model names to try, best first: preferred ones that are available.
+        Returns (names, listed); if listing failed the preferences are used.
+        """
+        preferences = [
+            _model_path(name)
+            for name in getattr(
+                settings, "GEMINI_MODEL_PREFERENCES", DEFAULT_MODEL_PREFERENCES
+            )
+        ]
+        try:
+            available = [
+                model.name
+                for model in genai.list_models()
+                if "generateContent" in model.supported_generation_methods
+            ]
+        except Exception as e:
+            logger.warning(f"Could not list Gemini models: {str(e)}")
+            return preferences, False
+
+        preferred = [name for name in preferences if name in available]
+        others = [name for name in available if name not in preferred]
+        return preferred + others or preferences, True
+
+    def _resolve(self):
+        started = time.perf_counter()
+        self.configure()
+        candidates, listed = self._list_candidates()
+        # An unlisted guess is retried sooner than a real list
+        lifetime = self.ttl if listed else min(self.ttl, self.cooldown)
+        with self._lock:
+            self._candidates = candidates
+            self._expires_at = time.monotonic() + lifetime
+        logger.info(
+            f"Resolved Gemini models: {', '.join(candidates[:3])}",
+            extra={"duration_ms": round((time.perf_counter() - started) * 1000, 2)},
+        )
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            self._refreshing = threading.Thread(
+                target=self._refresh, name="gemini-model-refresh", daemon=True
+            )
+            self._refreshing.start()
+
+    def _refresh(self):
+        try:
+            self._resolve()
+        except Exception as e:
+            logger.warning(f"Background Gemini model refresh failed: {str(e)}")
+
+    def _healthy(self, name):
+        until = self._unhealthy.get(name)
+        return until is None or until <= time.monotonic()
+
+    def get(self):
+        """
+        Return (model_name, GenerativeModel) for the best healthy model.
+
+        Only the first call in a process waits for the model list.
+        """
+        if self._expires_at is None:
+            with self._resolve_lock:
+                if self._expires_at is None:
+                    self._resolve()
+        elif time.monotonic() > self._expires_at:
+            self._refresh_in_background()
+
+        candidates = self._candidates
+        healthy = [name for name in candidates if self._healthy(name)]
+        # Every model failed recently: try the best one again anyway
+        name = (healthy or candidates)[0]
+        client = self._clients.get(name)
+        if client is None:
+            client = genai.GenerativeModel(name)
+            self._clients[name] = client
+        return name, client
+
+    def get_async(self):
+        """
+        get() for coroutines, once the models are resolved: the same choice
+        of model, with its own async client for the running event loop.
+
+        The SDK keeps one grpc.aio client per process, bound to the first
+        loop that used it. Under WSGI every async view runs on a new loop
+        (async_to_sync), so a shared client fails with "Event loop is closed"
+        from the second request on.
+        """
+        name, _ = self.get()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            models = self._loop_clients.setdefault(loop, {})
+            model = models.get(name)
+        if model is None:
+            model = genai.GenerativeModel(name)
+            # The SDK has no public way to pass an async client in
+            model._async_client = genai_client._client_manager.make_client(
+                "generative_async"
+            )
+            with self._lock:
+                models[name] = model
+        return name, model
+
+    def mark_unhealthy(self, name, error=None):
+        """Skip `name` for the cooldown period."""
+        self._unhealthy[name] = time.monotonic() + self.cooldown
+        logger.warning(
+            f"Marking Gemini model {name} unhealthy for {self.cooldown}s: {error}"
+        )
+
+    def generate(self, prompt, attempts=2, **kwargs):
+        """
+        Generate a response, moving on to the next model when the current
+        one fails with a model-level error. With stream=True the first chunk
+        is fetched here, so those errors still surface before any output.
+        """
+        for attempt in range(attempts):
+            name, model = self.get()
+            try:
+                return name, model.generate_content(prompt, **kwargs)
+            except MODEL_ERRORS as e:
+                self.mark_unhealthy(name, e)
+                if attempt == attempts - 1:
+                    raise
+
+    async def agenerate(self, prompt, attempts=2, **kwargs):
+        """
+        Async generate(): awaits generate_content_async, so no thread is
+        held while Gemini works on the answer.
+        """
+        for attempt in range(attempts):
+            if self._expires_at is None:
+                # The first model listing is blocking network I/O
+                await sync_to_async(self.get, thread_sensitive=False)()
+            name, model = self.get_async()
+            try:
+                return name, await model.generate_content_async(prompt, **kwargs)
+            except MODEL_ERRORS as e:
+                self.mark_unhealthy(name, e)
+                if attempt == attempts - 1:
+                    raise
+
+
+model_registry = GeminiModelRegistry()
+
+
 def ask_gemini(prompt):
     """
     Ask Gemini AI a question and return the response.
     """
     try:
         # Check if API key is configured
-        if not hasattr(settings, "GEMINI_API_KEY") or not settings.GEMINI_API_KEY:
+        if not getattr(settings, "GEMINI_API_KEY", None):
             logger.error("Gemini API key not configured")
-            return "I'm sorry, but the AI service is not properly configured. Please contact the administrator."
+            return NOT_CONFIGURED_MESSAGE
 
-        # Configure Gemini
-        genai.configure(api_key=settings.GEMINI_API_KEY)
+        used_model_name, response = model_registry.generate(prompt)
+        return _answer_text(used_model_name, response)
 
-        # First, try to get list of available models
-        available_models = []
-        try:
-            for model in genai.list_models():
-                if "generateContent" in model.supported_generation_methods:
-                    available_models.append(model.name)
-                    logger.info(f"Available model: {model.name}")
-        except Exception as list_error:
-            logger.warning(f"Could not list models: {str(list_error)}")
-
-        # Try different model names in order of preference
-        # Using full model paths as returned by list_models()
-        model_names = [
-            "models/gemini-1.5-flash",
-            "models/gemini-1.5-pro",
-            "models/gemini-pro",
-            "models/gemini-1.0-pro",
-            "gemini-1.5-flash",
-            "gemini-1.5-pro",
-            "gemini-pro",
-        ]
+    except Exception as e:
+        logger.error(f"Error calling Gemini API: {str(e)}")
+        return ERROR_MESSAGE
 
-        # If we got available models, use those first
-        if available_models:
-            model_names = available_models + model_names
 
-        model = None
-        used_model_name = None
+async def ask_gemini_async(prompt, timeout=None):
+    """
+    Async ask_gemini() for ASGI views. Gives up after `timeout` seconds
+    (GEMINI_TIMEOUT by default), cancelling the request.
+    """
+    if timeout is None:
+        timeout = getattr(settings, "GEMINI_TIMEOUT", 30)
+    try:
+        if not getattr(settings, "GEMINI_API_KEY", None):
+            logger.error("Gemini API key not configured")
+            return NOT_CONFIGURED_MESSAGE
+
+        used_model_name, response = await asyncio.wait_for(
+            model_registry.agenerate(prompt), timeout
+        )
+        return _answer_text(used_model_name, response)
+
+    except asyncio.TimeoutError:
+        logger.error(f"Gemini API did not answer within {timeout}s")
+        return ERROR_MESSAGE
+    except Exception as e:
+        logger.error(f"Error calling Gemini API: {str(e)}")
+        return ERROR_MESSAGE
+
+
+def _answer_text(used_model_name, response):
+    if response and response.text:
+        logger.info(f"Successfully generated response using model: {used_model_name}")
+        return response.text
+    logger.warning("Empty response from Gemini API")
+    return EMPTY_RESPONSE_MESSAGE
 
-        for model_name in model_names:
+
+def stream_gemini(prompt):
+    """
+    Start a streamed answer to `prompt`. Returns (model_name, chunks), where
+    chunks yields the text as Gemini generates it. Closing chunks before it
+    is exhausted (e.g. the visitor left) cancels the request upstream.
+    """
+    if not getattr(settings, "GEMINI_API_KEY", None):
+        raise ImproperlyConfigured("Gemini API key not configured")
+    name, response = model_registry.generate(prompt, stream=True)
+    return name, _stream_text(response)
+
+
+async def astream_gemini(prompt):
+    """
+    Async stream_gemini() for ASGI views: chunks is an async iterator, and
+    closing it (aclose()) before it is exhausted cancels the request.
+    """
+    if not getattr(settings, "GEMINI_API_KEY", None):
+        raise ImproperlyConfigured("Gemini API key not configured")
+    name, response = await model_registry.agenerate(prompt, stream=True)
+    return name, _astream_text(response)
+
+
+async def _astream_text(response):
+    finished = False
+    try:
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                continue
+            if text:
+                yield text
+        finished = True
+    finally:
+        if not finished:
+            await _acancel_stream(response)
+
+
+def _stream_text(response):
+    finished = False
+    try:
+        for chunk in response:
             try:
-                model = genai.GenerativeModel(model_name)
-                used_model_name = model_name
-                logger.info(f"Successfully initialized model: {model_name}")
-                break
-            except Exception as model_error:
-                logger.warning(
-                    f"Failed to initialize model {model_name}: {str(model_error)}"
-                )
+                text = chunk.text
+            except ValueError:
+                # No text in this chunk, e.g. one carrying only the finish reason
                 continue
+            if text:
+                yield text
+        finished = True
+    finally:
+        if not finished:
+            _cancel_stream(response)
 
-        if not model:
-            logger.error("Failed to initialize any Gemini model")
-            logger.error(f"Tried models: {model_names}")
-            return "I'm sorry, but I'm having trouble connecting to the AI service. Please try again later."
 
-        # Generate response
-        response = model.generate_content(prompt)
+def _cancel_stream(response):
+    # The SDK has no public cancel; the gRPC/REST stream it reads from does
+    stream = getattr(response, "_iterator", None)
+    cancel = getattr(stream, "cancel", None) or getattr(stream, "close", None)
+    if cancel is None:
+        return
+    try:
+        cancel()
+        logger.info("Cancelled Gemini stream")
+    except Exception as e:
+        logger.warning(f"Could not cancel Gemini stream: {str(e)}")
+
 
-        if response and response.text:
-            logger.info(
-                f"Successfully generated response using model: {used_model_name}"
-            )
-            return response.text
+async def _acancel_stream(response):
+    # The async SDK reads from an async generator over the gRPC call; closing
+    # it drops the call, which grpc.aio cancels when it is collected
+    stream = getattr(response, "_iterator", None)
+    cancel = getattr(stream, "cancel", None)
+    try:
+        if cancel is not None:
+            cancel()
+        elif hasattr(stream, "aclose"):
+            await stream.aclose()
         else:
-            logger.warning("Empty response from Gemini API")
-            return "I apologize, but I couldn't generate a response. Please try again."
-
+            return
+        logger.info("Cancelled Gemini stream")
     except Exception as e:
-        logger.error(f"Error calling Gemini API: {str(e)}")
-        return "I'm experiencing technical difficulties. Please try again later."
+        logger.warning(f"Could not cancel Gemini stream: {str(e)}")
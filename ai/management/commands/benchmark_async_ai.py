@@ -0,0 +1,193 @@
+"""
+Django management command to measure page latency while AI questions are in
+flight, with the sync AI view behind a fixed pool of workers (like gunicorn
+sync workers) and with the async view on a single event loop (like ASGI)
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, Client, override_settings
+from django.urls import include, path, reverse
+
+from ai.answer_cache import answer_cache
+from ai.llm_utills import model_registry
+from ai.models import AIQuery
+from ai.views import AIQuerySubmitView, AsyncAIQuerySubmitView
+
+QUESTION_PREFIX = 'Benchmark question'
+
+# The command runs with ROOT_URLCONF set to this module, so both views are
+# mounted whatever AI_ASYNC_VIEWS says
+urlpatterns = [
+    path('benchmark/ai-sync/', AIQuerySubmitView.as_view(), name='benchmark_sync_ai'),
+    path('benchmark/ai-async/', AsyncAIQuerySubmitView.as_view(), name='benchmark_async_ai'),
+    path('', include(settings.ROOT_URLCONF)),
+]
+
+
+class SlowModel:
+    """Stands in for a GenerativeModel that takes `delay` seconds to answer."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def generate_content(self, prompt, **kwargs):
+        time.sleep(self.delay)
+        return SimpleNamespace(text='Benchmark answer')
+
+    async def generate_content_async(self, prompt, **kwargs):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(text='Benchmark answer')
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark page latency during slow AI answers, sync workers vs. the async view'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ai-requests',
+            type=int,
+            default=8,
+            help='AI questions in flight at once (default: 8)',
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=20,
+            help='Page requests made while they are in flight (default: 20)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Sync workers serving requests in the sync run (default: 4)',
+        )
+        parser.add_argument(
+            '--gemini-ms',
+            type=float,
+            default=2000.0,
+            help='Time the stand-in model takes per answer (default: 2000)',
+        )
+        parser.add_argument(
+            '--path',
+            default='/',
+            help='Page to request (default: /)',
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        model = SlowModel(options['gemini_ms'] / 1000)
+
+        self.stdout.write(
+            f"⏱️  GET {options['path']} while {options['ai_requests']} AI questions "
+            f"({options['gemini_ms']:.0f} ms each) are in flight\n"
+        )
+
+        # Every AI request logs the question it received
+        ai_logger = logging.getLogger('ai')
+        level = ai_logger.level
+        ai_logger.setLevel(logging.WARNING)
+        # The benchmark's questions are removed again so they never count
+        # towards the real answer-cache hit ratio
+        last_pk = AIQuery.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        try:
+            with patch.object(model_registry, 'get', return_value=('benchmark', model)), \
+                    patch.object(model_registry, 'get_async', return_value=('benchmark', model)), \
+                    override_settings(
+                        GEMINI_API_KEY=settings.GEMINI_API_KEY or 'benchmark',
+                        ROOT_URLCONF=__name__,
+                    ):
+                # Warm the page cache and URL resolvers before timing anything
+                Client().get(options['path'])
+                sync_idle = self.run_sync(ai_requests=0)
+                sync_busy = self.run_sync(ai_requests=options['ai_requests'])
+                async_idle = asyncio.run(self.run_async(ai_requests=0))
+                async_busy = asyncio.run(self.run_async(ai_requests=options['ai_requests']))
+        finally:
+            ai_logger.setLevel(level)
+            deleted, _ = AIQuery.objects.filter(
+                pk__gt=last_pk, question__startswith=QUESTION_PREFIX
+            ).delete()
+            self.stdout.write(f"🧹 Deleted {deleted} benchmark AI queries\n")
+
+        workers = options['workers']
+        self.stdout.write(f"🐢 Sync view, {workers} workers (WSGI):")
+        self.report('No AI load:', sync_idle)
+        self.report('AI questions in flight:', sync_busy)
+        self.stdout.write('⚡ Async view, one event loop (ASGI):')
+        self.report('No AI load:', async_idle)
+        self.report('AI questions in flight:', async_busy)
+
+        sync_slowdown = percentile(sync_busy, 0.95) / percentile(sync_idle, 0.95)
+        async_slowdown = percentile(async_busy, 0.95) / percentile(async_idle, 0.95)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n✨ p95 page latency under AI load: {sync_slowdown:.1f}x idle with "
+                f"sync workers, {async_slowdown:.1f}x idle with the async view"
+            )
+        )
+
+    def questions(self, count):
+        # Distinct questions, so none is answered from the answer cache
+        answer_cache.clear()
+        return [f'{QUESTION_PREFIX} {i} at {time.time_ns()}' for i in range(count)]
+
+    def run_sync(self, ai_requests):
+        """Page latencies (ms) with every request queued for a fixed worker pool."""
+        url = reverse('benchmark_sync_ai')
+        path = self.options['path']
+
+        def ask(question):
+            Client().post(url, {'question': question})
+
+        def page(queued_at):
+            Client().get(path)
+            return (time.perf_counter() - queued_at) * 1000
+
+        with ThreadPoolExecutor(max_workers=self.options['workers']) as pool:
+            for question in self.questions(ai_requests):
+                pool.submit(ask, question)
+            # Let the AI requests reach the workers first, as they would
+            time.sleep(0.05)
+            pages = [
+                pool.submit(page, time.perf_counter())
+                for _ in range(self.options['pages'])
+            ]
+            return [future.result() for future in pages]
+
+    async def run_async(self, ai_requests):
+        """Page latencies (ms) with AI questions awaited on one event loop."""
+        client = AsyncClient()
+        url = reverse('benchmark_async_ai')
+        path = self.options['path']
+
+        async def page():
+            started = time.perf_counter()
+            await client.get(path)
+            return (time.perf_counter() - started) * 1000
+
+        asks = [
+            asyncio.create_task(client.post(url, {'question': question}))
+            for question in self.questions(ai_requests)
+        ]
+        await asyncio.sleep(0.05)
+        latencies = await asyncio.gather(*(page() for _ in range(self.options['pages'])))
+        await asyncio.gather(*asks)
+        return latencies
+
+    def report(self, label, latencies):
+        self.stdout.write(
+            f"    {label:<26} p50 {percentile(latencies, 0.5):7.1f} ms, "
+            f"p95 {percentile(latencies, 0.95):7.1f} ms"
+        )
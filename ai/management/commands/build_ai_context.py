@@ -0,0 +1,30 @@
+"""
+Django management command to prebuild the cached AI prompt context at deploy
+"""
+from django.core.management.base import BaseCommand
+
+from ai.utils import portfolio_context
+
+
+class Command(BaseCommand):
+    help = 'Render the AI prompt context into the shared cache and report its size'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--show',
+            action='store_true',
+            help='Print the rendered context as well',
+        )
+
+    def handle(self, *args, **options):
+        # Always render from the database; the cached copy may predate a deploy
+        context = portfolio_context.build()
+
+        self.stdout.write('🧠 AI prompt context built')
+        self.stdout.write(f"  • Hash:       {context.content_hash[:12]}")
+        self.stdout.write(f"  • Characters: {context.chars:,}")
+        self.stdout.write(f"  • Tokens:     ~{context.estimated_tokens:,} (estimated)")
+
+        if options['show']:
+            self.stdout.write('')
+            self.stdout.write(context.text)
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiquery',
+            name='answer',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='aiquery',
+            name='cache_hit',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='aiquery',
+            name='response_ms',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='aiquery',
+            name='saved_ms',
+            field=models.FloatField(blank=True, help_text='Generation time the cache hit avoided', null=True),
+        ),
+        migrations.AddField(
+            model_name='aiquery',
+            name='similarity',
+            field=models.FloatField(blank=True, help_text='Similarity to the cached question (1.0 = same question)', null=True),
+        ),
+    ]
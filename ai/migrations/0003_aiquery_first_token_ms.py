@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai', '0002_aiquery_answer_aiquery_cache_hit_aiquery_response_ms_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiquery',
+            name='first_token_ms',
+            field=models.FloatField(blank=True, help_text='Time until the first streamed text was sent', null=True),
+        ),
+    ]
@@ -4,6 +4,19 @@ from django.db import models
 class AIQuery(models.Model):
     question = models.TextField()
     attachment = models.FileField(upload_to='query_attachments/', blank=True, null=True)
+    answer = models.TextField(blank=True)
+    # Answer cache bookkeeping (see ai.answer_cache)
+    cache_hit = models.BooleanField(default=False)
+    similarity = models.FloatField(
+        null=True, blank=True, help_text="Similarity to the cached question (1.0 = same question)"
+    )
+    response_ms = models.FloatField(null=True, blank=True)
+    first_token_ms = models.FloatField(
+        null=True, blank=True, help_text="Time until the first streamed text was sent"
+    )
+    saved_ms = models.FloatField(
+        null=True, blank=True, help_text="Generation time the cache hit avoided"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
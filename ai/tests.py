@@ -4,9 +4,9 @@ Tests AI functionality, Gemini API integration, and AI-powered features.
 """
 
 import json
-from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase, Client
-from django.urls import reverse
+from unittest.mock import ANY, AsyncMock, Mock, patch, MagicMock
+from django.test import TestCase, Client, override_settings
+from django.urls import include, path, reverse
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -17,6 +17,7 @@ from tests.utils import BaseTestCase
 from ai.models import *  # Import AI models
 from ai import views
 from ai import utils
+from ai.urls import ai_urlpatterns
 
 
 # ===== AI MODEL TESTS =====
@@ -389,6 +390,426 @@ class AIUtilityTest(BaseTestCase):
             pass
 
 
+# ===== PROMPT CONTEXT CACHE TESTS =====
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.mark.unit
+@override_settings(CACHES=LOCMEM_CACHES)
+class PortfolioContextCacheTest(BaseTestCase):
+    """Test that the prompt context is rendered once per edit."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        super().setUp()
+        from portfolio.models import FAQ
+
+        self.faq = FAQ.objects.create(question="Are you available?", answer="<p>Yes</p>")
+
+    def test_context_is_rendered_once(self):
+        from ai.utils import get_portfolio_context, portfolio_context
+
+        first = get_portfolio_context()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_portfolio_context(), first)
+
+        self.assertIn("A: Yes", first)
+        stats = portfolio_context.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["chars"], len(first))
+        self.assertEqual(stats["estimated_tokens"], -(-len(first) // 4))
+
+    def test_edits_rebuild_the_context(self):
+        from ai.utils import get_portfolio_context
+
+        get_portfolio_context()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.answer = "Booked until June"
+            self.faq.save()
+        self.assertIn("A: Booked until June", get_portfolio_context())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AIContext.objects.create(title="Hobbies", content="Climbing")
+        self.assertIn("Climbing", get_portfolio_context())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.delete()
+        self.assertNotIn("Booked until June", get_portfolio_context())
+
+    def test_generation_is_bumped_on_commit(self):
+        """Other processes keep the old generation until the write commits."""
+        from django.core.cache import cache
+
+        from ai.utils import CONTEXT_GENERATION_KEY, PortfolioContextCache
+
+        other_process = PortfolioContextCache()
+        other_process.get()
+        generation = cache.get(CONTEXT_GENERATION_KEY)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.faq.answer = "Booked until June"
+            self.faq.save()
+            self.assertEqual(cache.get(CONTEXT_GENERATION_KEY), generation)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(cache.get(CONTEXT_GENERATION_KEY), generation)
+        self.assertIn("A: Booked until June", other_process.get().text)
+
+    def test_evicted_generation_starts_a_new_one(self):
+        """A missing generation key does not resurrect an older context."""
+        from django.core.cache import cache
+
+        from ai.utils import CONTEXT_GENERATION_KEY, PortfolioContextCache
+
+        cache.delete(CONTEXT_GENERATION_KEY)
+        # e.g. build_ai_context at deploy, before anything set the key
+        PortfolioContextCache().build()
+        other_process = PortfolioContextCache()
+        other_process.get()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.answer = "Booked until June"
+            self.faq.save()
+        cache.delete(CONTEXT_GENERATION_KEY)
+
+        self.assertIn("A: Booked until June", other_process.get().text)
+        self.assertIn("A: Booked until June", PortfolioContextCache().get().text)
+
+    def test_other_processes_reuse_the_rendered_text(self):
+        from ai.utils import PortfolioContextCache, portfolio_context
+
+        built = portfolio_context.get()
+        # A fresh process finds the text in the shared cache
+        with self.assertNumQueries(0):
+            context = PortfolioContextCache().get()
+
+        self.assertEqual(context.content_hash, built.content_hash)
+
+    def test_unchanged_text_keeps_its_hash(self):
+        from portfolio.models import SiteConfiguration
+
+        from ai.utils import portfolio_context
+
+        config = SiteConfiguration.objects.create(email="hello@example.com")
+        before = portfolio_context.get().content_hash
+
+        # hero_name is not part of the prompt
+        with self.captureOnCommitCallbacks(execute=True):
+            config.hero_name = "Roshan D."
+            config.save()
+
+        context = portfolio_context.get()
+        self.assertEqual(context.content_hash, before)
+        self.assertIn("hello@example.com", context.text)
+        self.assertEqual(portfolio_context.stats()["misses"], 2)
+
+    def test_build_command_reports_size(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command("build_ai_context", stdout=out)
+
+        self.assertIn("Characters:", out.getvalue())
+        self.assertIn("Tokens:", out.getvalue())
+
+
+# ===== ANSWER CACHE TESTS =====
+
+
+@pytest.mark.unit
+class AnswerCacheTest(BaseTestCase):
+    """Test the TTL/LRU answer cache and near-duplicate matching."""
+
+    def setUp(self):
+        super().setUp()
+        from ai.answer_cache import AnswerCache
+
+        self.cache = AnswerCache()
+
+    def test_questions_are_normalized(self):
+        self.cache.put("What is your tech stack?", "v1", "Django", generation_ms=900)
+
+        match = self.cache.get("  what is your TECH stack ", "v1")
+        self.assertEqual(match.answer, "Django")
+        self.assertEqual(match.similarity, 1.0)
+        # Answers built from another context version are not reused
+        self.assertIsNone(self.cache.get("What is your tech stack?", "v2"))
+
+    def test_expired_and_least_recent_entries_are_dropped(self):
+        with override_settings(AI_ANSWER_CACHE_SIZE=2):
+            self.cache.put("first", "v1", "1")
+            self.cache.put("second", "v1", "2")
+            self.cache.get("first", "v1")
+            self.cache.put("third", "v1", "3")
+
+            self.assertIsNone(self.cache.get("second", "v1"))
+            self.assertIsNotNone(self.cache.get("first", "v1"))
+
+        with override_settings(AI_ANSWER_CACHE_TTL=0):
+            self.cache.put("fourth", "v1", "4")
+        self.assertIsNone(self.cache.get("fourth", "v1"))
+
+    def test_near_duplicates_match_above_threshold(self):
+        self.cache.put("what is your tech stack", "v1", "Django")
+        self.cache.put("are you available for freelance work", "v1", "Yes")
+
+        self.assertIsNone(self.cache.get("what is your current tech stack", "v1"))
+
+        with override_settings(AI_ANSWER_CACHE_SIMILARITY=0.8):
+            match = self.cache.get("what is your current tech stack", "v1")
+            self.assertEqual(match.answer, "Django")
+            self.assertLess(match.similarity, 1.0)
+            self.assertIsNone(self.cache.get("what is your favourite food", "v1"))
+
+    @patch("ai.views.ask_gemini", return_value="I mostly use Django.")
+    def test_repeated_questions_are_answered_from_cache(self, mock_ask):
+        from ai.answer_cache import hit_stats
+
+        url = reverse("ai:submit_ai_query")
+        for question in ("What is your tech stack?", "what is your tech stack"):
+            response = self.client.post(url, {"question": question})
+            self.assertEqual(response.json()["response"], "I mostly use Django.")
+
+        mock_ask.assert_called_once()
+        first, second = AIQuery.objects.order_by("pk")
+        self.assertFalse(first.cache_hit)
+        self.assertEqual(first.answer, "I mostly use Django.")
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(second.similarity, 1.0)
+        self.assertIsNotNone(second.saved_ms)
+        self.assertEqual(hit_stats()["hit_ratio"], 0.5)
+
+    @patch("ai.views.ask_gemini")
+    def test_fallback_messages_are_not_cached(self, mock_ask):
+        from ai.llm_utills import ERROR_MESSAGE
+
+        mock_ask.return_value = ERROR_MESSAGE
+        url = reverse("ai:submit_ai_query")
+        for _ in range(2):
+            self.client.post(url, {"question": "Hello?"})
+
+        self.assertEqual(mock_ask.call_count, 2)
+
+
+# ===== STREAMING TESTS =====
+
+
+class FakeStream:
+    """Stand-in for a streamed GenerateContentResponse."""
+
+    def __init__(self, *texts):
+        self.texts = texts
+        self._iterator = Mock()
+
+    def __iter__(self):
+        for text in self.texts:
+            yield Mock(text=text)
+
+
+class FakeAsyncStream(FakeStream):
+    """Stand-in for a streamed AsyncGenerateContentResponse."""
+
+    async def __aiter__(self):
+        for text in self.texts:
+            yield Mock(text=text)
+
+
+@pytest.mark.views
+class AIStreamViewTest(BaseTestCase):
+    """Test the Server-Sent Events endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch("ai.llm_utills.genai")
+        self.genai = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.genai.list_models.return_value = []
+        self.model = self.genai.GenerativeModel.return_value
+        self.url = reverse("ai:stream_ai_query")
+
+    def events(self, response):
+        events = []
+        for block in b"".join(response.streaming_content).decode().split("\n\n"):
+            if block:
+                event, data = block.split("\n")
+                events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+        return events
+
+    def test_answer_is_streamed_with_final_metadata(self):
+        self.model.generate_content.return_value = FakeStream("I use ", "Django.")
+
+        response = self.client.post(self.url, {"question": "Your stack?"})
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = self.events(response)
+        self.assertEqual(
+            events[:2], [("chunk", {"text": "I use "}), ("chunk", {"text": "Django."})]
+        )
+        name, done = events[-1]
+        self.assertEqual(name, "done")
+        self.assertFalse(done["cached"])
+        self.assertEqual(done["chars"], len("I use Django."))
+        self.model.generate_content.assert_called_once_with(ANY, stream=True)
+
+        query = AIQuery.objects.get(pk=done["query_id"])
+        self.assertEqual(query.answer, "I use Django.")
+        self.assertIsNotNone(query.first_token_ms)
+
+        # The finished answer is cached for the next visitor
+        events = self.events(self.client.post(self.url, {"question": "your stack"}))
+        self.assertEqual(events[0], ("chunk", {"text": "I use Django."}))
+        self.assertTrue(events[-1][1]["cached"])
+        self.model.generate_content.assert_called_once()
+
+    def test_disconnect_cancels_the_upstream_stream(self):
+        stream = FakeStream("First part. ", "Second part.")
+        self.model.generate_content.return_value = stream
+
+        response = self.client.post(self.url, {"question": "Tell me everything"})
+        first = next(iter(response.streaming_content))
+        self.assertIn(b"First part.", first)
+        # What the server does when the visitor goes away
+        response.close()
+
+        stream._iterator.cancel.assert_called_once()
+        query = AIQuery.objects.get()
+        self.assertEqual(query.answer, "First part. ")
+        from ai.answer_cache import answer_cache
+
+        self.assertEqual(len(answer_cache), 0)
+
+    def test_errors_are_sent_as_an_event(self):
+        self.model.generate_content.side_effect = RuntimeError("backend down")
+
+        events = self.events(self.client.post(self.url, {"question": "Hello?"}))
+
+        self.assertEqual([name for name, _ in events], ["error", "done"])
+        self.assertEqual(AIQuery.objects.get().answer, events[0][1]["message"])
+
+
+# ===== ASYNC VIEW TESTS =====
+
+# The AI routes as mounted with AI_ASYNC_VIEWS=True (ROOT_URLCONF="ai.tests")
+urlpatterns = [
+    path("ai/", include((ai_urlpatterns(async_views=True), "ai"))),
+]
+
+
+@pytest.mark.views
+@override_settings(ROOT_URLCONF="ai.tests")
+class AsyncAIQueryViewTest(BaseTestCase):
+    """Test the async submit view served under ASGI."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch("ai.llm_utills.genai")
+        self.genai = patcher.start()
+        self.addCleanup(patcher.stop)
+        client_patcher = patch("ai.llm_utills.genai_client")
+        client_patcher.start()
+        self.addCleanup(client_patcher.stop)
+        self.genai.list_models.return_value = []
+        self.model = self.genai.GenerativeModel.return_value
+        self.url = reverse("ai:async_submit_ai_query")
+
+    async def test_answer_is_awaited(self):
+        from django.test import AsyncClient
+
+        self.model.generate_content_async = AsyncMock(
+            return_value=Mock(text="I build with Django.")
+        )
+
+        response = await AsyncClient().post(self.url, {"question": "Your stack?"})
+
+        self.assertEqual(response.json()["response"], "I build with Django.")
+        self.model.generate_content.assert_not_called()
+        query = await AIQuery.objects.aget()
+        self.assertEqual(query.answer, "I build with Django.")
+
+    @override_settings(GEMINI_TIMEOUT=0.05)
+    async def test_slow_answers_time_out(self):
+        import asyncio
+
+        from django.test import AsyncClient
+
+        from ai.answer_cache import answer_cache
+        from ai.llm_utills import ERROR_MESSAGE
+
+        async def never_answers(prompt, **kwargs):
+            await asyncio.sleep(10)
+
+        self.model.generate_content_async = never_answers
+
+        with self.assertLogs("ai.llm_utills", level="ERROR"):
+            response = await AsyncClient().post(self.url, {"question": "Hello?"})
+
+        self.assertEqual(response.json()["response"], ERROR_MESSAGE)
+        self.assertEqual(len(answer_cache), 0)
+
+    async def test_answer_is_streamed_as_it_arrives(self):
+        from django.test import AsyncClient
+
+        self.model.generate_content_async = AsyncMock(
+            return_value=FakeAsyncStream("I use ", "Django.")
+        )
+
+        response = await AsyncClient().post(
+            reverse("ai:stream_ai_query"), {"question": "Your stack?"}
+        )
+
+        # An async iterator, so ASGI sends each event as it is yielded
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        events = [block.split("\n")[0] for block in body.decode().split("\n\n") if block]
+        self.assertEqual(events, ["event: chunk", "event: chunk", "event: done"])
+        self.model.generate_content_async.assert_awaited_once_with(ANY, stream=True)
+        query = await AIQuery.objects.aget()
+        self.assertEqual(query.answer, "I use Django.")
+
+    async def test_disconnect_cancels_the_async_stream(self):
+        from ai.views import AsyncAIQueryStreamView
+
+        stream = FakeAsyncStream("First part. ", "Second part.")
+        self.model.generate_content_async = AsyncMock(return_value=stream)
+        query = await AIQuery.objects.acreate(question="Tell me everything")
+
+        events = AsyncAIQueryStreamView().astream_events(query)
+        self.assertIn("First part.", await anext(events))
+        # What the ASGI handler does when the visitor goes away
+        await events.aclose()
+
+        stream._iterator.cancel.assert_called_once()
+        query = await AIQuery.objects.aget()
+        self.assertEqual(query.answer, "First part. ")
+
+    def test_async_view_is_mounted_only_when_enabled(self):
+        from ai.urls import urlpatterns as ai_urls
+
+        # Test settings leave AI_ASYNC_VIEWS off
+        self.assertNotIn(
+            "async_submit_ai_query", [pattern.name for pattern in ai_urls]
+        )
+
+    def test_middleware_supports_async(self):
+        # One sync-only middleware makes async views run one at a time
+        from django.conf import settings
+        from django.utils.module_loading import import_string
+
+        for path in settings.MIDDLEWARE:
+            self.assertTrue(
+                getattr(import_string(path), "async_capable", False), path
+            )
+
+
 # ===== AI SECURITY TESTS =====
 
 
@@ -662,3 +1083,113 @@ class AIPerformanceTest(BaseTestCase):
         self.assertGreaterEqual(
             len(successful_requests), 1
         )  # At least one should succeed
+
+
+# ===== GEMINI MODEL REGISTRY TESTS =====
+
+
+@pytest.mark.unit
+class GeminiModelRegistryTest(BaseTestCase):
+    """Test that the Gemini model is resolved once and failed models skipped."""
+
+    def _listed(self, *names):
+        models = []
+        for name in names:
+            model = Mock(supported_generation_methods=["generateContent"])
+            model.name = name
+            models.append(model)
+        return models
+
+    def setUp(self):
+        super().setUp()
+        from ai.llm_utills import model_registry
+
+        self.registry = model_registry
+        patcher = patch("ai.llm_utills.genai")
+        self.genai = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.genai.list_models.return_value = self._listed(
+            "models/gemini-pro", "models/gemini-1.5-flash"
+        )
+        self.clients = {}
+
+        def make_client(name):
+            client = Mock()
+            client.generate_content.return_value = Mock(text=f"answer from {name}")
+            self.clients[name] = client
+            return client
+
+        self.genai.GenerativeModel.side_effect = make_client
+
+    def test_models_are_listed_once(self):
+        from ai.llm_utills import ask_gemini
+
+        for _ in range(3):
+            answer = ask_gemini("What do you build?")
+
+        # The preferred model wins over API list order
+        self.assertEqual(answer, "answer from models/gemini-1.5-flash")
+        self.genai.configure.assert_called_once_with(api_key="test-gemini-key")
+        self.genai.list_models.assert_called_once()
+        self.genai.GenerativeModel.assert_called_once()
+
+    def test_expired_list_is_refreshed_in_background(self):
+        self.registry.get()
+        self.registry._expires_at = 0
+
+        name, _ = self.registry.get()
+        self.assertEqual(name, "models/gemini-1.5-flash")
+        self.registry._refreshing.join(timeout=5)
+
+        self.assertEqual(self.genai.list_models.call_count, 2)
+        self.assertGreater(self.registry._expires_at, 0)
+
+    def test_async_clients_are_kept_per_event_loop(self):
+        """Each event loop (a WSGI request through async_to_sync) gets its own."""
+        import asyncio
+
+        self.registry.get()
+
+        async def async_client():
+            name, model = self.registry.get_async()
+            self.assertIs(self.registry.get_async()[1], model)
+            return name, model._async_client
+
+        with patch("ai.llm_utills.genai_client") as genai_client:
+            genai_client._client_manager.make_client.side_effect = lambda name: Mock()
+            (first_name, first), (second_name, second) = [
+                asyncio.run(async_client()) for _ in range(2)
+            ]
+
+        self.assertEqual(first_name, second_name)
+        self.assertIsNot(first, second)
+        genai_client._client_manager.make_client.assert_called_with("generative_async")
+
+    def test_failed_model_is_skipped(self):
+        from google.api_core.exceptions import NotFound
+
+        from ai.llm_utills import ask_gemini
+
+        self.registry.get()
+        self.clients["models/gemini-1.5-flash"].generate_content.side_effect = (
+            NotFound("model retired")
+        )
+
+        self.assertEqual(ask_gemini("Hi"), "answer from models/gemini-pro")
+        self.assertEqual(ask_gemini("Hi"), "answer from models/gemini-pro")
+        # Not retried during the cooldown
+        flash = self.clients["models/gemini-1.5-flash"]
+        flash.generate_content.assert_called_once()
+
+    def test_listing_failure_falls_back_to_preferences(self):
+        self.genai.list_models.side_effect = RuntimeError("network down")
+
+        name, _ = self.registry.get()
+
+        self.assertEqual(name, "models/gemini-1.5-flash")
+        # The guess expires sooner than a real list
+        import time
+
+        self.assertLessEqual(
+            self.registry._expires_at - time.monotonic(), self.registry.cooldown
+        )
@@ -1,9 +1,38 @@
 # ai/urls.py
+from django.conf import settings
 from django.urls import path
-from .views import AIQuerySubmitView
+from .views import (
+    AIQueryStreamView,
+    AIQuerySubmitView,
+    AsyncAIQueryStreamView,
+    AsyncAIQuerySubmitView,
+)
 
 app_name = 'ai'
 
-urlpatterns = [
-    path('submit-query/', AIQuerySubmitView.as_view(), name='submit_ai_query'),
-]
\ No newline at end of file
+
+def ai_urlpatterns(async_views=False):
+    """
+    The app's routes. With async_views (AI_ASYNC_VIEWS, for ASGI servers)
+    questions are answered and streamed without holding a worker for the
+    whole Gemini call, and the async view is also mounted at
+    submit-query-async/.
+    """
+    SubmitView = AsyncAIQuerySubmitView if async_views else AIQuerySubmitView
+    StreamView = AsyncAIQueryStreamView if async_views else AIQueryStreamView
+    patterns = [
+        path('submit-query/', SubmitView.as_view(), name='submit_ai_query'),
+        path('stream-query/', StreamView.as_view(), name='stream_ai_query'),
+    ]
+    if async_views:
+        patterns.append(
+            path(
+                'submit-query-async/',
+                AsyncAIQuerySubmitView.as_view(),
+                name='async_submit_ai_query',
+            )
+        )
+    return patterns
+
+
+urlpatterns = ai_urlpatterns(getattr(settings, "AI_ASYNC_VIEWS", False))
@@ -1,8 +1,19 @@
 # ai/utils.py
+import hashlib
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
 from portfolio.models import SiteConfiguration, FAQ
 from ai.models import AIContext
 import re
 
+logger = logging.getLogger(__name__)
+
 def clean_html_content(html_content):
     """Remove HTML tags from content"""
     if not html_content:
@@ -72,51 +83,246 @@ def format_context_as_markdown(context_data):
     
     return markdown_content
 
-def get_portfolio_context():
+def render_portfolio_context():
     """
     Gathers personal context about Roshan Damor for AI responses.
     Focuses only on personal information, FAQs, and custom AI context.
     """
+    context_data = {}
+    
+    # Get site configuration for basic info
+    config = SiteConfiguration.objects.first()
+    
+    context_data['name'] = "Roshan Damor"
+    if config:
+        # SiteConfiguration has no about_me field (yet); keep the default bio
+        context_data['bio'] = getattr(config, 'about_me', '') or 'Full-Stack Developer and AI Enthusiast'
+        context_data['email'] = config.email or 'contact@roshandamor.me'
+    else:
+        context_data['bio'] = 'Full-Stack Developer and AI Enthusiast'
+        context_data['email'] = 'contact@roshandamor.me'
+    
+    # Get FAQs
+    faqs = FAQ.objects.all()[:10]
+    if faqs.exists():
+        context_data['faqs'] = []
+        for faq in faqs:
+            context_data['faqs'].append({
+                'question': faq.question,
+                'answer': clean_html_content(faq.answer)
+            })
+    
+    # Get custom AI context
+    ai_contexts = AIContext.objects.filter(is_active=True).order_by('title')
+    if ai_contexts.exists():
+        context_data['ai_contexts'] = []
+        for ai_context in ai_contexts:
+            context_data['ai_contexts'].append({
+                'title': ai_context.title,
+                'content': ai_context.content
+            })
+    
+    # Convert to markdown format
+    return format_context_as_markdown(context_data)
+
+
+# =========================================================================
+# CACHED PROMPT CONTEXT
+# =========================================================================
+#
+# The rendered context only depends on SiteConfiguration, FAQ and AIContext,
+# which are edited a few times a month. It is stored in the shared cache
+# under the hash of its text, and a generation key (bumped by signals on
+# those models) points at the current hash. Each process also keeps its own
+# copy, so a question costs one small cache read instead of three queries
+# and the markdown rendering. An edit that leaves the rendered text as it
+# was keeps the same hash.
+
+CONTEXT_GENERATION_KEY = "ai-context-generation"
+CONTEXT_POINTER_KEY_PREFIX = "ai-context-current"
+CONTEXT_BODY_KEY_PREFIX = "ai-context"
+# Pointers outlive their generation once it is bumped; let them expire
+CONTEXT_POINTER_TIMEOUT = 24 * 3600
+
+# Rough characters per token for English prose; only used for reporting
+CHARS_PER_TOKEN = 4
+
+
+class PromptContext:
+    """A rendered portfolio context and its size."""
+
+    def __init__(self, text, content_hash, built_at):
+        self.text = text
+        self.content_hash = content_hash
+        self.built_at = built_at
+
+    @property
+    def chars(self):
+        return len(self.text)
+
+    @property
+    def estimated_tokens(self):
+        return -(-len(self.text) // CHARS_PER_TOKEN)
+
+
+class PortfolioContextCache:
+    """Per-process copy of the rendered context, checked against the shared
+    generation key on every read."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = None
+        self._context = None
+        self.hits = 0
+        self.misses = 0
+
+    def _pointer_key(self, generation):
+        return f"{CONTEXT_POINTER_KEY_PREFIX}:{generation}"
+
+    def _current_generation(self):
+        """
+        The shared generation, started afresh if the key is missing. An
+        evicted key must not read as a generation of its own, or every
+        process would keep serving whatever was stored under it.
+        """
+        generation = cache.get(CONTEXT_GENERATION_KEY)
+        if generation is None:
+            cache.add(CONTEXT_GENERATION_KEY, time.time_ns(), None)
+            generation = cache.get(CONTEXT_GENERATION_KEY)
+        return generation
+
+    def get(self):
+        """Return the current PromptContext, rebuilding it only after an edit."""
+        generation = self._current_generation()
+        with self._lock:
+            if self._context is not None and self._generation == generation:
+                self.hits += 1
+                return self._context
+
+        # Another process may already have rendered this generation
+        content_hash = (
+            cache.get(self._pointer_key(generation)) if generation is not None else None
+        )
+        context = (
+            cache.get(f"{CONTEXT_BODY_KEY_PREFIX}:{content_hash}")
+            if content_hash
+            else None
+        )
+        if context is None:
+            context = self.build()
+        with self._lock:
+            self.misses += 1
+            self._generation = generation
+            self._context = context
+        return context
+
+    def build(self):
+        """Render the context from the database and store it for every process."""
+        # Read the generation first, so an edit during rendering forces a rebuild
+        generation = self._current_generation()
+        started = time.perf_counter()
+        text = render_portfolio_context()
+        context = PromptContext(
+            text=text,
+            content_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            built_at=time.time(),
+        )
+        cache.set(f"{CONTEXT_BODY_KEY_PREFIX}:{context.content_hash}", context, None)
+        if generation is not None:
+            cache.set(
+                self._pointer_key(generation),
+                context.content_hash,
+                CONTEXT_POINTER_TIMEOUT,
+            )
+        logger.info(
+            f"Built AI prompt context: {context.chars} chars, "
+            f"~{context.estimated_tokens} tokens",
+            extra={
+                "content_hash": context.content_hash[:12],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+        return context
+
+    def invalidate(self):
+        """Drop the local copy and start a new generation for every process."""
+        self._drop_local()
+        self._bump_generation()
+
+    def _drop_local(self):
+        with self._lock:
+            self._context = None
+            self._generation = None
+
+    def _bump_generation(self):
+        cache.set(CONTEXT_GENERATION_KEY, time.time_ns(), None)
+
+    def _on_change(self, sender, **kwargs):
+        logger.debug(f"Invalidating AI prompt context after {sender.__name__} change")
+        self._drop_local()
+        # Bumping before the write commits would let another process render
+        # the old rows under the new generation
+        transaction.on_commit(self._bump_generation, using=kwargs.get("using"))
+
+    def connect(self):
+        """Invalidate whenever a model the context is built from changes."""
+        for model in (SiteConfiguration, FAQ, AIContext):
+            uid = f"ai-context-{model._meta.label_lower}"
+            post_save.connect(self._on_change, sender=model, dispatch_uid=uid + "-save")
+            post_delete.connect(
+                self._on_change, sender=model, dispatch_uid=uid + "-delete"
+            )
+
+    def stats(self):
+        """Size of the current context and the hit rate for this process."""
+        total = self.hits + self.misses
+        context = self._context
+        return {
+            "content_hash": context.content_hash if context else None,
+            "chars": context.chars if context else None,
+            "estimated_tokens": context.estimated_tokens if context else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self):
+        """Forget the local copy and counters, e.g. between test cases."""
+        with self._lock:
+            self._context = None
+            self._generation = None
+        self.hits = 0
+        self.misses = 0
+
+
+portfolio_context = PortfolioContextCache()
+
+
+def get_prompt_context():
+    """
+    Return the PromptContext for AI prompts, rendered once per edit of the
+    underlying rows (see PortfolioContextCache).
+    """
     try:
-        context_data = {}
-        
-        # Get site configuration for basic info
-        config = SiteConfiguration.objects.first()
-        
-        context_data['name'] = "Roshan Damor"
-        if config:
-            context_data['bio'] = config.about_me or 'Full-Stack Developer and AI Enthusiast'
-            context_data['email'] = config.email or 'contact@roshandamor.me'
-        else:
-            context_data['bio'] = 'Full-Stack Developer and AI Enthusiast'
-            context_data['email'] = 'contact@roshandamor.me'
-        
-        # Get FAQs
-        faqs = FAQ.objects.all()[:10]
-        if faqs.exists():
-            context_data['faqs'] = []
-            for faq in faqs:
-                context_data['faqs'].append({
-                    'question': faq.question,
-                    'answer': clean_html_content(faq.answer)
-                })
-        
-        # Get custom AI context
-        ai_contexts = AIContext.objects.filter(is_active=True).order_by('title')
-        if ai_contexts.exists():
-            context_data['ai_contexts'] = []
-            for ai_context in ai_contexts:
-                context_data['ai_contexts'].append({
-                    'title': ai_context.title,
-                    'content': ai_context.content
-                })
-        
-        # Convert to markdown format
-        return format_context_as_markdown(context_data)
-        
+        return portfolio_context.get()
     except Exception as e:
-        # Fallback context in markdown format
-        return f"""# Roshan Damor - Personal Assistant Context
+        logger.error(f"Error building AI prompt context: {str(e)}")
+        text = _fallback_context(e)
+        return PromptContext(
+            text=text,
+            content_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            built_at=time.time(),
+        )
+
+
+def get_portfolio_context():
+    """Return the portfolio context text for AI prompts."""
+    return get_prompt_context().text
+
+
+def _fallback_context(e):
+    # Fallback context in markdown format
+    return f"""# Roshan Damor - Personal Assistant Context
 
 **Name:** Roshan Damor
 **Bio:** Full-Stack Developer and AI Enthusiast  
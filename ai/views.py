@@ -1,15 +1,35 @@
 # ai/views.py
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views import View
+import asyncio
 import json
 import logging
+import time
+from .answer_cache import answer_cache
 from .models import AIQuery
-from .llm_utills import ask_gemini
-from .utils import get_portfolio_context
+from .llm_utills import (
+    EMPTY_RESPONSE_MESSAGE,
+    ERROR_MESSAGE,
+    FALLBACK_MESSAGES,
+    NOT_CONFIGURED_MESSAGE,
+    ask_gemini,
+    ask_gemini_async,
+    astream_gemini,
+    stream_gemini,
+)
+from .utils import get_prompt_context
 
 logger = logging.getLogger(__name__)
 
 
+def sse_event(event, data):
+    """Format one Server-Sent Event; JSON keeps newlines out of the data line."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 class AIQuerySubmitView(View):
     """
     Handles the submission of the AI query form with real-time AI responses.
@@ -21,39 +41,126 @@ class AIQuerySubmitView(View):
             {"status": "error", "message": "Invalid request method."}, status=405
         )
 
+    def read_question(self, request):
+        # Get the question from POST data
+        question_text = request.POST.get("question", "").strip()
+        attached_file = request.FILES.get("attachment")
+
+        # Debug logging - sanitize user input to prevent log injection
+        safe_question = question_text.replace("\n", "\\n").replace("\r", "\\r")[:200]
+        logger.info(f"Received question: '{safe_question}'")
+        logger.info(f"Content type: {request.content_type}")
+        logger.info(f"POST data keys: {list(request.POST.keys())}")
+        logger.info(f"FILES data keys: {list(request.FILES.keys())}")
+        return question_text, attached_file
+
+    def missing_question(self):
+        logger.warning("Empty question received")
+        return JsonResponse(
+            {
+                "success": False,
+                "status": "error",
+                "message": "A question is required.",
+            },
+            status=400,
+        )
+
     def post(self, request, *args, **kwargs):
         try:
-            # Get the question from POST data
-            question_text = request.POST.get("question", "").strip()
-            attached_file = request.FILES.get("attachment")
+            question_text, attached_file = self.read_question(request)
+            if not question_text:
+                return self.missing_question()
 
-            # Debug logging - sanitize user input to prevent log injection
-            safe_question = question_text.replace("\n", "\\n").replace("\r", "\\r")[
-                :200
-            ]
-            logger.info(f"Received question: '{safe_question}'")
-            logger.info(f"Content type: {request.content_type}")
-            logger.info(f"POST data keys: {list(request.POST.keys())}")
-            logger.info(f"FILES data keys: {list(request.FILES.keys())}")
+            # Save the query to database
+            query = AIQuery.objects.create(
+                question=question_text, attachment=attached_file
+            )
+            started = time.perf_counter()
 
-            if not question_text:
-                logger.warning("Empty question received")
-                return JsonResponse(
-                    {
-                        "success": False,
-                        "status": "error",
-                        "message": "A question is required.",
-                    },
-                    status=400,
+            # Repeated questions are answered from the cache while the
+            # portfolio context they were answered from is unchanged
+            prompt_context = get_prompt_context()
+            cached = answer_cache.get(question_text, prompt_context.content_hash)
+            if cached is not None:
+                ai_response = cached.answer
+            else:
+                ai_response = ask_gemini(
+                    self.build_prompt(prompt_context.text, question_text)
                 )
+            self.record_answer(
+                query,
+                ai_response,
+                round((time.perf_counter() - started) * 1000, 2),
+                cached=cached,
+                context_version=prompt_context.content_hash,
+            )
 
-            # Save the query to database
-            AIQuery.objects.create(question=question_text, attachment=attached_file)
+            return self.answered(ai_response)
 
-            # Get AI response using Gemini
-            portfolio_data = get_portfolio_context()
+        except Exception as e:
+            return self.error_response(e)
 
-            prompt = f"""
+    def answered(self, ai_response):
+        return JsonResponse(
+            {
+                "success": True,
+                "response": ai_response,
+                "message": "Query processed successfully.",
+            }
+        )
+
+    def error_response(self, e):
+        # Log the error (sanitize exception message to prevent log injection)
+        safe_error = str(e).replace("\n", "\\n").replace("\r", "\\r")[:200]
+        logger.error(f"Error in {self.__class__.__name__}: {safe_error}")
+        return JsonResponse(
+            {
+                "success": False,
+                "response": "Sorry, I encountered an error processing your request. Please try again.",
+                "message": "An internal error occurred.",
+            },
+            status=500,
+        )
+
+    def record_answer(
+        self,
+        query,
+        answer,
+        response_ms,
+        cached=None,
+        context_version=None,
+        first_token_ms=None,
+    ):
+        """
+        Store the answer and its timings on `query`. A freshly generated
+        answer is cached under `context_version` unless it is a fallback
+        message; pass context_version=None to keep it out of the cache.
+        """
+        query.answer = answer
+        query.response_ms = response_ms
+        query.first_token_ms = first_token_ms
+        if cached is not None:
+            query.cache_hit = True
+            query.similarity = cached.similarity
+            if cached.generation_ms is not None:
+                query.saved_ms = max(cached.generation_ms - response_ms, 0)
+        elif context_version is not None and answer not in FALLBACK_MESSAGES:
+            answer_cache.put(
+                query.question, context_version, answer, generation_ms=response_ms
+            )
+        query.save(
+            update_fields=[
+                "answer",
+                "response_ms",
+                "first_token_ms",
+                "cache_hit",
+                "similarity",
+                "saved_ms",
+            ]
+        )
+
+    def build_prompt(self, portfolio_data, question_text):
+        return f"""
 {portfolio_data}
 
 ## Current User Question: 
@@ -79,25 +186,278 @@ class AIQuerySubmitView(View):
 - Sign off with "- Rexi ✨" when appropriate
 """
 
-            ai_response = ask_gemini(prompt)
 
-            return JsonResponse(
-                {
-                    "success": True,
-                    "response": ai_response,
-                    "message": "Query processed successfully.",
-                }
+class AsyncAIQuerySubmitView(AIQuerySubmitView):
+    """
+    AIQuerySubmitView for ASGI servers. Gemini is awaited with a timeout,
+    so a slow answer holds no worker thread while the rest of the site is
+    served; database work goes through the async ORM or sync_to_async.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            question_text, attached_file = self.read_question(request)
+            if not question_text:
+                return self.missing_question()
+
+            query = await AIQuery.objects.acreate(
+                question=question_text, attachment=attached_file
             )
+            started = time.perf_counter()
+
+            # Queries the database when the context changed since last use
+            prompt_context = await sync_to_async(get_prompt_context)()
+            cached = answer_cache.get(question_text, prompt_context.content_hash)
+            if cached is not None:
+                ai_response = cached.answer
+            else:
+                ai_response = await ask_gemini_async(
+                    self.build_prompt(prompt_context.text, question_text)
+                )
+            await sync_to_async(self.record_answer)(
+                query,
+                ai_response,
+                round((time.perf_counter() - started) * 1000, 2),
+                cached=cached,
+                context_version=prompt_context.content_hash,
+            )
+
+            return self.answered(ai_response)
 
         except Exception as e:
-            # Log the error (sanitize exception message to prevent log injection)
-            safe_error = str(e).replace("\n", "\\n").replace("\r", "\\r")[:200]
-            logger.error(f"Error in AIQuerySubmitView: {safe_error}")
-            return JsonResponse(
+            return self.error_response(e)
+
+
+class AIQueryStreamView(AIQuerySubmitView):
+    """
+    Streams the answer as Server-Sent Events while Gemini generates it:
+    "chunk" events carry text as it arrives, an "error" event replaces a
+    failed answer, and a final "done" event carries the metadata. Cached
+    answers arrive as a single chunk.
+    """
+
+    def post(self, request, *args, **kwargs):
+        question_text, attached_file = self.read_question(request)
+        if not question_text:
+            return self.missing_question()
+
+        query = AIQuery.objects.create(question=question_text, attachment=attached_file)
+        return self.event_stream(self.stream_events(query))
+
+    def event_stream(self, events):
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the events until the answer is complete
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def stream_events(self, query):
+        """
+        Yield the SSE events for `query`. When the visitor disconnects the
+        server closes this generator: the Gemini stream is cancelled and the
+        partial answer is recorded but not cached.
+        """
+        started = time.perf_counter()
+        first_token_ms = None
+        model_name = None
+        chunks = None
+        parts = []
+        recorded = False
+
+        def elapsed_ms():
+            return round((time.perf_counter() - started) * 1000, 2)
+
+        try:
+            prompt_context = get_prompt_context()
+            cached = answer_cache.get(query.question, prompt_context.content_hash)
+            error = None
+            try:
+                if cached is not None:
+                    chunks = iter((cached.answer,))
+                else:
+                    model_name, chunks = stream_gemini(
+                        self.build_prompt(prompt_context.text, query.question)
+                    )
+                for text in chunks:
+                    if first_token_ms is None:
+                        first_token_ms = elapsed_ms()
+                    parts.append(text)
+                    yield sse_event("chunk", {"text": text})
+            except ImproperlyConfigured:
+                logger.error("Gemini API key not configured")
+                error = NOT_CONFIGURED_MESSAGE
+            except Exception as e:
+                logger.error(f"Error streaming Gemini response: {str(e)}")
+                error = ERROR_MESSAGE
+
+            events = self.finish_stream(
+                query,
+                parts,
+                error,
+                cached,
+                prompt_context,
+                model_name,
+                first_token_ms,
+                elapsed_ms(),
+            )
+            recorded = True
+            yield from events
+        finally:
+            if chunks is not None and hasattr(chunks, "close"):
+                # Cancels the Gemini request if it is still generating
+                chunks.close()
+            if not recorded:
+                self.record_disconnect(query, parts, elapsed_ms(), first_token_ms)
+
+    def finish_stream(
+        self,
+        query,
+        parts,
+        error,
+        cached,
+        prompt_context,
+        model_name,
+        first_token_ms,
+        response_ms,
+    ):
+        """Record the streamed answer and return the closing events."""
+        answer = "".join(parts)
+        if error is None and not answer:
+            error = EMPTY_RESPONSE_MESSAGE
+        self.record_answer(
+            query,
+            answer or error,
+            response_ms,
+            cached=cached,
+            context_version=None if error else prompt_context.content_hash,
+            first_token_ms=first_token_ms,
+        )
+        logger.info(
+            f"Streamed AI answer for query {query.pk}",
+            extra={
+                "first_token_ms": first_token_ms,
+                "duration_ms": response_ms,
+                "cache_hit": cached is not None,
+            },
+        )
+
+        events = []
+        if error:
+            events.append(sse_event("error", {"message": error}))
+        events.append(
+            sse_event(
+                "done",
                 {
-                    "success": False,
-                    "response": "Sorry, I encountered an error processing your request. Please try again.",
-                    "message": "An internal error occurred.",
+                    "query_id": query.pk,
+                    "model": model_name,
+                    "cached": cached is not None,
+                    "first_token_ms": first_token_ms,
+                    "response_ms": response_ms,
+                    "chars": len(answer),
                 },
-                status=500,
             )
+        )
+        return events
+
+    def record_disconnect(self, query, parts, response_ms, first_token_ms):
+        partial = "".join(parts)
+        logger.info(
+            f"Client disconnected from AI stream for query {query.pk} "
+            f"after {len(partial)} chars"
+        )
+        self.record_answer(query, partial, response_ms, first_token_ms=first_token_ms)
+
+
+class AsyncAIQueryStreamView(AIQueryStreamView):
+    """
+    AIQueryStreamView for ASGI servers. The events come from an async
+    generator: Django reads a sync one under ASGI through sync_to_async(list),
+    which would hold every event back until the answer is complete.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        question_text, attached_file = self.read_question(request)
+        if not question_text:
+            return self.missing_question()
+
+        query = await AIQuery.objects.acreate(
+            question=question_text, attachment=attached_file
+        )
+        return self.event_stream(self.astream_events(query))
+
+    async def astream_events(self, query):
+        """
+        Async stream_events(). Gemini has GEMINI_TIMEOUT seconds to send
+        the first chunk. On disconnect the ASGI handler cancels the response
+        and the generator is closed, which cancels the Gemini stream.
+        """
+        started = time.perf_counter()
+        first_token_ms = None
+        model_name = None
+        chunks = None
+        parts = []
+        recorded = False
+
+        def elapsed_ms():
+            return round((time.perf_counter() - started) * 1000, 2)
+
+        async def cached_chunks(answer):
+            yield answer
+
+        try:
+            prompt_context = await sync_to_async(get_prompt_context)()
+            cached = answer_cache.get(query.question, prompt_context.content_hash)
+            error = None
+            try:
+                if cached is not None:
+                    chunks = cached_chunks(cached.answer)
+                else:
+                    timeout = getattr(settings, "GEMINI_TIMEOUT", 30)
+                    model_name, chunks = await asyncio.wait_for(
+                        astream_gemini(
+                            self.build_prompt(prompt_context.text, query.question)
+                        ),
+                        timeout,
+                    )
+                async for text in chunks:
+                    if first_token_ms is None:
+                        first_token_ms = elapsed_ms()
+                    parts.append(text)
+                    yield sse_event("chunk", {"text": text})
+            except ImproperlyConfigured:
+                logger.error("Gemini API key not configured")
+                error = NOT_CONFIGURED_MESSAGE
+            except asyncio.TimeoutError:
+                logger.error("Gemini API did not start answering in time")
+                error = ERROR_MESSAGE
+            except Exception as e:
+                logger.error(f"Error streaming Gemini response: {str(e)}")
+                error = ERROR_MESSAGE
+
+            events = await sync_to_async(self.finish_stream)(
+                query,
+                parts,
+                error,
+                cached,
+                prompt_context,
+                model_name,
+                first_token_ms,
+                elapsed_ms(),
+            )
+            recorded = True
+            for event in events:
+                yield event
+        finally:
+            if chunks is not None:
+                # Cancels the Gemini request if it is still generating
+                await chunks.aclose()
+            if not recorded:
+                await sync_to_async(self.record_disconnect)(
+                    query, parts, elapsed_ms(), first_token_ms
+                )
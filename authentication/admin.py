@@ -1,3 +1,27 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import PasswordResetEmail
+
+
+@admin.register(PasswordResetEmail)
+class PasswordResetEmailAdmin(admin.ModelAdmin):
+    """Queued reset emails; rows are written by the forgot password view."""
+
+    list_display = ("email", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("email",)
+    ordering = ("-created_at",)
+    readonly_fields = (
+        "email",
+        "base_url",
+        "site_name",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "last_error",
+        "created_at",
+        "sent_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
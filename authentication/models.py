@@ -1,3 +1,48 @@
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class PasswordResetEmail(models.Model):
+    """
+    A queued password reset email, delivered by `manage.py send_notifications`.
+
+    Rows are queued for every requested address, whether or not an account
+    uses it, so the forgot password view does the same work either way. The
+    worker looks the account up when sending; addresses without one are
+    marked skipped. The reset token is generated at send time and never
+    stored.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        SKIPPED = "skipped", "Skipped (no account)"
+        FAILED = "failed", "Failed"
+
+    email = models.EmailField()
+    # Scheme and host the request came in on, for building the reset link
+    base_url = models.URLField(max_length=200)
+    site_name = models.CharField(max_length=100, blank=True)
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Password Reset Email"
+        verbose_name_plural = "Password Reset Emails"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="reset_email_due_idx"
+            ),
+            # Dedupe lookups by address within the window
+            models.Index(fields=["email", "created_at"], name="reset_email_recent_idx"),
+        ]
+
+    def __str__(self):
+        return f"Password reset for {self.email} ({self.get_status_display()})"
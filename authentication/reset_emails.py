@@ -0,0 +1,171 @@
+"""
+Background delivery of password reset emails.
+
+ForgotPasswordView used to look the account up, render the email and talk
+to SMTP inside the request, so its response time followed SMTP latency and
+was longer for addresses that have an account. The view now only calls
+queue_password_reset(), which does the same work for every address, and
+``manage.py send_notifications`` sends the emails with
+process_password_resets().
+
+Repeated requests for one address within PASSWORD_RESET_DEDUPE_WINDOW
+seconds are dropped, so hammering the button sends a single email. Failed
+sends are retried with the notification outbox backoff until
+PASSWORD_RESET_MAX_ATTEMPTS is reached.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import EmailMultiAlternatives
+from django.db import connection, transaction
+from django.db.models import F
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from notifications.outbox import retry_delay
+from notifications.services import default_connection, elapsed_ms
+
+from .models import PasswordResetEmail
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def queue_password_reset(email, base_url, site_name=""):
+    """
+    Queue a reset email for `email`; returns the row, or None if one was
+    already queued for the address within the dedupe window.
+    """
+    now = timezone.now()
+    window = timedelta(seconds=_setting("PASSWORD_RESET_DEDUPE_WINDOW", 300))
+    if PasswordResetEmail.objects.filter(
+        email=email, created_at__gte=now - window
+    ).exists():
+        return None
+    return PasswordResetEmail.objects.create(
+        email=email, base_url=base_url, site_name=site_name, created_at=now
+    )
+
+
+def claim_due_resets(limit=50):
+    """Lease up to `limit` due rows to this worker, as notifications.outbox does."""
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=_setting("NOTIFICATION_OUTBOX_LEASE", 300))
+
+    with transaction.atomic():
+        due = PasswordResetEmail.objects.filter(
+            status=PasswordResetEmail.Status.PENDING, next_attempt_at__lte=now
+        ).order_by("next_attempt_at", "id")
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        ids = list(due.values_list("pk", flat=True)[:limit])
+        PasswordResetEmail.objects.filter(pk__in=ids).update(
+            attempts=F("attempts") + 1, next_attempt_at=lease_until
+        )
+
+    return list(
+        PasswordResetEmail.objects.filter(pk__in=ids).order_by("next_attempt_at", "id")
+    )
+
+
+def build_reset_message(entry, user):
+    """Render the reset email for `user`, with a freshly generated token."""
+    path = reverse(
+        "authentication:reset_password",
+        kwargs={
+            "uidb64": urlsafe_base64_encode(force_bytes(user.pk)),
+            "token": default_token_generator.make_token(user),
+        },
+    )
+    site_name = entry.site_name or _setting("SITE_NAME", "")
+    context = {
+        "user": user,
+        "reset_link": entry.base_url.rstrip("/") + path,
+        "site_name": site_name,
+        "domain": entry.base_url.split("://", 1)[-1].rstrip("/"),
+    }
+    return EmailMultiAlternatives(
+        subject=f"Password Reset - {site_name}",
+        body=render_to_string("emails/password_reset.txt", context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[entry.email],
+        alternatives=[
+            (render_to_string("emails/password_reset.html", context), "text/html")
+        ],
+    )
+
+
+def deliver_reset(entry, email_connection=None):
+    """Send one claimed row; returns its status afterwards."""
+    email_connection = email_connection or default_connection
+    log_extra = {"reset_id": entry.pk, "attempt": entry.attempts}
+    started = time.perf_counter()
+
+    users = list(User.objects.filter(email=entry.email))
+    if not users:
+        PasswordResetEmail.objects.filter(pk=entry.pk).update(
+            status=PasswordResetEmail.Status.SKIPPED
+        )
+        logger.info("Skipped password reset for unknown address", extra=log_extra)
+        return PasswordResetEmail.Status.SKIPPED
+
+    try:
+        for user in users:
+            email_connection.send(build_reset_message(entry, user))
+    except Exception as e:
+        final = entry.attempts >= _setting("PASSWORD_RESET_MAX_ATTEMPTS", 3)
+        update = {"last_error": str(e)}
+        if final:
+            update["status"] = PasswordResetEmail.Status.FAILED
+            status = PasswordResetEmail.Status.FAILED
+        else:
+            update["next_attempt_at"] = timezone.now() + timedelta(
+                seconds=retry_delay(entry.attempts)
+            )
+            status = PasswordResetEmail.Status.PENDING
+        PasswordResetEmail.objects.filter(pk=entry.pk).update(**update)
+        log_extra["duration_ms"] = elapsed_ms(started)
+        if final:
+            logger.error(
+                f"Giving up on password reset email after {entry.attempts} attempts: {e}",
+                exc_info=True,
+                extra=log_extra,
+            )
+        else:
+            logger.warning(
+                f"Failed to send password reset email, will retry: {e}",
+                extra=log_extra,
+            )
+        return status
+
+    PasswordResetEmail.objects.filter(pk=entry.pk).update(
+        status=PasswordResetEmail.Status.SENT, sent_at=timezone.now(), last_error=""
+    )
+    log_extra["duration_ms"] = elapsed_ms(started)
+    logger.info("Sent password reset email", extra=log_extra)
+    return PasswordResetEmail.Status.SENT
+
+
+def process_password_resets(limit=50):
+    """Deliver one batch of due reset emails; returns sent/failed/skipped counts."""
+    result = {"sent": 0, "failed": 0, "skipped": 0}
+    for entry in claim_due_resets(limit):
+        status = deliver_reset(entry)
+        if status == PasswordResetEmail.Status.SENT:
+            result["sent"] += 1
+        elif status == PasswordResetEmail.Status.SKIPPED:
+            result["skipped"] += 1
+        else:
+            result["failed"] += 1
+    return result
@@ -8,6 +8,7 @@ from django.urls import reverse
 from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
 import pytest
+from unittest.mock import patch
 
 from tests.factories import UserFactory
 from tests.utils import BaseTestCase
@@ -298,6 +299,103 @@ class PasswordFunctionalityTest(BaseTestCase):
             self.assertIn(response.status_code, [200, 302])
 
 
+# ===== PASSWORD RESET QUEUE TESTS =====
+
+
+@pytest.mark.views
+class PasswordResetQueueTest(TestCase):
+    """Test the queued, deduplicated password reset emails."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="reader@example.com",
+            email="reader@example.com",
+            password="old-password-123",
+        )
+        self.url = reverse("authentication:forgot_password")
+
+    def test_view_queues_without_sending(self):
+        from django.core import mail
+
+        from authentication.models import PasswordResetEmail
+
+        known = self.client.post(self.url, {"email": "Reader@example.com"})
+        unknown = self.client.post(self.url, {"email": "nobody@example.com"})
+
+        # Same response whether or not the address has an account
+        self.assertRedirects(known, reverse("authentication:login"), fetch_redirect_response=False)
+        self.assertRedirects(
+            unknown, reverse("authentication:login"), fetch_redirect_response=False
+        )
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            sorted(PasswordResetEmail.objects.values_list("email", flat=True)),
+            ["nobody@example.com", "reader@example.com"],
+        )
+
+    def test_repeat_requests_within_window_are_dropped(self):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from authentication.models import PasswordResetEmail
+        from authentication.reset_emails import queue_password_reset
+
+        for _ in range(5):
+            self.client.post(self.url, {"email": "reader@example.com"})
+        self.assertEqual(PasswordResetEmail.objects.count(), 1)
+
+        PasswordResetEmail.objects.update(
+            created_at=timezone.now() - timedelta(minutes=10)
+        )
+        self.assertIsNotNone(
+            queue_password_reset("reader@example.com", "http://testserver/")
+        )
+
+    def test_worker_sends_working_reset_link(self):
+        import re
+
+        from django.core import mail
+
+        from authentication.models import PasswordResetEmail
+        from authentication.reset_emails import process_password_resets
+
+        self.client.post(self.url, {"email": "reader@example.com"})
+        self.client.post(self.url, {"email": "nobody@example.com"})
+
+        result = process_password_resets()
+
+        self.assertEqual(result, {"sent": 1, "failed": 0, "skipped": 1})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["reader@example.com"])
+        link = re.search(r"http://testserver/auth/reset-password/\S+/", mail.outbox[0].body)
+        self.assertIsNotNone(link)
+        self.assertEqual(self.client.get(link.group(0)).status_code, 200)
+        self.assertEqual(
+            PasswordResetEmail.objects.get(email="nobody@example.com").status,
+            PasswordResetEmail.Status.SKIPPED,
+        )
+
+    def test_failed_send_is_retried_later(self):
+        from authentication.models import PasswordResetEmail
+        from authentication.reset_emails import process_password_resets
+
+        self.client.post(self.url, {"email": "reader@example.com"})
+        with patch(
+            "notifications.services.ManagedEmailConnection.send",
+            side_effect=ConnectionError("smtp down"),
+        ):
+            result = process_password_resets()
+
+        entry = PasswordResetEmail.objects.get()
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(entry.status, PasswordResetEmail.Status.PENDING)
+        self.assertEqual(entry.attempts, 1)
+        self.assertIn("smtp down", entry.last_error)
+        # Not due again until the backoff has passed
+        self.assertEqual(process_password_resets(), {"sent": 0, "failed": 0, "skipped": 0})
+
+
 # ===== SOCIAL AUTHENTICATION TESTS =====
 
 
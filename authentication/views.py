@@ -2,16 +2,14 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.contrib import messages
-from django.urls import reverse
 from django.views import View
-from django.core.mail import send_mail
-from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
-from django.utils.encoding import force_bytes, force_str
-from django.template.loader import render_to_string
+from django.utils.http import urlsafe_base64_decode
+from django.utils.encoding import force_str
 from django.contrib.sites.shortcuts import get_current_site
 
+from .reset_emails import queue_password_reset
+
 
 class SignupView(View):
     """Simple signup view with name, email, and password."""
@@ -145,77 +143,23 @@ class ForgotPasswordView(View):
             messages.error(request, "Email address is required.")
             return render(request, "authentication/password-forgot.html")
 
-        try:
-            user = User.objects.get(email=email)
-
-            # Generate password reset token
-            token = default_token_generator.make_token(user)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-
-            # Get current site
-            current_site = get_current_site(request)
-
-            # Create reset link
-            reset_link = request.build_absolute_uri(
-                reverse(
-                    "auth_app:reset_password", kwargs={"uidb64": uid, "token": token}
-                )
-            )
-
-            # For development, we'll also print the reset link to console
-            print(f"Password reset link for {email}: {reset_link}")
-
-            # Prepare email context
-            context = {
-                "user": user,
-                "reset_link": reset_link,
-                "site_name": current_site.name,
-                "domain": current_site.domain,
-            }
-
-            # Try to send email, but don't fail if email is not configured
-            try:
-                # Render email template
-                subject = f"Password Reset - {current_site.name}"
-                html_message = render_to_string("emails/password_reset.html", context)
-                plain_message = render_to_string("emails/password_reset.txt", context)
-
-                # Send email
-                send_mail(
-                    subject=subject,
-                    message=plain_message,
-                    html_message=html_message,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[email],
-                    fail_silently=False,
-                )
-                print(f"Password reset email sent to {email}")
-            except Exception as email_error:
-                print(f"Failed to send email: {email_error}")
-                # Continue anyway - user can still use the printed link in development
-
-            messages.success(
-                request,
-                "If an account with this email exists, I'll send you a password reset link shortly. "
-                "Check the console output for the reset link in development mode.",
-            )
-            return redirect("auth_app:login")
-
-        except User.DoesNotExist:
-            # Don't reveal that the user doesn't exist for security
-            messages.success(
-                request,
-                "If an account with this email exists, I'll send you a password reset link shortly.",
-            )
-            return redirect("auth_app:login")
-        except Exception as e:
-            print(f"Password reset error: {e}")
-            messages.error(
-                request,
-                "I encountered an error processing your password reset request. Please try again later.",
-            )
+        if len(email) > 254 or "@" not in email:
+            messages.error(request, "Please enter a valid email address.")
             return render(request, "authentication/password-forgot.html")
 
+        # Same work for every address, whether or not it has an account:
+        # the account lookup and the email happen in the background worker
+        queue_password_reset(
+            email,
+            base_url=request.build_absolute_uri("/"),
+            site_name=get_current_site(request).name,
+        )
+        messages.success(
+            request,
+            "If an account with this email exists, I'll send you a password reset link shortly.",
+        )
+        return redirect("authentication:login")
+
 
 class ResetPasswordView(View):
     """Handle password reset with token verification."""
@@ -235,11 +179,11 @@ class ResetPasswordView(View):
                 return render(request, "authentication/password-reset.html", context)
             else:
                 messages.error(request, "Invalid or expired reset link.")
-                return redirect("auth_app:forgot_password")
+                return redirect("authentication:forgot_password")
 
         except (TypeError, ValueError, OverflowError, User.DoesNotExist):
             messages.error(request, "Invalid reset link.")
-            return redirect("auth_app:forgot_password")
+            return redirect("authentication:forgot_password")
 
     def post(self, request, uidb64, token):
         try:
@@ -248,7 +192,7 @@ class ResetPasswordView(View):
 
             if not default_token_generator.check_token(user, token):
                 messages.error(request, "Invalid or expired reset link.")
-                return redirect("auth_app:forgot_password")
+                return redirect("authentication:forgot_password")
 
             password = request.POST.get("password", "").strip()
             confirm_password = request.POST.get("confirm_password", "").strip()
@@ -277,11 +221,11 @@ class ResetPasswordView(View):
                 request,
                 "Your password has been reset successfully. You can now sign in.",
             )
-            return redirect("auth_app:login")
+            return redirect("authentication:login")
 
         except (TypeError, ValueError, OverflowError, User.DoesNotExist):
             messages.error(request, "Invalid reset link.")
-            return redirect("auth_app:forgot_password")
+            return redirect("authentication:forgot_password")
 
 
 class LogoutView(View):
@@ -150,13 +150,14 @@ class CommentAdmin(admin.ModelAdmin):
     approval_status.short_description = "Status"
 
     def like_count(self, obj):
-        count = obj.likes.count()
+        count = obj.likes_count
         return format_html(
             '<span style="background: #e83e8c; color: white; padding: 2px 8px; border-radius: 12px; font-size: 11px;">❤️ {}</span>',
             count,
         )
 
     like_count.short_description = "Likes"
+    like_count.admin_order_field = "likes_count"
 
     @admin.action(description="✅ Approve selected comments")
     def approve_comments(self, request, queryset):
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:03
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_likes_count(apps, schema_editor):
+    Comment = apps.get_model("blog", "Comment")
+    CommentLike = apps.get_model("blog", "CommentLike")
+    counts = (
+        CommentLike.objects.filter(comment=OuterRef("pk"))
+        .values("comment")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Comment.objects.update(likes_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_alter_blog_cover_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_likes_count, migrations.RunPython.noop),
+    ]
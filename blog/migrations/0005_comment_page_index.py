@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_comment_likes_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'is_approved', 'created_date', 'id'], name='blog_comment_page_idx'),
+        ),
+    ]
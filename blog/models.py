@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.text import slugify
 from tinymce.models import HTMLField
 from portfolio.models import Category
+from portfolio.request_cache import first_instance
 from roshan.models import AboutMeConfiguration
 from django.core.exceptions import ValidationError
 import bleach
@@ -94,7 +95,7 @@ class Blog(models.Model):
         try:
             from portfolio.models import SiteConfiguration
 
-            site_config = SiteConfiguration.objects.first()
+            site_config = first_instance(SiteConfiguration)
             return site_config.hero_name if site_config else "Roshan Damor"
         except Exception:
             return "Roshan Damor"
@@ -103,7 +104,7 @@ class Blog(models.Model):
     def author_avatar(self):
         """Get author avatar from AboutMeConfiguration."""
         try:
-            about_config = AboutMeConfiguration.objects.first()
+            about_config = first_instance(AboutMeConfiguration)
             return (
                 about_config.profile_image
                 if about_config and about_config.profile_image
@@ -119,17 +120,26 @@ class Comment(models.Model):
     body = models.TextField()
     created_date = models.DateTimeField(auto_now_add=True)
     is_approved = models.BooleanField(default=True)
+    # Maintained by the like toggle view; repair with `reconcile_like_counts`
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["created_date"]
+        indexes = [
+            # Keyset pagination in portfolio.comments
+            models.Index(
+                fields=["post", "is_approved", "created_date", "id"],
+                name="blog_comment_page_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author_name} on {self.post.title}"
 
     @property
     def total_likes(self):
-        """Get total number of likes for this comment."""
-        return self.user_likes.count()
+        """Get total number of likes for this comment (stored counter)."""
+        return self.likes_count
 
     def is_liked_by_user(self, user):
         """Check if a specific user has liked this comment."""
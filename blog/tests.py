@@ -7,6 +7,8 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.utils.text import slugify
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import pytest
 from unittest.mock import patch
 
@@ -327,6 +329,89 @@ class CommentViewTest(BaseTestCase):
         pass
 
 
+@pytest.mark.views
+class CommentLikeCounterTest(TestCase):
+    """Test the stored like counter kept by toggle_comment_like."""
+
+    def setUp(self):
+        blog = Blog.objects.create(
+            title="Counter Post",
+            summary="Summary",
+            content="<p>Content</p>",
+            cover_image="blog_covers/cover.jpg",
+        )
+        self.comment = Comment.objects.create(
+            post=blog, author_name="Reader", body="Nice post"
+        )
+        self.user = User.objects.create_user(username="liker", password="pass12345")
+        self.client.force_login(self.user)
+        self.url = reverse("blog:toggle_comment_like", args=[self.comment.id])
+
+    def test_like_and_unlike_update_stored_count(self):
+        """Liking increments and unliking decrements likes_count."""
+        data = self.client.post(self.url).json()
+        self.assertTrue(data["liked"])
+        self.assertEqual(data["total_likes"], 1)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 1)
+
+        data = self.client.post(self.url).json()
+        self.assertFalse(data["liked"])
+        self.assertEqual(data["total_likes"], 0)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 0)
+
+    def test_total_likes_reads_stored_value(self):
+        """total_likes does not run a COUNT query."""
+        with self.assertNumQueries(0):
+            self.assertEqual(self.comment.total_likes, 0)
+
+
+@pytest.mark.views
+class BlogCommentPaginationTest(TestCase):
+    """Test that blog comments render one page and load the rest by cursor."""
+
+    def setUp(self):
+        self.blog = Blog.objects.create(
+            title="Paged Post",
+            summary="Summary",
+            content="<p>Content</p>",
+            cover_image="blog_covers/cover.jpg",
+        )
+        # The comment form is shown to signed-in readers
+        user = User.objects.create_user(username="reader", password="pass12345")
+        self.client.force_login(user)
+        for index in range(15):
+            Comment.objects.create(
+                post=self.blog, author_name="Reader", body=f"Comment {index}"
+            )
+
+    def test_detail_renders_first_page_only(self):
+        """Only the first ten comments are rendered server-side."""
+        response = self.client.get(
+            reverse("blog:blog_detail", kwargs={"slug": self.blog.slug})
+        )
+        self.assertEqual(len(response.context["comments"]), 10)
+        self.assertEqual(response.context["total_comments"], 15)
+        self.assertIsNotNone(response.context["next_comment_cursor"])
+
+    def test_next_page_continues_oldest_first(self):
+        """The cursor endpoint returns the remaining comments in order."""
+        response = self.client.get(
+            reverse("blog:blog_detail", kwargs={"slug": self.blog.slug})
+        )
+        data = self.client.get(
+            reverse("blog:blog_comments", kwargs={"slug": self.blog.slug}),
+            {"cursor": response.context["next_comment_cursor"]},
+        ).json()
+
+        self.assertEqual(
+            [comment["body"] for comment in data["comments"]],
+            [f"Comment {index}" for index in range(10, 15)],
+        )
+        self.assertIsNone(data["next_cursor"])
+
+
 # ===== INTEGRATION TESTS =====
 
 
@@ -462,6 +547,81 @@ class BlogUtilsTest(TestCase):
             self.assertNotEqual(blog1.slug, blog2.slug)
 
 
+# ===== REQUEST CACHE TESTS =====
+
+
+@pytest.mark.utils
+class AuthorLookupRequestCacheTest(TestCase):
+    """Test that author properties share one lookup per request."""
+
+    def create_blogs(self, count):
+        start = Blog.objects.count()
+        for index in range(start, start + count):
+            Blog.objects.create(
+                title=f"Cached Author Post {index}",
+                summary="Summary",
+                content="<p>Content</p>",
+                cover_image="blog_covers/cover.jpg",
+            )
+        return list(Blog.objects.all())
+
+    def test_lookups_memoized_within_request(self):
+        """Two queries in total, however many blogs are read."""
+        from portfolio.models import SiteConfiguration
+        from portfolio.request_cache import activate, deactivate
+
+        SiteConfiguration.objects.create(hero_name="Request Author")
+        blogs = self.create_blogs(5)
+
+        token = activate()
+        try:
+            with self.assertNumQueries(2):
+                for blog in blogs:
+                    self.assertEqual(blog.author_name, "Request Author")
+                    self.assertIsNone(blog.author_avatar)
+        finally:
+            deactivate(token)
+
+    def test_no_memoization_outside_request(self):
+        """Without an active request every read goes to the database."""
+        blog = self.create_blogs(1)[0]
+
+        with self.assertNumQueries(2):
+            blog.author_name
+            blog.author_name
+
+    def test_save_during_request_is_visible(self):
+        """Writing a config row drops it from the current request's map."""
+        from portfolio.models import SiteConfiguration
+        from portfolio.request_cache import activate, deactivate
+
+        config = SiteConfiguration.objects.create(hero_name="Before")
+        blog = self.create_blogs(1)[0]
+
+        token = activate()
+        try:
+            self.assertEqual(blog.author_name, "Before")
+            config.hero_name = "After"
+            config.save()
+            self.assertEqual(blog.author_name, "After")
+        finally:
+            deactivate(token)
+
+    def test_blog_list_queries_do_not_grow_with_blogs(self):
+        """The middleware keeps author lookups constant on the list page."""
+        self.create_blogs(1)
+        # Warm the per-process singleton caches used by the base template
+        self.client.get(reverse("blog:blog_list"))
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse("blog:blog_list"))
+
+        self.create_blogs(5)
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(reverse("blog:blog_list"))
+
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+
 # ===== PERFORMANCE TESTS =====
 
 
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import BlogListView, BlogDetailView, toggle_comment_like
+from .views import BlogListView, BlogDetailView, blog_comments, toggle_comment_like
 
 app_name = 'blog'
 
@@ -9,5 +9,6 @@ urlpatterns = [
     path('<slug:slug>/', BlogDetailView.as_view(), name='blog_detail'),
     
     # AJAX endpoints
+    path('<slug:slug>/comments/', blog_comments, name='blog_comments'),
     path('comment/<int:comment_id>/like/', toggle_comment_like, name='toggle_comment_like'),
 ]
\ No newline at end of file
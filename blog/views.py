@@ -4,12 +4,24 @@ from django.contrib import messages
 from django.shortcuts import get_object_or_404
 from django.views.generic import ListView, DetailView
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
+from django.db.models import F
+from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_POST
 
 from .models import Blog, Comment, CommentLike
+from portfolio.cache import cache_page_for_models
+from portfolio.comments import InvalidCursor, comment_page, comment_page_response
 from portfolio.models import Category
+from roshan.visitors import record_visit
 
 
+@method_decorator(
+    cache_page_for_models(
+        Blog, Category, "portfolio.Technology", "roshan.AboutMeConfiguration"
+    ),
+    name="dispatch",
+)
 class BlogListView(ListView):
     """View for the main blog list page with filtering and pagination."""
 
@@ -54,16 +66,16 @@ class BlogDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         post = self.get_object()
-        context["comments"] = post.comments.filter(is_approved=True)
-
-        # Add user's liked comments for proper state management
-        if self.request.user.is_authenticated:
-            user_liked_comments = CommentLike.objects.filter(
-                user=self.request.user, comment__in=context["comments"]
-            ).values_list("comment_id", flat=True)
-            context["user_liked_comments"] = list(user_liked_comments)
-        else:
-            context["user_liked_comments"] = []
+        approved_comments = post.comments.filter(is_approved=True)
+
+        # Only the first page is rendered; the rest load through blog_comments
+        page = comment_page(
+            approved_comments, CommentLike, self.request.user, newest_first=False
+        )
+        context["comments"] = page["comments"]
+        context["user_liked_comments"] = page["liked_ids"]
+        context["next_comment_cursor"] = page["next_cursor"]
+        context["total_comments"] = approved_comments.count()
 
         post_categories = post.categories.all()
         context["suggested_posts"] = (
@@ -74,6 +86,11 @@ class BlogDetailView(DetailView):
         )
         return context
 
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        record_visit(self.object, request)
+        return response
+
     def post(self, request, *args, **kwargs):
         # Check if user is authenticated
         if not request.user.is_authenticated:
@@ -105,6 +122,23 @@ class BlogDetailView(DetailView):
         return response
 
 
+def blog_comments(request, slug):
+    """AJAX view returning the next page of approved comments for a post."""
+    post = get_object_or_404(Blog, slug=slug)
+    try:
+        page = comment_page(
+            post.comments.filter(is_approved=True),
+            CommentLike,
+            request.user,
+            cursor=request.GET.get("cursor"),
+            newest_first=False,
+        )
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor"}, status=400)
+
+    return JsonResponse(comment_page_response(page))
+
+
 @login_required
 @require_POST
 def toggle_comment_like(request, comment_id):
@@ -118,20 +152,30 @@ def toggle_comment_like(request, comment_id):
 
     try:
         comment = get_object_or_404(Comment, id=comment_id)
-        like, created = CommentLike.objects.get_or_create(
-            comment=comment, user=request.user
-        )
-
-        if not created:
-            # Unlike - delete the like
-            like.delete()
-            liked = False
-        else:
-            # Like - like object was created
-            liked = True
+        with transaction.atomic():
+            like, created = CommentLike.objects.get_or_create(
+                comment=comment, user=request.user
+            )
 
+            if not created:
+                # Unlike - delete the like; only the request that actually
+                # removed the row decrements the counter
+                deleted, _ = like.delete()
+                if deleted:
+                    Comment.objects.filter(pk=comment.pk, likes_count__gt=0).update(
+                        likes_count=F("likes_count") - 1
+                    )
+                liked = False
+            else:
+                # Like - like object was created
+                Comment.objects.filter(pk=comment.pk).update(
+                    likes_count=F("likes_count") + 1
+                )
+                liked = True
+
+        comment.refresh_from_db(fields=["likes_count"])
         return JsonResponse(
-            {"success": True, "liked": liked, "total_likes": comment.total_likes}
+            {"success": True, "liked": liked, "total_likes": comment.likes_count}
         )
 
     except Comment.DoesNotExist:
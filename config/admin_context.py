@@ -1,25 +1,48 @@
-from django.contrib.admin.views.decorators import staff_member_required
-from django.shortcuts import render
+import logging
+
+from portfolio.lazy_context import lazy_context_value
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_count(model):
+    """Count rows without breaking the admin page if the query fails"""
+    def count():
+        try:
+            return model.objects.count()
+        except Exception as e:
+            logger.error(f"Admin context processor error: {e}")
+            return None
+
+    return count
 
 
 def admin_dashboard_context(request):
-    """Provide statistics for the admin dashboard"""
+    """Provide statistics for the admin dashboard (evaluated only when read)"""
     try:
         if request.path.startswith("/admin/") and request.user.is_authenticated and request.user.is_staff:
             # Import models only when needed to avoid circular imports
             from portfolio.models import Project, ContactSubmission
+            from portfolio.cache import singleton_cache_stats
+            from roshan.view_recorder import recorder
             from blog.models import Blog, Comment
-            
+
             return {
-                "total_projects": Project.objects.count(),
-                "total_blogs": Blog.objects.count(),
-                "total_comments": Comment.objects.count(),
-                "total_contacts": ContactSubmission.objects.count(),
+                "total_projects": lazy_context_value("total_projects", _safe_count(Project)),
+                "total_blogs": lazy_context_value("total_blogs", _safe_count(Blog)),
+                "total_comments": lazy_context_value("total_comments", _safe_count(Comment)),
+                "total_contacts": lazy_context_value(
+                    "total_contacts", _safe_count(ContactSubmission)
+                ),
+                "singleton_cache_stats": lazy_context_value(
+                    "singleton_cache_stats", singleton_cache_stats
+                ),
+                "resource_view_stats": lazy_context_value(
+                    "resource_view_stats", recorder.stats
+                ),
             }
     except Exception as e:
         # Log the error but don't break the request
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Admin context processor error: {e}")
-    
+
     return {}
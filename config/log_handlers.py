@@ -0,0 +1,83 @@
+"""
+Logging handlers used by LOGGING in settings.
+
+Writing a record to a file or the console can block on disk or on a slow
+pipe, and it used to happen in the request thread. QueueListenerHandler
+only puts the record on an in-memory queue; a background QueueListener
+thread passes it on to the real handlers (log file, console).
+
+KeyValueFormatter appends the extra fields a record was logged with
+(``logger.info(..., extra={"submission_id": 3, "duration_ms": 12.5})``) as
+``key=value`` pairs, so structured fields survive in a plain-text log.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_STANDARD_ATTRS = set(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    QueueHandler that owns the QueueListener feeding `handlers`.
+
+    In dictConfig, build it with the ``"()"`` factory key rather than
+    ``"class"``: from Python 3.12 dictConfig takes over the ``handlers`` key
+    of any QueueHandler subclass named by ``"class"`` and fails on the
+    cfg:// references. List the targets as ``cfg://handlers.<name>``.
+    Handlers are configured in name order, so this handler's name has to
+    sort after its targets' (e.g. "queue" after "console" and "file").
+    """
+
+    def __init__(self, handlers, respect_handler_level=True):
+        super().__init__(queue.SimpleQueue())
+        # Indexing a dictConfig ConvertingList resolves the cfg:// references
+        self.targets = [handlers[i] for i in range(len(handlers))]
+        if not all(isinstance(h, logging.Handler) for h in self.targets):
+            raise ValueError(
+                "QueueListenerHandler targets are not configured yet; "
+                "name it so it sorts after the handlers it feeds"
+            )
+        self.respect_handler_level = respect_handler_level
+        self._start()
+        atexit.register(self.stop)
+        # A forked worker inherits the queue but not the listener thread
+        os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def _start(self):
+        self.listener = QueueListener(
+            self.queue,
+            *self.targets,
+            respect_handler_level=self.respect_handler_level,
+        )
+        self.listener.start()
+
+    def _restart_in_child(self):
+        self.queue = queue.SimpleQueue()
+        self._start()
+
+    def stop(self):
+        """Flush queued records to the targets and stop the listener thread."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Formatter that appends a record's `extra` fields as key=value pairs."""
+
+    def format(self, record):
+        message = super().format(record)
+        extras = [
+            f"{key}={value}"
+            for key, value in record.__dict__.items()
+            if key not in _STANDARD_ATTRS and not key.startswith("_")
+        ]
+        if extras:
+            message = f"{message} | {' '.join(extras)}"
+        return message
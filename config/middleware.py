@@ -0,0 +1,39 @@
+"""
+Middleware used by MIDDLEWARE in settings.
+
+Under ASGI, Django can only run a request through the async code path if
+every middleware in the stack is async-capable. A single sync-only
+middleware makes Django adapt the rest of the chain around it, and async
+views then run one at a time on the shared sync thread. WhiteNoise's
+middleware is sync-only, so AsyncWhiteNoiseMiddleware adds an async path.
+The file lookup is an in-memory dict read, so nothing blocks the loop.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoiseMiddleware that also works in an async middleware chain."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
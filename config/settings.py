@@ -57,17 +57,21 @@ INSTALLED_APPS = [
     "authentication",
     "roshan",
     "notifications",
+    "scheduler",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # WhiteNoise with an async code path, so async views run concurrently
+    # under ASGI (see config.middleware)
+    "config.middleware.AsyncWhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "portfolio.request_cache.RequestCacheMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -120,6 +124,104 @@ else:
     }
 
 
+# Cache Configuration
+# Shared between gunicorn workers so cache invalidation (e.g. the singleton
+# version keys in portfolio.cache) is seen by every process.
+REDIS_URL = os.getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": BASE_DIR / "cache",
+        }
+    }
+
+# Seconds a rendered page is kept by portfolio.cache.cache_page_for_models.
+# Edits invalidate dependent pages immediately; this only bounds staleness
+# for data the page does not declare (e.g. time-based content).
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", "600"))
+
+# Rows read per query by the streaming admin exports (portfolio.exports)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Resource detail hits are buffered per process and written in batches
+# (see roshan.view_recorder)
+RESOURCE_VIEW_BATCH_SIZE = int(os.getenv("RESOURCE_VIEW_BATCH_SIZE", "50"))
+RESOURCE_VIEW_FLUSH_INTERVAL = int(os.getenv("RESOURCE_VIEW_FLUSH_INTERVAL", "30"))
+RESOURCE_VIEW_MAX_BUFFER = 5000
+# Raw hits are rolled up daily (manage.py rollup_resource_views) and
+# deleted after this many days
+RESOURCE_VIEW_RETENTION_DAYS = int(os.getenv("RESOURCE_VIEW_RETENTION_DAYS", "90"))
+RESOURCE_VIEW_DELETE_CHUNK = 1000
+# Unique-visitor sketches (roshan.visitors) are merged into the database
+# after this many hits or seconds, whichever comes first
+VISITOR_SKETCH_BATCH_SIZE = 200
+VISITOR_SKETCH_FLUSH_INTERVAL = 60
+
+# Contact notification emails are queued in notifications.EmailOutbox and
+# sent by `manage.py send_notifications`; failures back off exponentially
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = 6
+NOTIFICATION_OUTBOX_RETRY_BASE = 60
+NOTIFICATION_OUTBOX_RETRY_MAX = 3600
+NOTIFICATION_OUTBOX_LEASE = 300
+# Periodic jobs (manage.py run_scheduler, jobs registered in each app's
+# jobs.py). Runs hold a database lock for at most SCHEDULER_LOCK_TIMEOUT
+# seconds and start up to SCHEDULER_DEFAULT_JITTER seconds after their slot.
+SCHEDULER_LOCK_TIMEOUT = 3600
+SCHEDULER_DEFAULT_JITTER = 30
+SCHEDULER_DELETE_CHUNK = 1000
+SCHEDULER_RUN_RETENTION_DAYS = 30
+# Retention of the rows the scheduled prune jobs delete
+AI_QUERY_RETENTION_DAYS = int(os.getenv("AI_QUERY_RETENTION_DAYS", "180"))
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+# The Gemini model is resolved once per process (ai.llm_utills); the model
+# list is refreshed in the background after GEMINI_MODEL_TTL seconds and a
+# model failing with a model-level error is skipped for GEMINI_MODEL_COOLDOWN
+GEMINI_MODEL_TTL = 3600
+GEMINI_MODEL_COOLDOWN = 300
+# Seconds the async AI view waits for Gemini before giving up
+GEMINI_TIMEOUT = 30
+# Serve /ai/submit-query/ and /ai/stream-query/ with the async views (the
+# former also mounted at /ai/submit-query-async/). Only useful under an ASGI
+# server (config.asgi, e.g. gunicorn -k uvicorn.workers.UvicornWorker); under
+# WSGI an async view still occupies the worker until it returns.
+AI_ASYNC_VIEWS = os.getenv("AI_ASYNC_VIEWS", "False").lower() == "true"
+# Answers to repeated questions are cached per process (ai.answer_cache) for
+# the same portfolio context. Set AI_ANSWER_CACHE_SIMILARITY (e.g. 0.85) to
+# also reuse answers to near-duplicate questions (TF-IDF cosine similarity).
+AI_ANSWER_CACHE_SIZE = 256
+AI_ANSWER_CACHE_TTL = 86400
+AI_ANSWER_CACHE_SIMILARITY = None
+# Password reset emails are queued (authentication.reset_emails) and sent by
+# the same worker; repeat requests for an address within the window are
+# dropped
+PASSWORD_RESET_DEDUPE_WINDOW = 300
+PASSWORD_RESET_MAX_ATTEMPTS = 3
+# Outgoing mail reuses one connection per process; close it after this many
+# idle seconds (see notifications.services.ManagedEmailConnection)
+EMAIL_CONNECTION_IDLE_TIMEOUT = 30
+# Seconds each process reuses its lookup of the active EmailTemplate per type
+EMAIL_TEMPLATE_LOOKUP_TTL = 60
+# Newsletter campaigns (manage.py send_newsletter): messages per second,
+# subscribers fetched per query, messages per SMTP session, and seconds
+# without progress before another run may resume a campaign
+NEWSLETTER_SEND_RATE = float(os.getenv("NEWSLETTER_SEND_RATE", "10"))
+NEWSLETTER_CHUNK_SIZE = 500
+NEWSLETTER_MESSAGES_PER_CONNECTION = 100
+NEWSLETTER_STALE_AFTER = 300
+
+# Record which templates read which context processor values
+# (see portfolio.lazy_context.context_access_report)
+TRACK_CONTEXT_ACCESS = DEBUG
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -262,15 +364,22 @@ if DEBUG:
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Handlers write through a queue: the request thread only enqueues records
+# and a background thread does the file/console I/O (see config.log_handlers).
+# Every gunicorn worker appends to the same file, so none of them rotates it:
+# rotate with logrotate, and WatchedFileHandler reopens the new file.
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "verbose": {
+            "()": "config.log_handlers.KeyValueFormatter",
             "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
             "style": "{",
         },
         "simple": {
+            "()": "config.log_handlers.KeyValueFormatter",
             "format": "{levelname} {message}",
             "style": "{",
         },
@@ -278,8 +387,9 @@ LOGGING = {
     "handlers": {
         "file": {
             "level": "INFO",
-            "class": "logging.FileHandler",
+            "class": "logging.handlers.WatchedFileHandler",
             "filename": LOGS_DIR / "notifications.log",
+            "encoding": "utf-8",
             "formatter": "verbose",
         },
         "console": {
@@ -287,20 +397,42 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "simple",
         },
+        "queue": {
+            "()": "config.log_handlers.QueueListenerHandler",
+            "handlers": (
+                ["cfg://handlers.file", "cfg://handlers.console"]
+                if not os.getenv("CI")
+                else ["cfg://handlers.console"]
+            ),
+        },
+        "queue_console": {
+            "()": "config.log_handlers.QueueListenerHandler",
+            "handlers": ["cfg://handlers.console"],
+        },
     },
     "loggers": {
         "notifications": {
-            "handlers": ["file", "console"] if not os.getenv('CI') else ["console"],
+            "handlers": ["queue"],
+            "level": "INFO",
+            "propagate": True,
+        },
+        "authentication": {
+            "handlers": ["queue"],
+            "level": "INFO",
+            "propagate": True,
+        },
+        "scheduler": {
+            "handlers": ["queue"],
             "level": "INFO",
             "propagate": True,
         },
         "django": {
-            "handlers": ["console"],
+            "handlers": ["queue_console"],
             "level": "INFO" if DEBUG else "WARNING",
             "propagate": False,
         },
         "django.contrib.admin": {
-            "handlers": ["console"],
+            "handlers": ["queue_console"],
             "level": "DEBUG",
             "propagate": True,
         },
@@ -1,5 +1,13 @@
 from django.contrib import admin
-from .models import ContactNotification, EmailTemplate, NotificationSettings
+from django.utils import timezone
+from .models import (
+    AdminDigest,
+    ContactNotification,
+    EmailOutbox,
+    EmailTemplate,
+    NewsletterCampaign,
+    NotificationSettings,
+)
 
 @admin.register(ContactNotification)
 class ContactNotificationAdmin(admin.ModelAdmin):
@@ -12,6 +20,7 @@ class ContactNotificationAdmin(admin.ModelAdmin):
         'status',
         'admin_email_sent',
         'thankyou_email_sent',
+        'digest',
         'created_at'
     ]
     
@@ -34,6 +43,8 @@ class ContactNotificationAdmin(admin.ModelAdmin):
         'updated_at',
         'admin_email_sent_at',
         'thankyou_email_sent_at',
+        'awaiting_digest',
+        'digest',
     ]
     
     ordering = ['-created_at']
@@ -60,6 +71,77 @@ class ContactNotificationAdmin(admin.ModelAdmin):
             return True
         return False
 
+@admin.register(AdminDigest)
+class AdminDigestAdmin(admin.ModelAdmin):
+    """Admin interface for admin digest emails"""
+    
+    list_display = [
+        'id',
+        'submission_count',
+        'created_at',
+    ]
+    
+    readonly_fields = [
+        'submission_count',
+        'created_at',
+    ]
+    
+    date_hierarchy = 'created_at'
+    
+    def has_add_permission(self, request):
+        """Digests are created by the outbox worker"""
+        return False
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    """Admin interface for queued notification emails"""
+    
+    list_display = [
+        'id',
+        'notification',
+        'digest',
+        'kind',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'sent_at',
+    ]
+    
+    list_filter = [
+        'status',
+        'kind',
+    ]
+    
+    readonly_fields = [
+        'notification',
+        'digest',
+        'kind',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'last_error',
+        'sent_at',
+        'created_at',
+    ]
+    
+    list_select_related = ['notification__contact_submission']
+    
+    actions = ['retry_now']
+    
+    def has_add_permission(self, request):
+        """Outbox rows are created with their contact submission"""
+        return False
+    
+    @admin.action(description='Retry selected emails now')
+    def retry_now(self, request, queryset):
+        """Requeue failed or waiting emails for the next worker poll"""
+        updated = queryset.exclude(status=EmailOutbox.Status.SENT).update(
+            status=EmailOutbox.Status.PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} email(s) queued for retry.")
+
 @admin.register(EmailTemplate)
 class EmailTemplateAdmin(admin.ModelAdmin):
     """Admin interface for EmailTemplate model"""
@@ -107,6 +189,95 @@ class EmailTemplateAdmin(admin.ModelAdmin):
         
         super().save_model(request, obj, form, change)
 
+@admin.register(NewsletterCampaign)
+class NewsletterCampaignAdmin(admin.ModelAdmin):
+    """Admin interface for newsletter campaigns"""
+    
+    list_display = [
+        'name',
+        'subject',
+        'status',
+        'progress_display',
+        'sent_count',
+        'failed_count',
+        'started_at',
+        'finished_at',
+    ]
+    
+    list_filter = [
+        'status',
+    ]
+    
+    search_fields = [
+        'name',
+        'subject',
+    ]
+    
+    readonly_fields = [
+        'status',
+        'total_recipients',
+        'sent_count',
+        'failed_count',
+        'last_subscriber_id',
+        'heartbeat_at',
+        'started_at',
+        'finished_at',
+        'created_at',
+        'updated_at',
+    ]
+    
+    fieldsets = [
+        ('Content', {
+            'fields': [
+                'name',
+                'subject',
+                'html_content',
+                'text_content',
+            ],
+            'description': 'Send with: python manage.py send_newsletter <campaign id>',
+        }),
+        ('Delivery', {
+            'fields': [
+                'status',
+                'total_recipients',
+                'sent_count',
+                'failed_count',
+                'last_subscriber_id',
+                'heartbeat_at',
+                'started_at',
+                'finished_at',
+            ],
+        }),
+        ('Timestamps', {
+            'fields': [
+                'created_at',
+                'updated_at',
+            ],
+            'classes': ['collapse'],
+        }),
+    ]
+    
+    actions = ['cancel_campaigns']
+    
+    def progress_display(self, obj):
+        """Share of subscribers handled"""
+        return f"{obj.progress}%"
+    progress_display.short_description = 'Progress'
+    
+    def get_readonly_fields(self, request, obj=None):
+        """Content is frozen once sending has started"""
+        if obj and obj.status != NewsletterCampaign.Status.DRAFT:
+            return self.readonly_fields + ['name', 'subject', 'html_content', 'text_content']
+        return self.readonly_fields
+    
+    @admin.action(description='Cancel selected campaigns')
+    def cancel_campaigns(self, request, queryset):
+        """Stop campaigns; a running sender stops at its next subscriber"""
+        updated = queryset.filter(
+            status__in=[NewsletterCampaign.Status.DRAFT, NewsletterCampaign.Status.SENDING]
+        ).update(status=NewsletterCampaign.Status.CANCELLED)
+        self.message_user(request, f"{updated} campaign(s) cancelled.")
+
 @admin.register(NotificationSettings)
 class NotificationSettingsAdmin(admin.ModelAdmin):
     """Admin interface for NotificationSettings model"""
@@ -123,8 +294,23 @@ class NotificationSettingsAdmin(admin.ModelAdmin):
             'fields': [
                 'admin_notification_enabled',
                 'thankyou_notification_enabled',
+                'auto_mark_as_read',
             ]
         }),
+        ('Admin Digest', {
+            'fields': [
+                'admin_digest_enabled',
+                'admin_digest_interval',
+            ],
+            'description': 'Batch admin notifications into one summary email per interval; thank-you emails are still sent individually',
+        }),
+        ('Delivery Delays', {
+            'fields': [
+                'admin_notification_delay',
+                'thankyou_notification_delay',
+            ],
+            'description': 'Seconds after a submission before each email is sent by the outbox worker',
+        }),
         ('Timestamps', {
             'fields': [
                 'created_at',
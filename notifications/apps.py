@@ -8,3 +8,9 @@ class NotificationsConfig(AppConfig):
     def ready(self):
         """Import signals when Django starts"""
         import notifications.signals
+        from portfolio.cache import singleton_cache
+        from .models import NotificationSettings
+
+        # Register now so saves from any process bump the shared version,
+        # even in processes that never read the settings
+        singleton_cache(NotificationSettings, loader=NotificationSettings._load_settings)
@@ -0,0 +1,38 @@
+"""Scheduled jobs for the notifications app (see scheduler.registry)."""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from scheduler.registry import job
+from scheduler.utils import delete_in_chunks
+
+from .models import AdminDigest, ContactNotification, EmailOutbox
+
+
+@job("45 2 * * *")
+def prune_contact_notifications():
+    """
+    Delete delivery records older than NOTIFICATION_RETENTION_DAYS once
+    nothing is left to send. The contact submissions themselves are kept.
+    """
+    days = getattr(settings, "NOTIFICATION_RETENTION_DAYS", 90)
+    cutoff = timezone.now() - timedelta(days=days)
+    finished = [
+        ContactNotification.NotificationStatus.COMPLETED,
+        ContactNotification.NotificationStatus.FAILED,
+    ]
+
+    # Outbox rows go with their notification or digest
+    notifications = delete_in_chunks(
+        ContactNotification.objects.filter(status__in=finished, updated_at__lt=cutoff)
+    )
+    digests = delete_in_chunks(
+        AdminDigest.objects.filter(created_at__lt=cutoff).exclude(
+            outbox__status=EmailOutbox.Status.PENDING
+        )
+    )
+    return (
+        f"Deleted {notifications} notification and {digests} digest rows "
+        f"older than {days} days"
+    )
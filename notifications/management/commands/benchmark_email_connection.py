@@ -0,0 +1,91 @@
+"""
+Django management command to compare a new SMTP connection per message
+against the shared ManagedEmailConnection, using a local SMTP sink
+"""
+import time
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.management.base import BaseCommand
+
+from notifications.services import EmailNotificationService, ManagedEmailConnection
+from notifications.smtp_sink import SMTPSink
+
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-message SMTP connections against connection reuse'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--messages',
+            type=int,
+            default=100,
+            help='Messages sent in each run (default: 100)',
+        )
+        parser.add_argument(
+            '--connect-ms',
+            type=float,
+            default=50.0,
+            help='Delay the sink adds to every new connection, standing in for '
+                 'the SSL handshake and login of a real server (default: 50)',
+        )
+
+    def build_messages(self, count):
+        messages = []
+        for i in range(count):
+            message = EmailMultiAlternatives(
+                subject=f'Benchmark message {i}',
+                body='Plain text body',
+                from_email='noreply@example.com',
+                to=[f'reader{i}@example.com'],
+            )
+            message.attach_alternative('<p>HTML body</p>', 'text/html')
+            messages.append(message)
+        return messages
+
+    def handle(self, *args, **options):
+        count = options['messages']
+        delay = options['connect_ms'] / 1000
+
+        self.stdout.write(
+            f"📨 Sending {count} messages to a local SMTP sink "
+            f"({options['connect_ms']:.0f} ms per new connection)\n"
+        )
+
+        with SMTPSink(connect_delay=delay) as sink:
+            start = time.perf_counter()
+            for message in self.build_messages(count):
+                # What EmailMessage.send() did before: open, send, close
+                message.connection = get_connection(
+                    SMTP_BACKEND, fail_silently=False, **sink.backend_kwargs()
+                )
+                message.send()
+            per_message = time.perf_counter() - start
+            per_message_connections = sink.connections
+
+            connection = ManagedEmailConnection(
+                backend=SMTP_BACKEND, **sink.backend_kwargs()
+            )
+            service = EmailNotificationService(connection=connection)
+            start = time.perf_counter()
+            sent, failures = service.send_many(self.build_messages(count))
+            reused = time.perf_counter() - start
+            connection.close()
+            reused_connections = sink.connections - per_message_connections
+
+        self.stdout.write(
+            f"  🔁 Connection per message: {per_message:.3f}s "
+            f"({per_message / count * 1000:.1f} ms/message, "
+            f"{per_message_connections} connections)"
+        )
+        self.stdout.write(
+            f"  ♻️  Managed connection:     {reused:.3f}s "
+            f"({reused / count * 1000:.1f} ms/message, "
+            f"{reused_connections} connection)"
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(f"  ⚠️  {len(failures)} sends failed"))
+        self.stdout.write(
+            self.style.SUCCESS(f"\n✨ {per_message / reused:.1f}x faster with reuse")
+        )
@@ -0,0 +1,57 @@
+"""
+Django management command to send a newsletter campaign to all subscribers
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.models import NewsletterCampaign
+from notifications.newsletter import CampaignStopped, send_campaign
+
+
+class Command(BaseCommand):
+    help = 'Send (or resume) a newsletter campaign to every newsletter subscriber'
+
+    def add_arguments(self, parser):
+        parser.add_argument('campaign_id', type=int, help='NewsletterCampaign id')
+        parser.add_argument(
+            '--rate',
+            type=float,
+            help='Messages per second (default: NEWSLETTER_SEND_RATE, 0 = unthrottled)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Subscribers fetched per query (default: NEWSLETTER_CHUNK_SIZE)',
+        )
+
+    def handle(self, *args, **options):
+        campaign_id = options['campaign_id']
+        try:
+            campaign = NewsletterCampaign.objects.get(pk=campaign_id)
+        except NewsletterCampaign.DoesNotExist:
+            raise CommandError(f"Newsletter campaign {campaign_id} does not exist")
+
+        if campaign.last_subscriber_id:
+            self.stdout.write(
+                f"🔄 Resuming '{campaign.name}' after subscriber {campaign.last_subscriber_id}"
+            )
+        else:
+            self.stdout.write(f"📰 Sending '{campaign.name}'")
+
+        try:
+            result = send_campaign(
+                campaign_id, rate=options['rate'], chunk_size=options['chunk_size']
+            )
+        except CampaignStopped as e:
+            self.stdout.write(self.style.WARNING(f"  ⏹️  {e}"))
+            return
+
+        if result is None:
+            raise CommandError(
+                f"Campaign '{campaign.name}' is {campaign.get_status_display().lower()} "
+                f"or being sent by another process"
+            )
+
+        self.stdout.write(f"  ✅ Sent: {result['sent']}")
+        if result['failed']:
+            self.stdout.write(self.style.WARNING(f"  ⚠️  Refused: {result['failed']}"))
+        self.stdout.write(self.style.SUCCESS('\n✨ Campaign sent'))
@@ -0,0 +1,78 @@
+"""
+Django management command to deliver queued contact notification and
+password reset emails
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from authentication.reset_emails import process_password_resets
+from notifications.outbox import process_outbox
+from notifications.services import default_connection
+
+
+class Command(BaseCommand):
+    help = (
+        'Send due emails from the notification outbox and the password reset '
+        'queue, retrying failures with backoff'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the due emails once and exit instead of polling',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep between polls when the outbox is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='Maximum emails claimed per poll (default: 50)',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            result = self._process(options['batch_size'])
+            default_connection.close()
+            self._report(result)
+            return
+
+        self.stdout.write(
+            f"📬 Watching the notification outbox every {options['interval']}s (Ctrl+C to stop)"
+        )
+        try:
+            while True:
+                result = self._process(options['batch_size'])
+                if result['sent'] or result['failed']:
+                    self._report(result)
+                # A full batch means more may be due already
+                if not result['full']:
+                    default_connection.close_if_idle()
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('\n👋 Stopped')
+        finally:
+            default_connection.close()
+
+    def _process(self, batch_size):
+        outbox = process_outbox(limit=batch_size)
+        resets = process_password_resets(limit=batch_size)
+        return {
+            'sent': outbox['sent'] + resets['sent'],
+            'failed': outbox['failed'] + resets['failed'],
+            'full': (
+                outbox['sent'] + outbox['failed'] >= batch_size
+                or sum(resets.values()) >= batch_size
+            ),
+        }
+
+    def _report(self, result):
+        self.stdout.write(f"  ✅ Sent: {result['sent']}")
+        if result['failed']:
+            self.stdout.write(self.style.WARNING(f"  ⚠️  Failed: {result['failed']}"))
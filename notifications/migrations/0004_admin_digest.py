@@ -0,0 +1,68 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_newsletter_campaign'),
+        ('portfolio', '0025_projectcomment_page_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('submission_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Admin Digest',
+                'verbose_name_plural': 'Admin Digests',
+                'ordering': ['-created_at'],
+                'get_latest_by': 'created_at',
+            },
+        ),
+        migrations.AddField(
+            model_name='contactnotification',
+            name='awaiting_digest',
+            field=models.BooleanField(default=False, help_text='Admin email will be sent as part of the next digest'),
+        ),
+        migrations.AddField(
+            model_name='notificationsettings',
+            name='admin_digest_enabled',
+            field=models.BooleanField(default=False, help_text='Send one summary email per interval instead of one admin email per submission'),
+        ),
+        migrations.AddField(
+            model_name='notificationsettings',
+            name='admin_digest_interval',
+            field=models.PositiveIntegerField(default=60, help_text='Minutes between admin digest emails'),
+        ),
+        migrations.AlterField(
+            model_name='emailoutbox',
+            name='kind',
+            field=models.CharField(choices=[('admin_notification', 'Admin Notification'), ('user_thankyou', 'User Thank You'), ('admin_digest', 'Admin Digest')], max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='emailoutbox',
+            name='notification',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='outbox', to='notifications.contactnotification'),
+        ),
+        migrations.AddField(
+            model_name='contactnotification',
+            name='digest',
+            field=models.ForeignKey(blank=True, help_text='Digest email that covered this submission', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notifications', to='notifications.admindigest'),
+        ),
+        migrations.AddField(
+            model_name='emailoutbox',
+            name='digest',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='outbox', to='notifications.admindigest'),
+        ),
+        migrations.AddIndex(
+            model_name='contactnotification',
+            index=models.Index(condition=models.Q(('awaiting_digest', True)), fields=['awaiting_digest'], name='notification_awaiting_idx'),
+        ),
+    ]
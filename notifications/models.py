@@ -32,6 +32,20 @@ class ContactNotification(models.Model):
     admin_email_sent_at = models.DateTimeField(null=True, blank=True)
     admin_email_error = models.TextField(null=True, blank=True)
     
+    # Admin digest tracking (NotificationSettings.admin_digest_enabled)
+    awaiting_digest = models.BooleanField(
+        default=False,
+        help_text="Admin email will be sent as part of the next digest"
+    )
+    digest = models.ForeignKey(
+        'AdminDigest',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='notifications',
+        help_text="Digest email that covered this submission"
+    )
+    
     # User thank you tracking
     thankyou_email_sent = models.BooleanField(default=False)
     thankyou_email_sent_at = models.DateTimeField(null=True, blank=True)
@@ -45,6 +59,14 @@ class ContactNotification(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Contact Notification'
         verbose_name_plural = 'Contact Notifications'
+        indexes = [
+            # The outbox worker polls for these; keep the index to the few
+            models.Index(
+                fields=['awaiting_digest'],
+                condition=models.Q(awaiting_digest=True),
+                name='notification_awaiting_idx',
+            )
+        ]
     
     def __str__(self):
         return f"Notification for {self.contact_submission.name} - {self.status}"
@@ -137,6 +159,16 @@ class NotificationSettings(models.Model):
         help_text="Automatically mark contact submissions as read after successful notification"
     )
     
+    # Admin digest settings
+    admin_digest_enabled = models.BooleanField(
+        default=False,
+        help_text="Send one summary email per interval instead of one admin email per submission"
+    )
+    admin_digest_interval = models.PositiveIntegerField(
+        default=60,
+        help_text="Minutes between admin digest emails"
+    )
+    
     # Email settings
     from_email = models.EmailField(
         default='noreply@roshandamor.me',
@@ -173,6 +205,8 @@ class NotificationSettings(models.Model):
             existing.admin_notification_enabled = self.admin_notification_enabled
             existing.thankyou_notification_enabled = self.thankyou_notification_enabled
             existing.auto_mark_as_read = self.auto_mark_as_read
+            existing.admin_digest_enabled = self.admin_digest_enabled
+            existing.admin_digest_interval = self.admin_digest_interval
             existing.from_email = self.from_email
             existing.reply_to_email = self.reply_to_email
             existing.admin_notification_delay = self.admin_notification_delay
@@ -183,7 +217,19 @@ class NotificationSettings(models.Model):
     
     @classmethod
     def get_settings(cls):
-        """Get the notification settings instance"""
+        """
+        Get the notification settings instance.
+
+        Served from a per-process copy that every save or delete invalidates
+        in all workers (see portfolio.cache.SingletonCache). Treat it as
+        read-only unless you save it.
+        """
+        from portfolio.cache import singleton_cache
+
+        return singleton_cache(cls, loader=cls._load_settings).get()
+
+    @classmethod
+    def _load_settings(cls):
         settings, created = cls.objects.get_or_create(
             id=1,
             defaults={
@@ -196,3 +242,146 @@ class NotificationSettings(models.Model):
     
     def __str__(self):
         return "Notification Settings"
+
+
+class AdminDigest(models.Model):
+    """
+    One summary email to the admin covering several contact submissions
+    """
+    submission_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        get_latest_by = 'created_at'
+        verbose_name = 'Admin Digest'
+        verbose_name_plural = 'Admin Digests'
+    
+    def __str__(self):
+        return f"Digest of {self.submission_count} submissions ({self.created_at:%Y-%m-%d %H:%M})"
+
+
+class EmailOutbox(models.Model):
+    """
+    One email waiting to be delivered for a contact notification, or for
+    an admin digest covering several of them.
+
+    Rows are written in the same transaction as the contact submission (or
+    digest) and delivered afterwards by ``manage.py send_notifications``.
+    """
+    class Kind(models.TextChoices):
+        ADMIN_NOTIFICATION = 'admin_notification', 'Admin Notification'
+        USER_THANKYOU = 'user_thankyou', 'User Thank You'
+        ADMIN_DIGEST = 'admin_digest', 'Admin Digest'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        SENT = 'sent', 'Sent'
+        FAILED = 'failed', 'Failed'
+
+    notification = models.ForeignKey(
+        ContactNotification,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='outbox'
+    )
+    digest = models.ForeignKey(
+        AdminDigest,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='outbox'
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['next_attempt_at', 'id']
+        verbose_name = 'Outbox Email'
+        verbose_name_plural = 'Email Outbox'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['notification', 'kind'],
+                name='unique_outbox_email_per_kind',
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['status', 'next_attempt_at'],
+                name='outbox_due_idx',
+            )
+        ]
+
+    def __str__(self):
+        if self.digest_id:
+            return f"{self.get_kind_display()} {self.digest_id} - {self.status}"
+        return f"{self.get_kind_display()} for notification {self.notification_id} - {self.status}"
+
+
+class NewsletterCampaign(models.Model):
+    """
+    A newsletter sent to every NewsletterSubscriber by
+    ``manage.py send_newsletter``. Progress is checkpointed per subscriber,
+    so an interrupted run resumes where it stopped.
+    """
+    class Status(models.TextChoices):
+        DRAFT = 'draft', 'Draft'
+        SENDING = 'sending', 'Sending'
+        SENT = 'sent', 'Sent'
+        CANCELLED = 'cancelled', 'Cancelled'
+
+    name = models.CharField(max_length=100, help_text="Internal name")
+    subject = models.CharField(max_length=200)
+    html_content = models.TextField(
+        help_text="HTML email content. Available: {{ site_name }}, {{ site_url }}."
+    )
+    text_content = models.TextField(
+        help_text="Plain text email content. Available: {{ site_name }}, {{ site_url }}."
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.DRAFT
+    )
+
+    # Progress (written by the sender, one row update per subscriber)
+    last_subscriber_id = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Subscribers up to this id have been handled"
+    )
+    total_recipients = models.PositiveIntegerField(default=0, editable=False)
+    sent_count = models.PositiveIntegerField(default=0, editable=False)
+    failed_count = models.PositiveIntegerField(default=0, editable=False)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, editable=False)
+    started_at = models.DateTimeField(null=True, blank=True, editable=False)
+    finished_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Newsletter Campaign'
+        verbose_name_plural = 'Newsletter Campaigns'
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+    @property
+    def progress(self):
+        """Share of recipients handled so far, as a percentage"""
+        if not self.total_recipients:
+            return 0
+        handled = self.sent_count + self.failed_count
+        return min(100, round(handled * 100 / self.total_recipients))
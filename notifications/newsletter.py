@@ -0,0 +1,217 @@
+"""
+Batched delivery of NewsletterCampaign emails to NewsletterSubscriber rows.
+
+A campaign is rendered once, then one copy per subscriber is sent over a
+shared SMTP connection (recycled every NEWSLETTER_MESSAGES_PER_CONNECTION
+messages, since providers cap messages per session) at no more than
+NEWSLETTER_SEND_RATE messages per second. Subscribers are streamed in id
+order with iterator(), so memory does not grow with the list.
+
+Before each send the campaign row is moved to that subscriber with a
+conditional UPDATE. A crashed run therefore resumes after the last
+subscriber it reached and never mails anyone twice (at worst the one
+subscriber in flight at the crash is skipped), and a second sender
+working on the same campaign stops at its first checkpoint.
+"""
+
+import logging
+import smtplib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import NewsletterCampaign, NotificationSettings
+from .services import CompiledEmailTemplate, ManagedEmailConnection
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by one recipient; anything else stops the run so the
+# remaining subscribers are not written off against a broken connection
+RECIPIENT_ERRORS = (smtplib.SMTPRecipientsRefused, ValueError)
+
+
+class CampaignStopped(Exception):
+    """The campaign was cancelled or taken over by another sender."""
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def claim_campaign(campaign_id):
+    """
+    Mark the campaign as sending by this process; False if it is finished,
+    cancelled or another sender is still working on it.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=_setting("NEWSLETTER_STALE_AFTER", 300))
+    return bool(
+        NewsletterCampaign.objects.filter(pk=campaign_id)
+        .filter(
+            Q(status=NewsletterCampaign.Status.DRAFT)
+            | Q(status=NewsletterCampaign.Status.SENDING, heartbeat_at__isnull=True)
+            | Q(status=NewsletterCampaign.Status.SENDING, heartbeat_at__lt=stale)
+        )
+        .update(
+            status=NewsletterCampaign.Status.SENDING,
+            heartbeat_at=now,
+            started_at=Coalesce("started_at", now),
+        )
+    )
+
+
+class NewsletterSender:
+    """Send one claimed campaign to every subscriber it has not reached yet."""
+
+    def __init__(self, campaign, rate=None, chunk_size=None, connection=None):
+        self.campaign = campaign
+        self.rate = rate if rate is not None else _setting("NEWSLETTER_SEND_RATE", 10)
+        self.chunk_size = chunk_size or _setting("NEWSLETTER_CHUNK_SIZE", 500)
+        self.messages_per_connection = _setting(
+            "NEWSLETTER_MESSAGES_PER_CONNECTION", 100
+        )
+        self.connection = connection or ManagedEmailConnection()
+        self.last_id = campaign.last_subscriber_id
+        self.sent = campaign.sent_count
+        self.failed = campaign.failed_count
+
+    def render(self):
+        """Render the campaign once; returns (subject, text, html)."""
+        template = CompiledEmailTemplate(
+            self.campaign.name,
+            self.campaign.subject,
+            self.campaign.text_content,
+            self.campaign.html_content,
+        )
+        return template.render(
+            {
+                "campaign": self.campaign,
+                "site_name": getattr(settings, "SITE_NAME", "Roshan Damor Portfolio"),
+                "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
+            }
+        )
+
+    def subscribers(self):
+        from portfolio.models import NewsletterSubscriber
+
+        return (
+            NewsletterSubscriber.objects.filter(pk__gt=self.last_id)
+            .order_by("pk")
+            .values_list("pk", "email")
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+    def checkpoint(self, subscriber_id):
+        """Advance the campaign to `subscriber_id` unless someone else has."""
+        moved = NewsletterCampaign.objects.filter(
+            pk=self.campaign.pk,
+            status=NewsletterCampaign.Status.SENDING,
+            last_subscriber_id=self.last_id,
+        ).update(
+            last_subscriber_id=subscriber_id,
+            sent_count=self.sent,
+            failed_count=self.failed,
+            heartbeat_at=timezone.now(),
+        )
+        if not moved:
+            raise CampaignStopped(
+                f"Campaign {self.campaign.pk} was cancelled or resumed elsewhere"
+            )
+        self.last_id = subscriber_id
+
+    def release(self, previous_id):
+        """Hand the subscriber in flight back and let the next run resume."""
+        NewsletterCampaign.objects.filter(
+            pk=self.campaign.pk, last_subscriber_id=self.last_id
+        ).update(
+            last_subscriber_id=previous_id,
+            sent_count=self.sent,
+            failed_count=self.failed,
+            heartbeat_at=None,
+        )
+
+    def run(self):
+        """Send the campaign; returns the sent/failed totals."""
+        from portfolio.models import NewsletterSubscriber
+
+        if not self.campaign.total_recipients:
+            self.campaign.total_recipients = NewsletterSubscriber.objects.count()
+            NewsletterCampaign.objects.filter(pk=self.campaign.pk).update(
+                total_recipients=self.campaign.total_recipients
+            )
+
+        notification_settings = NotificationSettings.get_settings()
+        subject, text, html = self.render()
+        interval = 1 / self.rate if self.rate else 0
+        next_send = time.monotonic()
+        on_connection = 0
+
+        try:
+            for subscriber_id, email in self.subscribers():
+                wait = next_send - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                next_send = max(next_send, time.monotonic()) + interval
+
+                if on_connection >= self.messages_per_connection:
+                    self.connection.close()
+                    on_connection = 0
+
+                previous_id = self.last_id
+                self.checkpoint(subscriber_id)
+                message = EmailMultiAlternatives(
+                    subject=subject,
+                    body=text,
+                    from_email=notification_settings.from_email,
+                    to=[email],
+                    reply_to=[notification_settings.reply_to_email],
+                    alternatives=[(html, "text/html")],
+                )
+                on_connection += 1
+                try:
+                    self.connection.send(message)
+                except RECIPIENT_ERRORS as e:
+                    logger.warning(f"Newsletter to {email} refused: {e}")
+                    self.failed += 1
+                    continue
+                except Exception:
+                    self.release(previous_id)
+                    raise
+                self.sent += 1
+        finally:
+            self.connection.close()
+
+        NewsletterCampaign.objects.filter(
+            pk=self.campaign.pk,
+            status=NewsletterCampaign.Status.SENDING,
+            last_subscriber_id=self.last_id,
+        ).update(
+            status=NewsletterCampaign.Status.SENT,
+            sent_count=self.sent,
+            failed_count=self.failed,
+            finished_at=timezone.now(),
+        )
+        logger.info(
+            f"Campaign {self.campaign.pk} sent to {self.sent} subscribers, "
+            f"{self.failed} failed"
+        )
+        return {"sent": self.sent, "failed": self.failed}
+
+
+def send_campaign(campaign_id, rate=None, chunk_size=None, connection=None):
+    """
+    Claim and send a campaign. Returns the sent/failed totals, or None if
+    the campaign cannot be claimed right now.
+    """
+    if not claim_campaign(campaign_id):
+        return None
+    campaign = NewsletterCampaign.objects.get(pk=campaign_id)
+    sender = NewsletterSender(
+        campaign, rate=rate, chunk_size=chunk_size, connection=connection
+    )
+    return sender.run()
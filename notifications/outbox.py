@@ -0,0 +1,335 @@
+"""
+Transactional outbox for contact form emails.
+
+Saving a ContactSubmission writes its ContactNotification and one EmailOutbox
+row per enabled email in the same transaction, so a submission is never
+stored without its emails (or the other way round) and no SMTP work happens
+inside the request. ``manage.py send_notifications`` delivers due rows after
+commit:
+
+* each row becomes due ``admin_notification_delay`` /
+  ``thankyou_notification_delay`` seconds after the submission;
+* claiming a row leases it for NOTIFICATION_OUTBOX_LEASE seconds, so a
+  worker that dies mid-send only delays the email;
+* a failed send is retried with exponential backoff until
+  NOTIFICATION_OUTBOX_MAX_ATTEMPTS is reached, then marked failed;
+* every attempt updates the ContactNotification with a single UPDATE.
+
+With ``NotificationSettings.admin_digest_enabled`` the admin email is not
+queued per submission. Submissions wait (``awaiting_digest``) until
+schedule_admin_digest() gathers them into one AdminDigest, at most once per
+``admin_digest_interval`` minutes, and queues a single summary email whose
+delivery updates every covered ContactNotification at once. Thank-you
+emails are unaffected.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, Exists, F, OuterRef, Q, Value, When
+from django.utils import timezone
+
+from .models import AdminDigest, ContactNotification, EmailOutbox, NotificationSettings
+from .services import EmailNotificationService, elapsed_ms
+
+logger = logging.getLogger(__name__)
+
+Status = ContactNotification.NotificationStatus
+
+# Per outbox kind: notification field prefix, status once only this email is
+# sent, and the kind that has to be sent as well for COMPLETED
+_KIND_FIELDS = {
+    EmailOutbox.Kind.ADMIN_NOTIFICATION: (
+        "admin_email",
+        Status.SENT_TO_ADMIN,
+        EmailOutbox.Kind.USER_THANKYOU,
+    ),
+    EmailOutbox.Kind.ADMIN_DIGEST: (
+        "admin_email",
+        Status.SENT_TO_ADMIN,
+        EmailOutbox.Kind.USER_THANKYOU,
+    ),
+    EmailOutbox.Kind.USER_THANKYOU: (
+        "thankyou_email",
+        Status.THANKYOU_SENT,
+        EmailOutbox.Kind.ADMIN_NOTIFICATION,
+    ),
+}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue_contact_notifications(contact_submission):
+    """
+    Create the notification record and outbox rows for a new submission.
+
+    Runs in the caller's transaction when there is one.
+    """
+    notification_settings = NotificationSettings.get_settings()
+    now = timezone.now()
+
+    with transaction.atomic():
+        digest_admin = (
+            notification_settings.admin_notification_enabled
+            and notification_settings.admin_digest_enabled
+        )
+        notification = ContactNotification.objects.create(
+            contact_submission=contact_submission,
+            status=Status.PENDING,
+            awaiting_digest=digest_admin,
+        )
+        entries = []
+        if notification_settings.admin_notification_enabled and not digest_admin:
+            entries.append(
+                EmailOutbox(
+                    notification=notification,
+                    kind=EmailOutbox.Kind.ADMIN_NOTIFICATION,
+                    next_attempt_at=now
+                    + timedelta(seconds=notification_settings.admin_notification_delay),
+                )
+            )
+        if notification_settings.thankyou_notification_enabled:
+            entries.append(
+                EmailOutbox(
+                    notification=notification,
+                    kind=EmailOutbox.Kind.USER_THANKYOU,
+                    next_attempt_at=now
+                    + timedelta(
+                        seconds=notification_settings.thankyou_notification_delay
+                    ),
+                )
+            )
+        EmailOutbox.objects.bulk_create(entries)
+
+    logger.info(
+        f"Queued {len(entries)} emails for contact submission {contact_submission.pk}",
+        extra={
+            "submission_id": contact_submission.pk,
+            "notification_id": notification.pk,
+            "awaiting_digest": digest_admin,
+        },
+    )
+    return notification
+
+
+def retry_delay(attempts):
+    """Seconds to wait after the `attempts`-th failed attempt."""
+    base = _setting("NOTIFICATION_OUTBOX_RETRY_BASE", 60)
+    cap = _setting("NOTIFICATION_OUTBOX_RETRY_MAX", 3600)
+    return min(base * 2 ** max(attempts - 1, 0), cap)
+
+
+def claim_due(limit=50):
+    """
+    Lease up to `limit` due rows to this worker and return them.
+
+    Claimed rows have their attempt counted and are pushed past the lease,
+    so concurrent workers (or a second claim after a crash) skip them.
+    """
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=_setting("NOTIFICATION_OUTBOX_LEASE", 300))
+
+    with transaction.atomic():
+        due = EmailOutbox.objects.filter(
+            status=EmailOutbox.Status.PENDING, next_attempt_at__lte=now
+        ).order_by("next_attempt_at", "id")
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        ids = list(due.values_list("pk", flat=True)[:limit])
+        EmailOutbox.objects.filter(pk__in=ids).update(
+            attempts=F("attempts") + 1, next_attempt_at=lease_until
+        )
+
+    return list(
+        EmailOutbox.objects.filter(pk__in=ids)
+        .select_related("notification__contact_submission")
+        .order_by("next_attempt_at", "id")
+    )
+
+
+def schedule_admin_digest():
+    """
+    Gather submissions awaiting the admin digest into an AdminDigest and
+    queue its email, unless the last digest is younger than the interval.
+    Returns the new digest or None.
+    """
+    notification_settings = NotificationSettings.get_settings()
+    awaiting = ContactNotification.objects.filter(
+        awaiting_digest=True, digest__isnull=True
+    )
+    if not awaiting.exists():
+        return None
+
+    now = timezone.now()
+    # Turning digests off flushes whatever is still waiting right away
+    if notification_settings.admin_digest_enabled:
+        interval = timedelta(minutes=notification_settings.admin_digest_interval)
+        last = AdminDigest.objects.order_by("-created_at").first()
+        if last is not None and last.created_at > now - interval:
+            return None
+
+    with transaction.atomic():
+        digest = AdminDigest.objects.create()
+        # A concurrent worker may have taken them; then this digest is empty
+        covered = awaiting.update(digest=digest, awaiting_digest=False)
+        if not covered:
+            transaction.set_rollback(True)
+            return None
+        digest.submission_count = covered
+        digest.save(update_fields=["submission_count"])
+        EmailOutbox.objects.create(
+            digest=digest, kind=EmailOutbox.Kind.ADMIN_DIGEST, next_attempt_at=now
+        )
+
+    logger.info(
+        f"Queued admin digest {digest.pk} covering {covered} submissions",
+        extra={"digest_id": digest.pk, "submissions": covered},
+    )
+    return digest
+
+
+def _notifications_for(entry):
+    """The ContactNotification rows an outbox email reports on."""
+    if entry.kind == EmailOutbox.Kind.ADMIN_DIGEST:
+        return ContactNotification.objects.filter(digest_id=entry.digest_id)
+    return ContactNotification.objects.filter(pk=entry.notification_id)
+
+
+def _other_email_done(kind):
+    """True when the notification's other email is sent or was never queued."""
+    _, _, other_kind = _KIND_FIELDS[kind]
+    other_prefix = _KIND_FIELDS[other_kind][0]
+    queued = EmailOutbox.objects.filter(notification=OuterRef("pk"), kind=other_kind)
+    not_queued = ~Exists(queued)
+    if other_kind == EmailOutbox.Kind.ADMIN_NOTIFICATION:
+        # The admin email may be due in a digest instead of its own row
+        not_queued &= Q(awaiting_digest=False, digest__isnull=True)
+    return Q(**{f"{other_prefix}_sent": True}) | not_queued
+
+
+def _record_success(entry, notification_settings):
+    prefix, partial_status, _ = _KIND_FIELDS[entry.kind]
+    now = timezone.now()
+
+    with transaction.atomic():
+        EmailOutbox.objects.filter(pk=entry.pk).update(
+            status=EmailOutbox.Status.SENT, sent_at=now, last_error=""
+        )
+        _notifications_for(entry).update(
+            **{
+                f"{prefix}_sent": True,
+                f"{prefix}_sent_at": now,
+                f"{prefix}_error": None,
+            },
+            status=Case(
+                When(status=Status.FAILED, then=Value(Status.FAILED)),
+                When(_other_email_done(entry.kind), then=Value(Status.COMPLETED)),
+                default=Value(partial_status),
+            ),
+            updated_at=now,
+        )
+        if notification_settings.auto_mark_as_read:
+            from portfolio.models import ContactSubmission
+
+            ContactSubmission.objects.filter(
+                notification__in=_notifications_for(entry),
+                notification__status=Status.COMPLETED,
+                is_read=False,
+            ).update(is_read=True)
+
+
+def _record_failure(entry, error):
+    prefix, _, _ = _KIND_FIELDS[entry.kind]
+    now = timezone.now()
+    final = entry.attempts >= _setting("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 6)
+
+    outbox_update = {"last_error": error}
+    notification_update = {f"{prefix}_error": error, "updated_at": now}
+    if final:
+        outbox_update["status"] = EmailOutbox.Status.FAILED
+        notification_update["status"] = Status.FAILED
+    else:
+        outbox_update["next_attempt_at"] = now + timedelta(
+            seconds=retry_delay(entry.attempts)
+        )
+
+    with transaction.atomic():
+        EmailOutbox.objects.filter(pk=entry.pk).update(**outbox_update)
+        _notifications_for(entry).update(**notification_update)
+    return final
+
+
+def _log_extra(entry):
+    """Structured fields attached to every log record about `entry`."""
+    extra = {"outbox_id": entry.pk, "kind": entry.kind, "attempt": entry.attempts}
+    if entry.kind == EmailOutbox.Kind.ADMIN_DIGEST:
+        extra["digest_id"] = entry.digest_id
+    else:
+        extra["submission_id"] = entry.notification.contact_submission_id
+    return extra
+
+
+def deliver(entry, service):
+    """Send one claimed outbox row; returns True if the email went out."""
+    log_extra = _log_extra(entry)
+    started = time.perf_counter()
+    try:
+        if entry.kind == EmailOutbox.Kind.ADMIN_DIGEST:
+            submissions = [
+                notification.contact_submission
+                for notification in _notifications_for(entry)
+                .select_related("contact_submission")
+                .order_by("created_at")
+            ]
+            message = service.build_admin_digest_message(submissions)
+        elif entry.kind == EmailOutbox.Kind.ADMIN_NOTIFICATION:
+            message = service.build_admin_message(entry.notification.contact_submission)
+        else:
+            message = service.build_thankyou_message(entry.notification.contact_submission)
+        service.send(message)
+    except Exception as e:
+        log_extra["duration_ms"] = elapsed_ms(started)
+        final = _record_failure(entry, str(e))
+        if final:
+            logger.error(
+                f"Giving up on {entry.kind} email after {entry.attempts} attempts: {e}",
+                exc_info=True,
+                extra=log_extra,
+            )
+        else:
+            logger.warning(
+                f"Failed to send {entry.kind} email, will retry: {e}", extra=log_extra
+            )
+        return False
+
+    _record_success(entry, service.settings)
+    log_extra["duration_ms"] = elapsed_ms(started)
+    logger.info(f"Sent {entry.kind} email", extra=log_extra)
+    return True
+
+
+def process_outbox(limit=50):
+    """Deliver one batch of due emails; returns sent/failed counts."""
+    schedule_admin_digest()
+    entries = claim_due(limit)
+    result = {"sent": 0, "failed": 0}
+    if not entries:
+        return result
+
+    started = time.perf_counter()
+    service = EmailNotificationService()
+    for entry in entries:
+        if deliver(entry, service):
+            result["sent"] += 1
+        else:
+            result["failed"] += 1
+    logger.info(
+        f"Processed {len(entries)} outbox emails",
+        extra={**result, "duration_ms": elapsed_ms(started)},
+    )
+    return result
@@ -1,215 +1,283 @@
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
+from django.db.models.signals import post_delete, post_save
+from django.template import Context, Template, TemplateSyntaxError
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
+from django.utils.functional import cached_property
 from .models import NotificationSettings, EmailTemplate
 import logging
+import smtplib
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 
+def elapsed_ms(started):
+    """Milliseconds since a time.perf_counter() reading, for log records"""
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class ManagedEmailConnection:
+    """
+    One long-lived email backend connection shared by every send.
+
+    Opening an SMTP connection costs a TCP connect, the SSL handshake on
+    port 465 and a login, which used to be paid once per message. The
+    connection is now opened on first use and kept until it has been idle
+    for EMAIL_CONNECTION_IDLE_TIMEOUT seconds. A connection the server has
+    dropped in the meantime is reopened and the message retried once.
+    """
+
+    # Errors that mean the connection, not the message, is the problem
+    RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
+
+    def __init__(self, idle_timeout=None, backend=None, **backend_kwargs):
+        self.idle_timeout = idle_timeout or getattr(
+            settings, "EMAIL_CONNECTION_IDLE_TIMEOUT", 30
+        )
+        self.backend = backend
+        self.backend_kwargs = backend_kwargs
+        self._lock = threading.RLock()
+        self._connection = None
+        self._last_used = None
+        self.opened = 0
+
+    def _open(self):
+        if self._connection is not None and self._idle_for() >= self.idle_timeout:
+            self.close()
+        if self._connection is None:
+            connection = get_connection(
+                self.backend, fail_silently=False, **self.backend_kwargs
+            )
+            connection.open()
+            self._connection = connection
+            self.opened += 1
+        return self._connection
+
+    def _idle_for(self):
+        if self._last_used is None:
+            return 0
+        return time.monotonic() - self._last_used
+
+    def send(self, message):
+        """Send one message over the shared connection; raises on failure."""
+        with self._lock:
+            try:
+                sent = self._open().send_messages([message])
+            except self.RECONNECT_ERRORS as e:
+                logger.info(f"Email connection lost ({e}); reconnecting")
+                self.close()
+                sent = self._open().send_messages([message])
+            self._last_used = time.monotonic()
+            return sent
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.close()
+                except Exception as e:
+                    logger.warning(f"Error closing email connection: {e}")
+                self._connection = None
+                self._last_used = None
+
+    def close_if_idle(self):
+        """Release the connection once it has sat unused past the timeout."""
+        with self._lock:
+            if self._connection is not None and self._idle_for() >= self.idle_timeout:
+                self.close()
+
+
+# Shared by every EmailNotificationService in this process
+default_connection = ManagedEmailConnection()
+
+
 class EmailNotificationService:
     """
     Service class to handle email notifications for contact submissions
     """
 
-    def __init__(self):
-        self.settings = NotificationSettings.get_settings()
+    def __init__(self, connection=None):
+        self.connection = connection or default_connection
+
+    @cached_property
+    def settings(self):
+        return NotificationSettings.get_settings()
+
+    def send(self, message):
+        """Send one message over the managed connection; raises on failure"""
+        return self.connection.send(message)
+
+    def send_many(self, messages):
+        """
+        Send several messages over one connection.
+
+        Returns the number sent and a list of (message, error) pairs for
+        the messages that failed; one failure does not stop the rest.
+        """
+        sent = 0
+        failures = []
+        for message in messages:
+            try:
+                sent += self.send(message)
+            except Exception as e:
+                logger.error(f"Failed to send email to {message.to}: {e}")
+                failures.append((message, e))
+        return sent, failures
+
+    def build_admin_message(self, contact_submission):
+        """
+        Build the admin notification email for a contact submission
+        """
+        template = get_email_template(EmailTemplate.TemplateType.ADMIN_NOTIFICATION)
+
+        # Prepare template context
+        context = {
+            "contact_name": contact_submission.name,
+            "contact_email": contact_submission.email,
+            "contact_subject": contact_submission.subject or "No subject provided",
+            "contact_message": contact_submission.message,
+            "submission_date": contact_submission.submitted_date,
+            "site_name": getattr(settings, "SITE_NAME", "Portfolio Website"),
+            "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
+        }
+
+        rendered_subject, rendered_text, rendered_html = template.render(context)
+
+        email = EmailMultiAlternatives(
+            subject=rendered_subject,
+            body=rendered_text,
+            from_email=self.settings.from_email,
+            to=[self.settings.admin_email],
+        )
+        email.attach_alternative(rendered_html, "text/html")
+        return email
+
+    def build_thankyou_message(self, contact_submission):
+        """
+        Build the thank you email for the user who submitted the contact form
+        """
+        template = get_email_template(EmailTemplate.TemplateType.USER_THANKYOU)
+
+        # Prepare template context
+        context = {
+            "user_name": contact_submission.name,
+            "user_email": contact_submission.email,
+            "contact_subject": contact_submission.subject or "your inquiry",
+            "submission_date": contact_submission.submitted_date,
+            "site_name": getattr(settings, "SITE_NAME", "Roshan Damor Portfolio"),
+            "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
+            "admin_name": "Roshan Damor",
+            "reply_email": self.settings.reply_to_email,
+        }
+
+        rendered_subject, rendered_text, rendered_html = template.render(context)
+
+        email = EmailMultiAlternatives(
+            subject=rendered_subject,
+            body=rendered_text,
+            from_email=self.settings.from_email,
+            to=[contact_submission.email],
+            reply_to=[self.settings.reply_to_email],
+        )
+        email.attach_alternative(rendered_html, "text/html")
+        return email
+
+    def build_admin_digest_message(self, contact_submissions):
+        """
+        Build one admin email summarising several contact submissions
+        """
+        template = DEFAULT_TEMPLATES[ADMIN_DIGEST]
+        context = {
+            "submissions": contact_submissions,
+            "count": len(contact_submissions),
+            "site_name": getattr(settings, "SITE_NAME", "Portfolio Website"),
+            "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
+        }
+
+        rendered_subject, rendered_text, rendered_html = template.render(context)
+
+        email = EmailMultiAlternatives(
+            subject=rendered_subject,
+            body=rendered_text,
+            from_email=self.settings.from_email,
+            to=[self.settings.admin_email],
+        )
+        email.attach_alternative(rendered_html, "text/html")
+        return email
 
     def send_admin_notification(self, contact_submission, notification):
         """
         Send notification email to admin about new contact submission
         """
-        print(f"   📧 send_admin_notification() called")
-        print(
-            f"      Admin notifications enabled: {self.settings.admin_notification_enabled}"
-        )
+        log_extra = {"submission_id": contact_submission.id, "kind": "admin_notification"}
 
         if not self.settings.admin_notification_enabled:
-            logger.info("Admin notifications are disabled")
-            print(f"      ⚠️  Admin notifications are DISABLED in settings")
+            logger.info("Admin notifications are disabled", extra=log_extra)
             return False
 
+        started = time.perf_counter()
         try:
-            # Get email template or use default
-            template = self._get_template("admin_notification")
-
-            if template:
-                subject = template.subject
-                html_content = template.html_content
-                text_content = template.text_content
-                print(f"      Using custom template: {template.name}")
-            else:
-                # Default template
-                subject = f"New Contact Form Submission from {contact_submission.name}"
-                html_content = self._get_default_admin_html_template()
-                text_content = self._get_default_admin_text_template()
-                print(f"      Using default template")
-
-            # Prepare template context
-            context = {
-                "contact_name": contact_submission.name,
-                "contact_email": contact_submission.email,
-                "contact_subject": contact_submission.subject or "No subject provided",
-                "contact_message": contact_submission.message,
-                "submission_date": contact_submission.submitted_date,
-                "site_name": getattr(settings, "SITE_NAME", "Portfolio Website"),
-                "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
-            }
-
-            # Render templates with context
-            rendered_html = self._render_template_string(html_content, context)
-            rendered_text = self._render_template_string(text_content, context)
-            rendered_subject = self._render_template_string(subject, context)
-
-            print(f"      From: {self.settings.from_email}")
-            print(f"      To: {self.settings.admin_email}")
-            print(f"      Subject: {rendered_subject}")
-
-            # Send email
-            from django.core.mail import EmailMultiAlternatives
-
-            email = EmailMultiAlternatives(
-                subject=rendered_subject,
-                body=rendered_text,
-                from_email=self.settings.from_email,
-                to=[self.settings.admin_email],
-            )
-            email.attach_alternative(rendered_html, "text/html")
-            email.send(fail_silently=False)
-
+            email = self.build_admin_message(contact_submission)
+            self.send(email)
             notification.mark_admin_email_sent()
-            logger.info(
-                f"Admin notification sent for contact submission {contact_submission.id}"
-            )
-            print(f"      ✅ Admin email sent successfully")
-            return True
-
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to send admin notification: {error_msg}")
-            print(f"      ❌ Failed to send admin email: {error_msg}")
-            import traceback
-
-            traceback.print_exc()
+            log_extra["duration_ms"] = elapsed_ms(started)
+            logger.exception(f"Failed to send admin notification: {e}", extra=log_extra)
             try:
-                notification.mark_admin_email_sent(error=error_msg)
+                notification.mark_admin_email_sent(error=str(e))
             except Exception as inner_e:
-                logger.error(f"Failed to mark admin email as failed: {str(inner_e)}")
+                logger.error(
+                    f"Failed to mark admin email as failed: {inner_e}", extra=log_extra
+                )
             return False
 
+        log_extra["duration_ms"] = elapsed_ms(started)
+        logger.info(
+            f"Admin notification sent for contact submission {contact_submission.id}",
+            extra=log_extra,
+        )
+        return True
+
     def send_thankyou_notification(self, contact_submission, notification):
         """
         Send thank you email to user who submitted contact form
         """
-        print(f"   📧 send_thankyou_notification() called")
-        print(
-            f"      Thank you notifications enabled: {self.settings.thankyou_notification_enabled}"
-        )
+        log_extra = {"submission_id": contact_submission.id, "kind": "user_thankyou"}
 
         if not self.settings.thankyou_notification_enabled:
-            logger.info("Thank you notifications are disabled")
-            print(f"      ⚠️  Thank you notifications are DISABLED in settings")
+            logger.info("Thank you notifications are disabled", extra=log_extra)
             return False
 
+        started = time.perf_counter()
         try:
-            # Get email template or use default
-            template = self._get_template("user_thankyou")
-
-            if template:
-                subject = template.subject
-                html_content = template.html_content
-                text_content = template.text_content
-                print(f"      Using custom template: {template.name}")
-            else:
-                # Default template
-                subject = "Thank you for contacting us!"
-                html_content = self._get_default_thankyou_html_template()
-                text_content = self._get_default_thankyou_text_template()
-                print(f"      Using default template")
-
-            # Prepare template context
-            context = {
-                "user_name": contact_submission.name,
-                "user_email": contact_submission.email,
-                "contact_subject": contact_submission.subject or "your inquiry",
-                "submission_date": contact_submission.submitted_date,
-                "site_name": getattr(settings, "SITE_NAME", "Roshan Damor Portfolio"),
-                "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
-                "admin_name": "Roshan Damor",
-                "reply_email": self.settings.reply_to_email,
-            }
-
-            # Render templates with context
-            rendered_html = self._render_template_string(html_content, context)
-            rendered_text = self._render_template_string(text_content, context)
-            rendered_subject = self._render_template_string(subject, context)
-
-            print(f"      From: {self.settings.from_email}")
-            print(f"      To: {contact_submission.email}")
-            print(f"      Reply-To: {self.settings.reply_to_email}")
-            print(f"      Subject: {rendered_subject}")
-
-            # Send email
-            from django.core.mail import EmailMultiAlternatives
-
-            email = EmailMultiAlternatives(
-                subject=rendered_subject,
-                body=rendered_text,
-                from_email=self.settings.from_email,
-                to=[contact_submission.email],
-                reply_to=[self.settings.reply_to_email],
-            )
-            email.attach_alternative(rendered_html, "text/html")
-            email.send(fail_silently=False)
-
+            email = self.build_thankyou_message(contact_submission)
+            self.send(email)
             notification.mark_thankyou_email_sent()
-            logger.info(
-                f"Thank you notification sent for contact submission {contact_submission.id}"
-            )
-            print(f"      ✅ Thank you email sent successfully")
-            return True
-
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to send thank you notification: {error_msg}")
-            print(f"      ❌ Failed to send thank you email: {error_msg}")
-            import traceback
-
-            traceback.print_exc()
+            log_extra["duration_ms"] = elapsed_ms(started)
+            logger.exception(
+                f"Failed to send thank you notification: {e}", extra=log_extra
+            )
             try:
-                notification.mark_thankyou_email_sent(error=error_msg)
+                notification.mark_thankyou_email_sent(error=str(e))
             except Exception as inner_e:
-                logger.error(f"Failed to mark thankyou email as failed: {str(inner_e)}")
+                logger.error(
+                    f"Failed to mark thankyou email as failed: {inner_e}", extra=log_extra
+                )
             return False
 
-    def _get_template(self, template_type):
-        """Get active email template by type"""
-        try:
-            return EmailTemplate.objects.filter(
-                template_type=template_type, is_active=True
-            ).first()
-        except EmailTemplate.DoesNotExist:
-            return None
-
-    def _render_template_string(self, template_string, context):
-        """Render template string with context variables"""
-        try:
-            from django.template import Template, Context
+        log_extra["duration_ms"] = elapsed_ms(started)
+        logger.info(
+            f"Thank you notification sent for contact submission {contact_submission.id}",
+            extra=log_extra,
+        )
+        return True
 
-            template = Template(template_string)
-            return template.render(Context(context))
-        except Exception as e:
-            logger.error(f"Template rendering error: {str(e)}")
-            # Return template with basic string replacement as fallback
-            result = template_string
-            for key, value in context.items():
-                result = result.replace(f"{{{{ {key} }}}}", str(value))
-                # Also handle with spaces around variable name
-                result = result.replace(f"{{{{  {key}  }}}}", str(value))
-            return result
-
-    def _get_default_admin_html_template(self):
+    @staticmethod
+    def _get_default_admin_html_template():
         """Default HTML template for admin notification"""
         return """
         <!DOCTYPE html>
@@ -265,7 +333,8 @@ class EmailNotificationService:
         </html>
         """
 
-    def _get_default_admin_text_template(self):
+    @staticmethod
+    def _get_default_admin_text_template():
         """Default text template for admin notification"""
         return """
         📬 NEW CONTACT MESSAGE!
@@ -283,7 +352,72 @@ class EmailNotificationService:
         {{ site_url }}
         """
 
-    def _get_default_thankyou_html_template(self):
+    @staticmethod
+    def _get_default_digest_html_template():
+        """Default HTML template for the admin digest"""
+        return """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Contact Form Digest</title>
+            <style>
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 20px; background-color: #0f172a; color: #e2e8f0; }
+                .container { max-width: 600px; margin: 0 auto; background: #1e293b; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.3); border: 1px solid #334155; }
+                .header { background: linear-gradient(135deg, #10b981 0%, #059669 100%); color: white; padding: 30px; text-align: center; }
+                .header h1 { margin: 0; font-size: 24px; font-weight: 600; }
+                .content { padding: 30px; }
+                .field { margin-bottom: 20px; padding: 15px; background: rgba(15, 23, 42, 0.5); border-radius: 5px; border-left: 4px solid #10b981; }
+                .field-label { font-weight: 600; color: #10b981; margin-bottom: 5px; font-size: 14px; }
+                .field-value { color: #cbd5e1; line-height: 1.5; }
+                .footer { background: #0f172a; padding: 20px; text-align: center; font-size: 14px; color: #64748b; border-top: 1px solid #334155; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📬 {{ count }} New Contact Message{{ count|pluralize }}</h1>
+                </div>
+                <div class="content">
+                    {% for submission in submissions %}
+                    <div class="field">
+                        <div class="field-label">👤 {{ submission.name }} ({{ submission.email }}) · {{ submission.submitted_date }}</div>
+                        <div class="field-value"><strong>{{ submission.subject|default:"No subject provided" }}</strong></div>
+                        <div class="field-value" style="white-space: pre-line;">{{ submission.message }}</div>
+                    </div>
+                    {% endfor %}
+                </div>
+                <div class="footer">
+                    <p style="color: #10b981; font-weight: 600;">🚀 Portfolio Contact System</p>
+                    <p>This digest was sent from {{ site_name }}</p>
+                    <p><a href="{{ site_url }}" style="color: #10b981;">Visit Website</a></p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+    @staticmethod
+    def _get_default_digest_text_template():
+        """Default text template for the admin digest"""
+        return """
+        📬 {{ count }} NEW CONTACT MESSAGE{{ count|pluralize:"S" }}
+        {% for submission in submissions %}
+        👤 From: {{ submission.name }} ({{ submission.email }})
+        📋 Subject: {{ submission.subject|default:"No subject provided" }}
+        ⏰ Submitted: {{ submission.submitted_date }}
+        💬 Message:
+        {{ submission.message }}
+        {% endfor %}
+        ---
+        🚀 Portfolio Contact System
+        This digest was sent from {{ site_name }}
+        {{ site_url }}
+        """
+
+    @staticmethod
+    def _get_default_thankyou_html_template():
         """Default HTML template for thank you email"""
         return """
         <!DOCTYPE html>
@@ -350,7 +484,8 @@ class EmailNotificationService:
         </html>
         """
 
-    def _get_default_thankyou_text_template(self):
+    @staticmethod
+    def _get_default_thankyou_text_template():
         """Default text template for thank you email"""
         return """
         ✨ Thank You for Reaching Out!
@@ -381,3 +516,135 @@ class EmailNotificationService:
         This email was sent automatically from my portfolio contact form.
         For urgent matters, reach me directly at: {{ reply_email }}
         """
+
+
+# =========================================================================
+# COMPILED TEMPLATE CACHE
+# =========================================================================
+# Compiling a Template costs far more than rendering it, and emails go out
+# in bursts (outbox batches, campaigns). EmailTemplate rows are compiled
+# once per (id, updated_at); the lookup of the active template per type is
+# kept for EMAIL_TEMPLATE_LOOKUP_TTL seconds and dropped as soon as a
+# template is saved or deleted in this process. Other processes pick up an
+# edit once their lookup expires; the new updated_at then forces a
+# recompile.
+
+
+class _ReplaceTemplate:
+    """Stand-in for a template that failed to compile: plain substitution."""
+
+    def __init__(self, template_string):
+        self.template_string = template_string
+
+    def render(self, context):
+        result = self.template_string
+        for key, value in context.flatten().items():
+            result = result.replace(f"{{{{ {key} }}}}", str(value))
+            result = result.replace(f"{{{{{key}}}}}", str(value))
+        return result
+
+
+def _compile(template_string, name):
+    try:
+        return Template(template_string)
+    except TemplateSyntaxError as e:
+        logger.error(f"Template syntax error in {name}: {e}")
+        return _ReplaceTemplate(template_string)
+
+
+class CompiledEmailTemplate:
+    """Subject, text and HTML bodies of one email, compiled once."""
+
+    def __init__(self, name, subject, text_content, html_content):
+        self.name = name
+        self.subject = _compile(subject, name)
+        self.text = _compile(text_content, name)
+        self.html = _compile(html_content, name)
+
+    def render(self, context):
+        """Return the rendered (subject, text, html)."""
+        # Only the HTML body is HTML; escaping the others would show
+        # entities such as &#x27; in subjects and plain-text mail
+        plain = Context(context, autoescape=False)
+        return (
+            " ".join(self.subject.render(plain).split()),
+            self.text.render(plain),
+            self.html.render(Context(context)),
+        )
+
+
+# Digests have no EmailTemplate type; they always use the built-in template
+ADMIN_DIGEST = "admin_digest"
+
+DEFAULT_TEMPLATES = {
+    EmailTemplate.TemplateType.ADMIN_NOTIFICATION: CompiledEmailTemplate(
+        "default admin notification",
+        "New Contact Form Submission from {{ contact_name }}",
+        EmailNotificationService._get_default_admin_text_template(),
+        EmailNotificationService._get_default_admin_html_template(),
+    ),
+    EmailTemplate.TemplateType.USER_THANKYOU: CompiledEmailTemplate(
+        "default thank you",
+        "Thank you for contacting us!",
+        EmailNotificationService._get_default_thankyou_text_template(),
+        EmailNotificationService._get_default_thankyou_html_template(),
+    ),
+    ADMIN_DIGEST: CompiledEmailTemplate(
+        "default admin digest",
+        "{{ count }} new contact form submission{{ count|pluralize }}",
+        EmailNotificationService._get_default_digest_text_template(),
+        EmailNotificationService._get_default_digest_html_template(),
+    ),
+}
+
+_template_lock = threading.Lock()
+_compiled_templates = {}  # (id, updated_at) -> CompiledEmailTemplate
+_active_templates = {}  # template_type -> (expires_at, (id, updated_at) or None)
+
+
+def get_email_template(template_type):
+    """The compiled active template for `template_type`, or the default."""
+    now = time.monotonic()
+    with _template_lock:
+        cached = _active_templates.get(template_type)
+    if cached is not None and cached[0] > now:
+        key = cached[1]
+    else:
+        row = EmailTemplate.objects.filter(
+            template_type=template_type, is_active=True
+        ).first()
+        key = (row.pk, row.updated_at) if row else None
+        if row and key not in _compiled_templates:
+            compiled = CompiledEmailTemplate(
+                row.name, row.subject, row.text_content, row.html_content
+            )
+            with _template_lock:
+                # An edited row leaves its old compiled version behind
+                for stale in [k for k in _compiled_templates if k[0] == row.pk]:
+                    del _compiled_templates[stale]
+                _compiled_templates[key] = compiled
+        ttl = getattr(settings, "EMAIL_TEMPLATE_LOOKUP_TTL", 60)
+        with _template_lock:
+            _active_templates[template_type] = (now + ttl, key)
+
+    if key is None:
+        return DEFAULT_TEMPLATES[template_type]
+    with _template_lock:
+        compiled = _compiled_templates.get(key)
+    # Evicted between the lookup and here; compile on the next call
+    return compiled or DEFAULT_TEMPLATES[template_type]
+
+
+def evict_email_templates(**kwargs):
+    """Forget every compiled template and active-template lookup."""
+    with _template_lock:
+        _compiled_templates.clear()
+        _active_templates.clear()
+
+
+post_save.connect(
+    evict_email_templates, sender=EmailTemplate, dispatch_uid="email-template-save"
+)
+post_delete.connect(
+    evict_email_templates, sender=EmailTemplate, dispatch_uid="email-template-delete"
+)
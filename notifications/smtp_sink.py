@@ -0,0 +1,136 @@
+"""
+A throwaway local SMTP server that accepts and discards mail.
+
+Used by the email benchmark and tests to exercise the real SMTP backend
+without a mail provider. It speaks just enough SMTP for smtplib (EHLO,
+MAIL, RCPT, DATA, RSET, NOOP, QUIT), counts connections and messages, and
+can sleep on connect to stand in for the TLS handshake and login of a
+real server.
+
+    with SMTPSink(connect_delay=0.05) as sink:
+        backend = get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host=sink.host, port=sink.port,
+            use_ssl=False, use_tls=False, username="", password="",
+        )
+"""
+
+import socket
+import socketserver
+import threading
+import time
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+            self.server.active.add(self.connection)
+
+    def finish(self):
+        with self.server.lock:
+            self.server.active.discard(self.connection)
+        try:
+            super().finish()
+        except OSError:
+            pass
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        if self.server.connect_delay:
+            time.sleep(self.server.connect_delay)
+        try:
+            self.reply("220 localhost SMTP sink ready")
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                verb = line.decode("utf-8", "replace").strip().split(" ", 1)[0].upper()
+                if verb == "EHLO":
+                    self.reply("250-localhost")
+                    self.reply("250 8BITMIME")
+                elif verb in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                    self.reply("250 OK")
+                elif verb == "DATA":
+                    self.reply("354 End data with <CR><LF>.<CR><LF>")
+                    while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                        pass
+                    with self.server.lock:
+                        self.server.messages += 1
+                    self.reply("250 OK queued")
+                elif verb == "QUIT":
+                    self.reply("221 Bye")
+                    return
+                else:
+                    self.reply("502 Command not implemented")
+        except OSError:
+            # The client or drop_connections() closed the socket
+            return
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """Run the sink on a background thread bound to an ephemeral port."""
+
+    def __init__(self, host="127.0.0.1", port=0, connect_delay=0):
+        self.server = _Server((host, port), _SMTPHandler)
+        self.server.lock = threading.Lock()
+        self.server.active = set()
+        self.server.connections = 0
+        self.server.messages = 0
+        self.server.connect_delay = connect_delay
+        self.host, self.port = self.server.server_address[:2]
+        self._thread = None
+
+    @property
+    def connections(self):
+        return self.server.connections
+
+    @property
+    def messages(self):
+        return self.server.messages
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.drop_connections()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def drop_connections(self):
+        """Close every open client socket, as a server idle timeout would."""
+        with self.server.lock:
+            sockets = list(self.server.active)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def backend_kwargs(self):
+        """get_connection() arguments for Django's SMTP backend."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "username": "",
+            "password": "",
+            "use_tls": False,
+            "use_ssl": False,
+            "timeout": 5,
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -5,12 +5,13 @@ Tests email notifications, notification management, and messaging functionality.
 
 import json
 from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core import mail
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from datetime import timedelta
 import pytest
 
 from tests.factories import UserFactory
@@ -831,3 +832,774 @@ class NotificationPerformanceTest(BaseTestCase):
         except ImportError:
             # Skip if notification queries don't exist
             pass
+
+
+# ===== NOTIFICATION OUTBOX TESTS =====
+
+
+@pytest.mark.signals
+class EmailOutboxTest(BaseTestCase):
+    """Test queued delivery of contact form emails."""
+
+    def setUp(self):
+        super().setUp()
+        from notifications.models import NotificationSettings
+
+        self.notification_settings = NotificationSettings.get_settings()
+
+    def submit_contact(self):
+        from portfolio.models import ContactSubmission
+
+        return ContactSubmission.objects.create(
+            name="Jane Visitor",
+            email="jane@example.com",
+            subject="Hello",
+            message="Nice portfolio!",
+        )
+
+    def make_due(self, submission):
+        from notifications.models import EmailOutbox
+
+        EmailOutbox.objects.filter(
+            notification__contact_submission=submission
+        ).update(next_attempt_at=timezone.now())
+
+    def test_submission_queues_emails_without_sending(self):
+        from notifications.models import ContactNotification, EmailOutbox
+
+        before = timezone.now()
+        submission = self.submit_contact()
+
+        self.assertEqual(len(mail.outbox), 0)
+        notification = ContactNotification.objects.get(contact_submission=submission)
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.PENDING
+        )
+        admin_entry = EmailOutbox.objects.get(
+            notification=notification, kind=EmailOutbox.Kind.ADMIN_NOTIFICATION
+        )
+        thankyou_entry = EmailOutbox.objects.get(
+            notification=notification, kind=EmailOutbox.Kind.USER_THANKYOU
+        )
+        # Default delays: admin immediately, thank-you after 30 seconds
+        self.assertLessEqual(admin_entry.next_attempt_at, timezone.now())
+        self.assertGreaterEqual(
+            thankyou_entry.next_attempt_at, before + timedelta(seconds=30)
+        )
+
+    def test_worker_sends_due_emails_and_completes_notification(self):
+        from notifications.models import ContactNotification
+        from notifications.outbox import process_outbox
+
+        submission = self.submit_contact()
+
+        self.assertEqual(process_outbox(), {"sent": 1, "failed": 0})
+        self.assertEqual(mail.outbox[0].to, [self.notification_settings.admin_email])
+        notification = ContactNotification.objects.get(contact_submission=submission)
+        self.assertTrue(notification.admin_email_sent)
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.SENT_TO_ADMIN
+        )
+
+        self.make_due(submission)
+        self.assertEqual(process_outbox(), {"sent": 1, "failed": 0})
+        self.assertEqual(mail.outbox[1].to, ["jane@example.com"])
+        notification.refresh_from_db()
+        submission.refresh_from_db()
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.COMPLETED
+        )
+        self.assertTrue(submission.is_read)
+
+        # Nothing is sent twice
+        self.make_due(submission)
+        self.assertEqual(process_outbox(), {"sent": 0, "failed": 0})
+
+    def test_disabled_email_is_not_queued(self):
+        from notifications.models import ContactNotification, EmailOutbox
+        from notifications.outbox import process_outbox
+
+        self.notification_settings.thankyou_notification_enabled = False
+        self.notification_settings.save()
+        submission = self.submit_contact()
+
+        self.assertEqual(EmailOutbox.objects.count(), 1)
+        process_outbox()
+        notification = ContactNotification.objects.get(contact_submission=submission)
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.COMPLETED
+        )
+
+    def test_failed_send_backs_off_then_gives_up(self):
+        from notifications.models import ContactNotification, EmailOutbox
+        from notifications.outbox import process_outbox
+
+        self.notification_settings.thankyou_notification_enabled = False
+        self.notification_settings.save()
+        submission = self.submit_contact()
+        entry = EmailOutbox.objects.get()
+
+        with self.settings(
+            NOTIFICATION_OUTBOX_MAX_ATTEMPTS=3, NOTIFICATION_OUTBOX_RETRY_BASE=60
+        ), patch(
+            "notifications.services.ManagedEmailConnection.send",
+            side_effect=ConnectionRefusedError("SMTP down"),
+        ):
+            before = timezone.now()
+            self.assertEqual(process_outbox(), {"sent": 0, "failed": 1})
+            entry.refresh_from_db()
+            self.assertEqual(entry.status, EmailOutbox.Status.PENDING)
+            self.assertEqual(entry.attempts, 1)
+            self.assertGreaterEqual(
+                entry.next_attempt_at, before + timedelta(seconds=60)
+            )
+            notification = ContactNotification.objects.get(
+                contact_submission=submission
+            )
+            self.assertEqual(notification.admin_email_error, "SMTP down")
+            self.assertEqual(
+                notification.status, ContactNotification.NotificationStatus.PENDING
+            )
+
+            # Not due yet
+            self.assertEqual(process_outbox(), {"sent": 0, "failed": 0})
+
+            for attempt in (2, 3):
+                self.make_due(submission)
+                process_outbox()
+                entry.refresh_from_db()
+                self.assertEqual(entry.attempts, attempt)
+            self.assertEqual(entry.status, EmailOutbox.Status.FAILED)
+
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.FAILED
+        )
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_retry_delay_is_exponential_and_capped(self):
+        from notifications.outbox import retry_delay
+
+        with self.settings(
+            NOTIFICATION_OUTBOX_RETRY_BASE=60, NOTIFICATION_OUTBOX_RETRY_MAX=600
+        ):
+            self.assertEqual(
+                [retry_delay(n) for n in range(1, 6)], [60, 120, 240, 480, 600]
+            )
+
+    def test_claimed_emails_are_leased(self):
+        from notifications.outbox import claim_due
+
+        self.submit_contact()
+
+        self.assertEqual(len(claim_due()), 1)
+        # A second worker polling right away gets nothing
+        self.assertEqual(claim_due(), [])
+
+    def test_send_notifications_command(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        self.submit_contact()
+        out = StringIO()
+        call_command("send_notifications", "--once", stdout=out)
+
+        self.assertIn("Sent: 1", out.getvalue())
+        self.assertEqual(len(mail.outbox), 1)
+
+
+@pytest.mark.performance
+class ManagedEmailConnectionTest(BaseTestCase):
+    """Test SMTP connection reuse against a local SMTP sink."""
+
+    SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+    def setUp(self):
+        super().setUp()
+        from notifications.smtp_sink import SMTPSink
+
+        self.sink = SMTPSink().start()
+        self.addCleanup(self.sink.stop)
+
+    def make_connection(self, **kwargs):
+        from notifications.services import ManagedEmailConnection
+
+        connection = ManagedEmailConnection(
+            backend=self.SMTP_BACKEND, **kwargs, **self.sink.backend_kwargs()
+        )
+        self.addCleanup(connection.close)
+        return connection
+
+    def make_message(self, i=0):
+        from django.core.mail import EmailMessage
+
+        return EmailMessage(
+            subject=f"Message {i}",
+            body="Body",
+            from_email="noreply@example.com",
+            to=[f"reader{i}@example.com"],
+        )
+
+    def test_send_many_reuses_one_connection(self):
+        from notifications.services import EmailNotificationService
+
+        service = EmailNotificationService(connection=self.make_connection())
+        sent, failures = service.send_many(
+            [self.make_message(i) for i in range(5)]
+        )
+
+        self.assertEqual((sent, failures), (5, []))
+        self.assertEqual(self.sink.messages, 5)
+        self.assertEqual(self.sink.connections, 1)
+
+    def test_reconnects_after_server_drops_connection(self):
+        connection = self.make_connection()
+        connection.send(self.make_message(1))
+
+        self.sink.drop_connections()
+        connection.send(self.make_message(2))
+
+        self.assertEqual(self.sink.messages, 2)
+        self.assertEqual(self.sink.connections, 2)
+
+    def test_idle_connection_is_closed(self):
+        import time
+
+        connection = self.make_connection(idle_timeout=0.05)
+        connection.send(self.make_message(1))
+        connection.close_if_idle()
+        self.assertIsNotNone(connection._connection)
+
+        time.sleep(0.1)
+        connection.close_if_idle()
+        self.assertIsNone(connection._connection)
+
+        connection.send(self.make_message(2))
+        self.assertEqual(connection.opened, 2)
+
+    def test_send_many_continues_past_failures(self):
+        import smtplib
+        from notifications.services import EmailNotificationService
+
+        connection = Mock()
+        refused = smtplib.SMTPRecipientsRefused({"reader1@example.com": (550, b"No")})
+        connection.send.side_effect = [1, refused, 1]
+        service = EmailNotificationService(connection=connection)
+        messages = [self.make_message(i) for i in range(3)]
+
+        sent, failures = service.send_many(messages)
+
+        self.assertEqual(sent, 2)
+        self.assertEqual(failures, [(messages[1], refused)])
+
+
+@pytest.mark.performance
+class CompiledEmailTemplateCacheTest(BaseTestCase):
+    """Test compiled EmailTemplate caching."""
+
+    def setUp(self):
+        super().setUp()
+        from notifications.services import evict_email_templates
+
+        evict_email_templates()
+        self.addCleanup(evict_email_templates)
+
+    def submit_contact(self, name="Jane O'Brien"):
+        from portfolio.models import ContactSubmission
+
+        return ContactSubmission.objects.create(
+            name=name,
+            email="jane@example.com",
+            subject="Hello",
+            message="Nice portfolio!",
+        )
+
+    def create_template(self, subject="Hi {{ user_name }}"):
+        from notifications.models import EmailTemplate
+
+        return EmailTemplate.objects.create(
+            name="Custom thank you",
+            template_type=EmailTemplate.TemplateType.USER_THANKYOU,
+            subject=subject,
+            html_content="<p>Thanks {{ user_name }}</p>",
+            text_content="Thanks {{ user_name }}",
+        )
+
+    def test_custom_template_is_compiled_and_looked_up_once(self):
+        from django.template import Template
+        from notifications.services import EmailNotificationService
+
+        self.create_template()
+        submission = self.submit_contact()
+        service = EmailNotificationService()
+        service.settings  # loaded once per service
+
+        with patch("notifications.services.Template", wraps=Template) as compile_:
+            first = service.build_thankyou_message(submission)
+            with self.assertNumQueries(0):
+                second = service.build_thankyou_message(submission)
+
+        # Subject, text and HTML, compiled for the first message only
+        self.assertEqual(compile_.call_count, 3)
+        self.assertEqual(first.subject, "Hi Jane O'Brien")
+        self.assertEqual(second.body, "Thanks Jane O'Brien")
+        self.assertIn("Thanks Jane O&#x27;Brien", second.alternatives[0][0])
+
+    def test_saving_template_evicts_compiled_version(self):
+        from notifications.services import EmailNotificationService
+
+        template = self.create_template()
+        submission = self.submit_contact()
+        service = EmailNotificationService()
+        service.build_thankyou_message(submission)
+
+        template.subject = "Welcome {{ user_name }}"
+        template.save()
+
+        self.assertEqual(
+            service.build_thankyou_message(submission).subject, "Welcome Jane O'Brien"
+        )
+
+    def test_defaults_are_precompiled(self):
+        from django.template import Template
+        from notifications.services import EmailNotificationService
+
+        submission = self.submit_contact()
+        service = EmailNotificationService()
+        service.settings
+
+        with patch("notifications.services.Template", wraps=Template) as compile_:
+            message = service.build_admin_message(submission)
+
+        compile_.assert_not_called()
+        self.assertEqual(
+            message.subject, "New Contact Form Submission from Jane O'Brien"
+        )
+
+    def test_broken_template_falls_back_to_substitution(self):
+        from notifications.services import EmailNotificationService
+
+        self.create_template(subject="Hi {{ user_name }} {% broken %}")
+        message = EmailNotificationService().build_thankyou_message(
+            self.submit_contact(name="Jane")
+        )
+
+        self.assertEqual(message.subject, "Hi Jane {% broken %}")
+
+
+# ===== NEWSLETTER TESTS =====
+
+
+@pytest.mark.performance
+class NewsletterCampaignTest(BaseTestCase):
+    """Test batched newsletter delivery."""
+
+    def setUp(self):
+        super().setUp()
+        from notifications.models import NewsletterCampaign
+        from portfolio.models import NewsletterSubscriber
+
+        self.subscribers = [
+            NewsletterSubscriber.objects.create(email=f"reader{i}@example.com")
+            for i in range(5)
+        ]
+        self.campaign = NewsletterCampaign.objects.create(
+            name="October update",
+            subject="News from {{ site_name }}",
+            html_content="<p>Hello from {{ site_name }}</p>",
+            text_content="Hello from {{ site_name }}",
+        )
+
+    def send(self, connection=None, rate=0):
+        from notifications.newsletter import send_campaign
+
+        return send_campaign(self.campaign.pk, rate=rate, connection=connection)
+
+    def recipients(self):
+        return [message.to[0] for message in mail.outbox]
+
+    def test_sends_once_to_every_subscriber(self):
+        from django.template import Template
+
+        with patch("notifications.services.Template", wraps=Template) as compile_:
+            result = self.send()
+
+        self.assertEqual(result, {"sent": 5, "failed": 0})
+        self.assertEqual(
+            sorted(self.recipients()), sorted(s.email for s in self.subscribers)
+        )
+        # Rendered once for the campaign, not once per subscriber
+        self.assertEqual(compile_.call_count, 3)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, self.campaign.Status.SENT)
+        self.assertEqual(self.campaign.total_recipients, 5)
+        self.assertEqual(self.campaign.progress, 100)
+        # A finished campaign cannot be sent again
+        self.assertIsNone(self.send())
+
+    def test_resumes_after_checkpoint(self):
+        from datetime import timedelta
+
+        self.campaign.status = self.campaign.Status.SENDING
+        self.campaign.last_subscriber_id = self.subscribers[1].pk
+        self.campaign.sent_count = 2
+        self.campaign.heartbeat_at = timezone.now() - timedelta(hours=1)
+        self.campaign.save()
+
+        result = self.send()
+
+        self.assertEqual(result, {"sent": 5, "failed": 0})
+        self.assertEqual(
+            self.recipients(), [s.email for s in self.subscribers[2:]]
+        )
+
+    def test_active_campaign_is_not_claimed_twice(self):
+        self.campaign.status = self.campaign.Status.SENDING
+        self.campaign.heartbeat_at = timezone.now()
+        self.campaign.save()
+
+        self.assertIsNone(self.send())
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_connection_failure_leaves_campaign_resumable(self):
+        import smtplib
+
+        connection = Mock()
+        connection.send.side_effect = [1, smtplib.SMTPServerDisconnected("gone")]
+
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            self.send(connection=connection)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.last_subscriber_id, self.subscribers[0].pk)
+        self.assertEqual(self.campaign.sent_count, 1)
+        self.assertIsNone(self.campaign.heartbeat_at)
+
+        # The next run picks up with the subscriber that failed
+        self.assertEqual(self.send(), {"sent": 5, "failed": 0})
+        self.assertEqual(
+            self.recipients(), [s.email for s in self.subscribers[1:]]
+        )
+
+    def test_refused_recipient_does_not_stop_campaign(self):
+        import smtplib
+
+        refused = smtplib.SMTPRecipientsRefused({"reader2@example.com": (550, b"No")})
+        connection = Mock()
+        connection.send.side_effect = [1, 1, refused, 1, 1]
+
+        self.assertEqual(self.send(connection=connection), {"sent": 4, "failed": 1})
+
+    def test_cancelling_stops_sender(self):
+        from notifications.models import NewsletterCampaign
+        from notifications.newsletter import CampaignStopped
+
+        def cancel_after_first(message):
+            NewsletterCampaign.objects.filter(pk=self.campaign.pk).update(
+                status=NewsletterCampaign.Status.CANCELLED
+            )
+            return 1
+
+        connection = Mock()
+        connection.send.side_effect = cancel_after_first
+
+        with self.assertRaises(CampaignStopped):
+            self.send(connection=connection)
+        self.assertEqual(connection.send.call_count, 1)
+
+    def test_sending_is_throttled(self):
+        import time
+
+        start = time.monotonic()
+        self.send(rate=50)
+
+        # Four gaps of 1/50s between five messages
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_send_newsletter_command(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command("send_newsletter", self.campaign.pk, "--rate", "0", stdout=out)
+
+        self.assertIn("Sent: 5", out.getvalue())
+        self.assertEqual(len(mail.outbox), 5)
+
+
+@pytest.mark.signals
+class AdminDigestTest(BaseTestCase):
+    """Test batching admin notifications into digest emails."""
+
+    def setUp(self):
+        super().setUp()
+        from notifications.models import NotificationSettings
+
+        self.notification_settings = NotificationSettings.get_settings()
+        self.notification_settings.admin_digest_enabled = True
+        self.notification_settings.admin_digest_interval = 60
+        self.notification_settings.save()
+
+    def submit_contact(self, name):
+        from portfolio.models import ContactSubmission
+
+        return ContactSubmission.objects.create(
+            name=name, email=f"{name.lower()}@example.com", message=f"Hi from {name}"
+        )
+
+    def admin_emails(self):
+        return [m for m in mail.outbox if m.to == [self.notification_settings.admin_email]]
+
+    def test_submissions_share_one_digest(self):
+        from notifications.models import ContactNotification, EmailOutbox
+        from notifications.outbox import process_outbox
+
+        for name in ("Ann", "Bob", "Cy"):
+            self.submit_contact(name)
+        self.assertFalse(
+            EmailOutbox.objects.filter(
+                kind=EmailOutbox.Kind.ADMIN_NOTIFICATION
+            ).exists()
+        )
+
+        process_outbox()
+
+        digests = self.admin_emails()
+        self.assertEqual(len(digests), 1)
+        self.assertEqual(digests[0].subject, "3 new contact form submissions")
+        for name in ("Ann", "Bob", "Cy"):
+            self.assertIn(f"Hi from {name}", digests[0].body)
+
+        notifications = ContactNotification.objects.all()
+        digest_ids = {n.digest_id for n in notifications}
+        self.assertEqual(len(digest_ids), 1)
+        self.assertIsNotNone(digest_ids.pop())
+        for notification in notifications:
+            self.assertTrue(notification.admin_email_sent)
+            self.assertFalse(notification.awaiting_digest)
+            # Thank-you emails are still waiting for their own delay
+            self.assertEqual(
+                notification.status, ContactNotification.NotificationStatus.SENT_TO_ADMIN
+            )
+        self.assertEqual(notifications[0].digest.submission_count, 3)
+
+    def test_one_digest_per_interval(self):
+        from datetime import timedelta
+        from notifications.models import AdminDigest
+        from notifications.outbox import process_outbox
+
+        self.submit_contact("Ann")
+        process_outbox()
+        self.submit_contact("Bob")
+        process_outbox()
+        self.assertEqual(len(self.admin_emails()), 1)
+
+        AdminDigest.objects.update(created_at=timezone.now() - timedelta(minutes=61))
+        process_outbox()
+
+        self.assertEqual(len(self.admin_emails()), 2)
+        self.assertIn("Hi from Bob", self.admin_emails()[1].body)
+
+    def test_thankyou_is_immediate_and_digest_completes(self):
+        from notifications.models import ContactNotification
+        from notifications.outbox import process_outbox
+
+        self.notification_settings.thankyou_notification_delay = 0
+        self.notification_settings.save()
+        submission = self.submit_contact("Ann")
+
+        # Digest and thank-you go out in the same poll
+        process_outbox()
+
+        notification = ContactNotification.objects.get(contact_submission=submission)
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.COMPLETED
+        )
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_thankyou_alone_does_not_complete_awaiting_notification(self):
+        from notifications.models import AdminDigest, ContactNotification
+        from notifications.outbox import process_outbox
+
+        self.notification_settings.thankyou_notification_delay = 0
+        self.notification_settings.save()
+        AdminDigest.objects.create()  # a digest was just sent
+        submission = self.submit_contact("Ann")
+
+        process_outbox()
+
+        notification = ContactNotification.objects.get(contact_submission=submission)
+        self.assertTrue(notification.awaiting_digest)
+        self.assertEqual(
+            notification.status, ContactNotification.NotificationStatus.THANKYOU_SENT
+        )
+
+    def test_disabling_digest_flushes_waiting_submissions(self):
+        from notifications.models import AdminDigest
+        from notifications.outbox import process_outbox
+
+        AdminDigest.objects.create()
+        self.submit_contact("Ann")
+        process_outbox()
+        self.assertEqual(self.admin_emails(), [])
+
+        self.notification_settings.admin_digest_enabled = False
+        self.notification_settings.save()
+        process_outbox()
+
+        self.assertEqual(len(self.admin_emails()), 1)
+
+
+@pytest.mark.performance
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class NotificationSettingsCacheTest(BaseTestCase):
+    """Test the cached NotificationSettings singleton."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        super().setUp()
+        from notifications.models import NotificationSettings
+
+        # Creating the row invalidates the cache once; start from a stored row
+        NotificationSettings.get_settings()
+
+    def test_settings_are_read_once(self):
+        from notifications.models import NotificationSettings
+
+        NotificationSettings.get_settings()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                NotificationSettings.get_settings().admin_email,
+                "contact@roshandamor.me",
+            )
+
+    def test_submission_does_not_query_settings(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from notifications.models import NotificationSettings
+        from portfolio.models import ContactSubmission
+
+        NotificationSettings.get_settings()
+        with CaptureQueriesContext(connection) as queries:
+            ContactSubmission.objects.create(
+                name="Jane", email="jane@example.com", message="Hello"
+            )
+
+        self.assertFalse(
+            [q for q in queries if "notifications_notificationsettings" in q["sql"]]
+        )
+
+    def test_save_invalidates_other_workers(self):
+        from portfolio.cache import SingletonCache
+        from notifications.models import NotificationSettings
+
+        settings_row = NotificationSettings.get_settings()
+        # A second cache only shares the version key, like another process
+        other_worker = SingletonCache(
+            NotificationSettings, loader=NotificationSettings._load_settings
+        )
+        self.assertEqual(other_worker.get().admin_email, "contact@roshandamor.me")
+
+        settings_row.admin_email = "inbox@example.com"
+        # Other workers see the edit once it commits
+        with self.captureOnCommitCallbacks(execute=True):
+            settings_row.save()
+
+        self.assertEqual(other_worker.get().admin_email, "inbox@example.com")
+        self.assertEqual(
+            NotificationSettings.get_settings().admin_email, "inbox@example.com"
+        )
+
+
+# ===== NOTIFICATION LOGGING TESTS =====
+
+
+@pytest.mark.utils
+class QueuedLoggingTest(BaseTestCase):
+    """Test the queued logging pipeline and structured notification logs."""
+
+    def test_queue_handler_hands_records_to_targets(self):
+        import logging
+        import logging.config
+        import threading
+
+        class Collect(logging.Handler):
+            records = []
+
+            def emit(self, record):
+                self.records.append((threading.current_thread(), self.format(record)))
+
+        logging.config.dictConfig(
+            {
+                "version": 1,
+                "disable_existing_loggers": False,
+                "formatters": {
+                    "kv": {
+                        "()": "config.log_handlers.KeyValueFormatter",
+                        "format": "{levelname} {message}",
+                        "style": "{",
+                    }
+                },
+                "handlers": {
+                    "collect": {"()": lambda: Collect(), "formatter": "kv"},
+                    "queue": {
+                        "()": "config.log_handlers.QueueListenerHandler",
+                        "handlers": ["cfg://handlers.collect"],
+                    },
+                },
+                "loggers": {
+                    "queued-test": {"handlers": ["queue"], "level": "INFO"}
+                },
+            }
+        )
+        logger = logging.getLogger("queued-test")
+        queue_handler = logger.handlers[0]
+        self.addCleanup(logger.handlers.clear)
+
+        logger.info("Sent", extra={"submission_id": 7, "duration_ms": 1.5})
+        queue_handler.stop()
+
+        thread, line = Collect.records[0]
+        self.assertEqual(line, "INFO Sent | submission_id=7 duration_ms=1.5")
+        # Written by the listener thread, not the caller
+        self.assertIsNot(thread, threading.current_thread())
+
+    def test_settings_logging_configures(self):
+        """LOGGING from settings loads (from 3.12 dictConfig special-cases
+        QueueHandler subclasses configured by "class")."""
+        import logging
+        import logging.config
+
+        from django.conf import settings
+
+        from config import settings as project_settings
+        from config.log_handlers import QueueListenerHandler
+
+        # Tests run with a plain console LOGGING; load the deployed one
+        logging.config.dictConfig(project_settings.LOGGING)
+        self.addCleanup(logging.config.dictConfig, settings.LOGGING)
+
+        handler = logging.getLogger("notifications").handlers[0]
+        self.assertIsInstance(handler, QueueListenerHandler)
+        self.assertTrue(handler.targets)
+        self.assertTrue(all(isinstance(h, logging.Handler) for h in handler.targets))
+
+    def test_outbox_logs_carry_submission_and_duration(self):
+        from notifications.outbox import process_outbox
+        from portfolio.models import ContactSubmission
+
+        submission = ContactSubmission.objects.create(
+            name="Jane", email="jane@example.com", message="Hello"
+        )
+        with self.assertLogs("notifications.outbox", level="INFO") as logs:
+            process_outbox()
+
+        sent = [r for r in logs.records if r.getMessage() == "Sent admin_notification email"]
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0].submission_id, submission.pk)
+        self.assertEqual(sent[0].attempt, 1)
+        self.assertGreaterEqual(sent[0].duration_ms, 0)
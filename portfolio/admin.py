@@ -1,5 +1,3 @@
-import csv
-from django.http import HttpResponse
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
@@ -20,6 +18,7 @@ from .models import (
     NewsletterSubscriber,
     ContactSubmission,
 )
+from .exports import StreamingExportMixin
 
 # =========================================================================
 # CUSTOM ADMIN MIXIN
@@ -392,11 +391,12 @@ class SkillAdmin(BaseModelAdmin):
 
 
 @admin.register(NewsletterSubscriber)
-class NewsletterSubscriberAdmin(BaseModelAdmin):
+class NewsletterSubscriberAdmin(StreamingExportMixin, BaseModelAdmin):
     list_display = ("email", "subscribed_date", "days_subscribed")
     search_fields = ("email",)
     readonly_fields = ("subscribed_date", "days_subscribed")
-    actions = ["export_as_csv"]
+    actions = ["export_as_csv", "export_as_jsonl"]
+    export_fields = ("id", "email", "subscribed_date")
     date_hierarchy = "subscribed_date"
 
     def days_subscribed(self, obj):
@@ -407,21 +407,9 @@ class NewsletterSubscriberAdmin(BaseModelAdmin):
 
     days_subscribed.short_description = "Subscribed For"
 
-    @admin.action(description="📤 Export selected subscribers as CSV")
-    def export_as_csv(self, request, queryset):
-        meta = self.model._meta
-        field_names = [field.name for field in meta.fields]
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f"attachment; filename={meta}.csv"
-        writer = csv.writer(response)
-        writer.writerow(field_names)
-        for obj in queryset:
-            writer.writerow([getattr(obj, field) for field in field_names])
-        return response
-
 
 @admin.register(ContactSubmission)
-class ContactSubmissionAdmin(BaseModelAdmin):
+class ContactSubmissionAdmin(StreamingExportMixin, BaseModelAdmin):
     list_display = (
         "name",
         "email",
@@ -441,8 +429,18 @@ class ContactSubmissionAdmin(BaseModelAdmin):
         "submitted_date",
         "days_ago",
     )
-    actions = ["mark_as_read", "mark_as_unread"]
+    actions = ["mark_as_read", "mark_as_unread", "export_as_csv", "export_as_jsonl"]
     date_hierarchy = "submitted_date"
+    export_fields = (
+        "id",
+        "name",
+        "email",
+        "subject",
+        "message",
+        "is_urgent",
+        "is_read",
+        "submitted_date",
+    )
 
     def subject_preview(self, obj):
         return obj.subject[:50] + "..." if len(obj.subject) > 50 else obj.subject
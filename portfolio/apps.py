@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio'
+
+    def ready(self):
+        """Register singleton caches so every process invalidates on save"""
+        from .cache import singleton_cache
+        from .models import SiteConfiguration, Resume, VideoResume
+
+        for model in (SiteConfiguration, Resume, VideoResume):
+            singleton_cache(model)
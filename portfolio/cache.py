@@ -0,0 +1,343 @@
+"""
+Caching helpers shared by the portfolio apps.
+
+Singleton rows: configuration rows such as SiteConfiguration, Resume and
+VideoResume are read on every request but edited only a few times a month.
+Each worker keeps its own copy of these rows and only re-queries the database
+when the shared version key (stored in the default Django cache) changes.
+Saving or deleting a row bumps that version, so every gunicorn worker picks
+up the edit on its next request.
+
+Full pages: cache_page_for_models() caches the rendered body of anonymous
+GET requests. Every page declares the models it is built from; the cache key
+includes a version per model, so a write to one model only orphans the pages
+that depend on it.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_vary_headers
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "singleton-version"
+
+# Sentinel used to tell "not loaded yet" apart from "loaded, row missing"
+_MISSING = object()
+
+
+class SingletonCache:
+    """
+    Per-process copy of a singleton model row, invalidated through a shared
+    version key.
+    """
+
+    def __init__(self, model, loader=None):
+        self.model = model
+        self.loader = loader or self._default_loader
+        self.version_key = f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = _MISSING
+
+        # Invalidate on every write, from admin or anywhere else
+        uid = f"singleton-cache-{model._meta.label_lower}"
+        post_save.connect(self._on_change, sender=model, dispatch_uid=uid + "-save")
+        post_delete.connect(
+            self._on_change, sender=model, dispatch_uid=uid + "-delete"
+        )
+
+    def _default_loader(self):
+        try:
+            return self.model.objects.get()
+        except self.model.DoesNotExist:
+            return None
+
+    def get(self, version=_MISSING):
+        """
+        Return the cached row, reloading it if the shared version changed.
+        `version` may be passed in when the caller already fetched it in bulk.
+        """
+        if version is _MISSING:
+            version = cache.get(self.version_key)
+
+        with self._lock:
+            if self._value is not _MISSING and self._version == version:
+                self.hits += 1
+                return self._value
+
+        # Read the version before the row so a concurrent edit forces a reload
+        value = self.loader()
+        with self._lock:
+            self.misses += 1
+            self._version = version
+            self._value = value
+        return value
+
+    def invalidate(self):
+        """Drop the local copy and bump the shared version for other workers."""
+        self._drop_local()
+        self._bump_version()
+
+    def _drop_local(self):
+        with self._lock:
+            self._value = _MISSING
+            self._version = None
+
+    def _bump_version(self):
+        cache.set(self.version_key, time.time_ns(), None)
+
+    def _on_change(self, sender, **kwargs):
+        logger.debug(f"Invalidating singleton cache for {self.model.__name__}")
+        self._drop_local()
+        # Bumping before the write commits would let another worker reload
+        # the old row and keep it under the new version
+        transaction.on_commit(self._bump_version, using=kwargs.get("using"))
+
+    def stats(self):
+        """Return hit/miss counters and the hit rate for this process."""
+        total = self.hits + self.misses
+        return {
+            "model": self.model.__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+
+_registry = {}
+
+
+def singleton_cache(model, loader=None):
+    """
+    Return the process-wide SingletonCache for `model`, creating it once.
+    `loader` only applies to that first call.
+    """
+    label = model._meta.label_lower
+    if label not in _registry:
+        _registry[label] = SingletonCache(model, loader=loader)
+    return _registry[label]
+
+
+def get_singletons(*models):
+    """
+    Fetch several cached singletons, reading all shared version keys in one
+    cache round trip. Returns a list in the same order as `models`.
+    """
+    caches = [singleton_cache(model) for model in models]
+    versions = cache.get_many([c.version_key for c in caches])
+    return [c.get(version=versions.get(c.version_key)) for c in caches]
+
+
+def clear_singleton_caches():
+    """Drop every local copy, e.g. between test cases that roll back rows."""
+    for c in _registry.values():
+        c.invalidate()
+        c.reset_stats()
+
+
+def singleton_cache_stats():
+    """Hit rate report for every singleton cached in this process."""
+    return [c.stats() for c in _registry.values()]
+
+
+# =========================================================================
+# FULL-PAGE CACHE
+# =========================================================================
+
+PAGE_KEY_PREFIX = "page"
+PAGE_VERSION_KEY_PREFIX = "page-version"
+
+# Rendered into cached bodies in place of the per-visitor CSRF token
+CSRF_PLACEHOLDER = "__page_cache_csrf_token__"
+
+# Every page renders the footer/resume modals from these singleton rows
+SITE_WIDE_DEPENDENCIES = (
+    "portfolio.SiteConfiguration",
+    "portfolio.Resume",
+    "portfolio.VideoResume",
+)
+
+_page_dependencies = set()
+
+
+def _page_version_key(model):
+    return f"{PAGE_VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def invalidate_pages_for_model(model):
+    """Orphan every cached page that declared a dependency on `model`."""
+    cache.set(_page_version_key(model), time.time_ns(), None)
+
+
+def _watch_model(model):
+    """Bump the model's page version on save, delete and M2M changes."""
+    label = model._meta.label_lower
+    if label in _page_dependencies:
+        return
+    _page_dependencies.add(label)
+
+    def on_change(sender, **kwargs):
+        logger.debug(f"Invalidating cached pages that depend on {model.__name__}")
+        # A page rendered before the write commits would otherwise be stored
+        # under the new version and outlive the edit
+        transaction.on_commit(
+            lambda: invalidate_pages_for_model(model), using=kwargs.get("using")
+        )
+
+    # Keep a strong reference; the signals only hold weak ones by default
+    model._page_cache_receiver = on_change
+    uid = f"page-cache-{label}"
+    post_save.connect(on_change, sender=model, dispatch_uid=uid + "-save")
+    post_delete.connect(on_change, sender=model, dispatch_uid=uid + "-delete")
+    for field in model._meta.many_to_many:
+        m2m_changed.connect(
+            on_change,
+            sender=field.remote_field.through,
+            dispatch_uid=f"{uid}-m2m-{field.name}",
+        )
+
+
+def _is_cacheable_request(request):
+    if request.method not in ("GET", "HEAD"):
+        return False
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return False
+    # Flash messages are rendered into the page and must not be shared
+    return not len(get_messages(request))
+
+
+def _page_key(view_name, request, models):
+    versions = cache.get_many([_page_version_key(model) for model in models])
+    fingerprint = "|".join(
+        [view_name, request.build_absolute_uri()]
+        + [f"{key}={value}" for key, value in sorted(versions.items())]
+    )
+    digest = hashlib.md5(fingerprint.encode("utf-8")).hexdigest()
+    return f"{PAGE_KEY_PREFIX}:{view_name}:{digest}"
+
+
+def _cached_response(request, entry):
+    content = entry["content"]
+    if CSRF_PLACEHOLDER.encode() in content:
+        content = content.replace(
+            CSRF_PLACEHOLDER.encode(), get_token(request).encode()
+        )
+    response = HttpResponse(content, content_type=entry["content_type"])
+    response["X-Page-Cache"] = "hit"
+    patch_vary_headers(response, ("Cookie",))
+    return response
+
+
+def cache_page_for_models(*models, timeout=None):
+    """
+    Cache the rendered page for anonymous GET requests until one of `models`
+    (or a site-wide singleton) changes.
+
+    Models may be classes or "app_label.Model" labels (to avoid circular
+    imports). Use on class-based views with
+    ``@method_decorator(cache_page_for_models(Project, Category), name="dispatch")``.
+    The view must return a TemplateResponse. The CSRF token is swapped in per
+    request, so cached pages with forms stay valid for every visitor.
+    """
+    from django.apps import apps
+
+    # Models may be given as classes or "app_label.Model" strings
+    dependencies = [
+        apps.get_model(model) if isinstance(model, str) else model
+        for model in SITE_WIDE_DEPENDENCIES + models
+    ]
+    for model in dependencies:
+        _watch_model(model)
+
+    def decorator(view_func):
+        view_name = view_func.__qualname__.split(".")[0]
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            key = _page_key(view_name, request, dependencies)
+            entry = cache.get(key)
+            if entry is not None:
+                return _cached_response(request, entry)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code != 200 or not hasattr(response, "render"):
+                return response
+
+            # Render the token as a placeholder so the body can be shared
+            response.context_data = dict(response.context_data or {})
+            response.context_data["csrf_token"] = CSRF_PLACEHOLDER
+            response.render()
+
+            page_timeout = timeout
+            if page_timeout is None:
+                page_timeout = getattr(settings, "PAGE_CACHE_TIMEOUT", 600)
+            entry = {
+                "content": response.content,
+                "content_type": response["Content-Type"],
+            }
+            cache.set(key, entry, page_timeout)
+
+            response = _cached_response(request, entry)
+            response["X-Page-Cache"] = "miss"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# Sent by warm_pages(); matches the recorder's bot pattern, so warming does
+# not count as resource views or visitors
+WARMER_USER_AGENT = "PortfolioCacheWarmer/1.0 (+bot)"
+
+
+def warm_pages(paths, base_url=None):
+    """
+    Request `paths` as an anonymous visitor so their cached copies are
+    rebuilt before a real visitor asks for them. Returns {path: status}.
+
+    Page keys include the full URL, so requests are made for the public
+    host in SITE_URL. Only useful with a cache shared between processes:
+    the default FileBasedCache (for workers on the same host) or Redis
+    (REDIS_URL). A local-memory cache keeps the warmed copies in the
+    warming process.
+    """
+    from urllib.parse import urlsplit
+
+    from django.test import Client
+
+    site = urlsplit(base_url or getattr(settings, "SITE_URL", "http://localhost"))
+    client = Client(
+        HTTP_HOST=site.netloc,
+        HTTP_USER_AGENT=WARMER_USER_AGENT,
+        raise_request_exception=False,
+    )
+    statuses = {}
+    for path in paths:
+        response = client.get(path, secure=site.scheme == "https")
+        statuses[path] = response.status_code
+        if response.status_code != 200:
+            logger.warning(f"Warming {path} returned {response.status_code}")
+    return statuses
@@ -0,0 +1,114 @@
+"""
+Keyset (cursor) pagination shared by blog and project comments.
+
+Pages are ordered on (created_date, id) and each page ends with an opaque
+cursor pointing at its last comment. The next page filters past that key
+instead of using OFFSET, and one extra row is fetched to tell whether more
+comments exist, so the cost of a page does not grow with the number of
+comments and nothing is counted.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.timesince import timesince
+
+from .templatetags.custom_filters import avatar_color, initials
+
+COMMENTS_PAGE_SIZE = 10
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor that cannot be decoded."""
+
+
+def encode_cursor(comment):
+    raw = f"{comment.created_date.isoformat()}|{comment.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return the (created_date, id) key stored in `cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid comment cursor: {cursor!r}") from e
+
+
+def comment_page(
+    queryset,
+    like_model,
+    user,
+    cursor=None,
+    page_size=COMMENTS_PAGE_SIZE,
+    newest_first=True,
+):
+    """
+    Return one page of `queryset` after `cursor`.
+
+    The result is a dict with the page's ``comments``, the ``liked_ids`` of
+    those comments liked by `user` and the ``next_cursor`` (None on the last
+    page).
+    """
+    if newest_first:
+        queryset = queryset.order_by("-created_date", "-id")
+    else:
+        queryset = queryset.order_by("created_date", "id")
+
+    if cursor:
+        created, pk = decode_cursor(cursor)
+        if newest_first:
+            after = Q(created_date__lt=created) | Q(created_date=created, id__lt=pk)
+        else:
+            after = Q(created_date__gt=created) | Q(created_date=created, id__gt=pk)
+        queryset = queryset.filter(after)
+
+    # One extra row tells us whether another page exists
+    comments = list(queryset[: page_size + 1])
+    has_more = len(comments) > page_size
+    comments = comments[:page_size]
+
+    liked_ids = set()
+    if comments and user.is_authenticated:
+        liked_ids = set(
+            like_model.objects.filter(user=user, comment__in=comments).values_list(
+                "comment_id", flat=True
+            )
+        )
+
+    return {
+        "comments": comments,
+        "liked_ids": liked_ids,
+        "next_cursor": encode_cursor(comments[-1]) if has_more else None,
+    }
+
+
+def serialize_comment(comment, liked_ids):
+    return {
+        "id": comment.id,
+        "author_name": comment.author_name,
+        "body": comment.body,
+        "likes": comment.likes_count,
+        "is_liked": comment.id in liked_ids,
+        "created_at": comment.created_date.strftime("%B %d, %Y at %I:%M %p"),
+        "timesince": timesince(comment.created_date),
+        "initials": initials(comment.author_name),
+        "avatar_color": avatar_color(comment.author_name),
+    }
+
+
+def comment_page_response(page):
+    """JSON body for the comment page endpoints."""
+    return {
+        "comments": [
+            serialize_comment(comment, page["liked_ids"])
+            for comment in page["comments"]
+        ],
+        "next_cursor": page["next_cursor"],
+        "has_more": page["next_cursor"] is not None,
+    }
@@ -1,28 +1,20 @@
+from .cache import get_singletons
 from .models import SiteConfiguration, Resume, VideoResume
 
 def site_context(request):
     """
     Context processor to make site configuration available to all templates.
     This ensures footer social links and other global data work across all pages.
+    Rows are served from the per-process singleton cache (see portfolio.cache),
+    with all version keys read in one round trip. They are not lazy proxies,
+    so a missing row is None.
     """
-    context = {}
-    
-    # Site Configuration
-    try:
-        context['config'] = SiteConfiguration.objects.get()
-    except SiteConfiguration.DoesNotExist:
-        context['config'] = None
-        
-    # Resume
-    try:
-        context['resume'] = Resume.objects.get()
-    except Resume.DoesNotExist:
-        context['resume'] = None
-        
-    # Video Resume
-    try:
-        context['video_resume'] = VideoResume.objects.get()
-    except VideoResume.DoesNotExist:
-        context['video_resume'] = None
-    
-    return context
+    config, resume, video_resume = get_singletons(
+        SiteConfiguration, Resume, VideoResume
+    )
+
+    return {
+        'config': config,
+        'resume': resume,
+        'video_resume': video_resume,
+    }
@@ -0,0 +1,154 @@
+"""
+Streaming CSV / JSON Lines exports for admin changelists.
+
+Exports used to build the whole file in an HttpResponse, so memory grew
+with the number of rows and large exports ran into the worker timeout
+before the first byte was sent. Here rows are read in keyset-paginated
+chunks (``pk > last_pk ORDER BY pk LIMIT n``) and written to a
+StreamingHttpResponse as they are read, so memory stays flat whatever the
+row count.
+
+Under ASGI the response is given an async iterator that reads one buffered
+write at a time in the request's sync thread; Django would otherwise
+collect a sync iterator into a list before sending anything.
+
+Keyset pagination is used rather than QuerySet.iterator() because the
+production database is MySQL, where the driver loads the whole result set
+into memory even when iterating. As a consequence exports are ordered by
+primary key, not by the changelist ordering.
+
+    @admin.register(NewsletterSubscriber)
+    class NewsletterSubscriberAdmin(StreamingExportMixin, admin.ModelAdmin):
+        actions = ["export_as_csv", "export_as_jsonl"]
+        export_fields = ("id", "email", "subscribed_date")
+"""
+
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import admin
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+# Rows are grouped into writes of roughly this many bytes instead of one
+# write per row
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class _Echo:
+    """File-like object whose write() returns the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, fields, chunk_size=None):
+    """Yield value tuples for `fields`, reading `chunk_size` rows per query."""
+    chunk_size = chunk_size or getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(page.values_list("pk", *fields)[:chunk_size])
+        for row in rows:
+            yield row[1:]
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][0]
+
+
+def _buffered(lines):
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _async_chunks(chunks):
+    """Iterate `chunks` (which query the database) from async code."""
+    chunks = iter(chunks)
+    next_chunk = sync_to_async(next)
+    while True:
+        chunk = await next_chunk(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def csv_lines(queryset, fields, chunk_size=None):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in export_rows(queryset, fields, chunk_size):
+        yield writer.writerow(row)
+
+
+def jsonl_lines(queryset, fields, chunk_size=None):
+    for row in export_rows(queryset, fields, chunk_size):
+        yield json.dumps(dict(zip(fields, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (csv_lines, "text/csv"),
+    "jsonl": (jsonl_lines, "application/x-ndjson"),
+}
+
+
+def streaming_export(
+    queryset, fields, filename, fmt="csv", chunk_size=None, asynchronous=False
+):
+    """
+    Return a StreamingHttpResponse downloading `queryset` as `fmt`. Pass
+    asynchronous=True when the response is served by an ASGI handler.
+    """
+    lines, content_type = EXPORT_FORMATS[fmt]
+    chunks = _buffered(lines(queryset, fields, chunk_size))
+    response = StreamingHttpResponse(
+        _async_chunks(chunks) if asynchronous else chunks,
+        content_type=f"{content_type}; charset=utf-8",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{fmt}"'
+    return response
+
+
+class StreamingExportMixin:
+    """
+    Admin actions exporting the selected rows as CSV or JSON Lines; add
+    "export_as_csv" and "export_as_jsonl" to the admin's `actions`.
+
+    `export_fields` lists the columns; related values can be exported with
+    lookups such as "resource__title". Defaults to the model's concrete
+    fields.
+    """
+
+    export_fields = None
+
+    def get_export_fields(self):
+        if self.export_fields:
+            return list(self.export_fields)
+        return [field.attname for field in self.model._meta.concrete_fields]
+
+    def export(self, request, queryset, fmt):
+        meta = self.model._meta
+        return streaming_export(
+            queryset,
+            self.get_export_fields(),
+            f"{meta.app_label}_{meta.model_name}",
+            fmt,
+            asynchronous=isinstance(request, ASGIRequest),
+        )
+
+    @admin.action(description="📤 Export selected rows as CSV")
+    def export_as_csv(self, request, queryset):
+        return self.export(request, queryset, "csv")
+
+    @admin.action(description="📤 Export selected rows as JSON Lines")
+    def export_as_jsonl(self, request, queryset):
+        return self.export(request, queryset, "jsonl")
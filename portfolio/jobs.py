@@ -0,0 +1,27 @@
+"""Scheduled jobs for the portfolio app (see scheduler.registry)."""
+
+from django.conf import settings
+from django.urls import reverse
+
+from scheduler.registry import job
+
+from .cache import warm_pages
+
+# Pages served through cache_page_for_models
+DEFAULT_WARM_URLS = (
+    "portfolio:home",
+    "portfolio:project_list",
+    "blog:blog_list",
+    "roshan:resources",
+)
+
+
+@job("*/10 * * * *", jitter=60)
+def warm_page_cache():
+    """Re-render the cached public pages that an edit has invalidated."""
+    names = getattr(settings, "PAGE_CACHE_WARM_URLS", DEFAULT_WARM_URLS)
+    statuses = warm_pages([reverse(name) for name in names])
+    failed = [path for path, status in statuses.items() if status != 200]
+    if failed:
+        raise RuntimeError(f"Warming failed for {', '.join(failed)}")
+    return f"Warmed {len(statuses)} pages"
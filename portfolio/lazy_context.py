@@ -0,0 +1,82 @@
+"""
+Lazy values for context processors.
+
+Context processors run for every render(), including robots.txt, emails and
+small fragments that never read their values. Wrapping each value in a
+SimpleLazyObject defers the query until a template actually touches it.
+
+A proxy is never None, even when `func` returns None, so only wrap values
+that are read through truthiness, attributes or output ({% if %}, {{ }}).
+Values whose callers test `is None` (such as the singleton rows in
+site_context) must be passed unwrapped.
+
+When TRACK_CONTEXT_ACCESS is enabled (defaults to DEBUG) every evaluation is
+recorded against the template that triggered it, so context_access_report()
+shows which templates really need which keys.
+"""
+
+import inspect
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.template.context import BaseContext
+from django.utils.functional import SimpleLazyObject
+
+logger = logging.getLogger(__name__)
+
+_access_lock = threading.Lock()
+_access_report = defaultdict(set)
+
+
+def _tracking_enabled():
+    return getattr(settings, "TRACK_CONTEXT_ACCESS", settings.DEBUG)
+
+
+def _current_template_name():
+    """Find the template being rendered by walking up to its Context."""
+    frame = inspect.currentframe()
+    try:
+        while frame is not None:
+            context = frame.f_locals.get("context")
+            if isinstance(context, BaseContext):
+                render_context = getattr(context, "render_context", None)
+                template = getattr(render_context, "template", None)
+                if template is not None:
+                    return template.name or "<string>"
+            frame = frame.f_back
+    finally:
+        del frame
+    return "<python>"
+
+
+def _record_access(key):
+    template_name = _current_template_name()
+    with _access_lock:
+        first_access = key not in _access_report[template_name]
+        _access_report[template_name].add(key)
+    if first_access:
+        logger.debug(f"Context key '{key}' read by template {template_name}")
+
+
+def lazy_context_value(key, func):
+    """Return a lazy proxy that calls `func` on first use and records the read."""
+
+    def _evaluate():
+        if _tracking_enabled():
+            _record_access(key)
+        return func()
+
+    return SimpleLazyObject(_evaluate)
+
+
+def context_access_report():
+    """Map of template name -> sorted context keys it has evaluated."""
+    with _access_lock:
+        return {name: sorted(keys) for name, keys in sorted(_access_report.items())}
+
+
+def reset_context_access_report():
+    with _access_lock:
+        _access_report.clear()
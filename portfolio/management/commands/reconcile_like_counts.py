@@ -0,0 +1,64 @@
+"""
+Django management command to repair drift in the stored comment like counters
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.models import Comment
+from portfolio.models import ProjectComment
+
+
+class Command(BaseCommand):
+    help = 'Recount comment likes and fix stored likes_count values that drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted comments without changing them',
+        )
+
+    def like_count(self, model):
+        like_model = model.user_likes.rel.related_model
+        return (
+            like_model.objects.filter(comment=OuterRef('pk'))
+            .values('comment')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        total_fixed = 0
+
+        for model in (Comment, ProjectComment):
+            self.stdout.write(f"\n🔍 Checking {model._meta.verbose_name_plural}...")
+
+            drifted = (
+                model.objects.annotate(actual_likes=Count('user_likes'))
+                .exclude(likes_count=F('actual_likes'))
+                .values_list('pk', 'likes_count', 'actual_likes')
+            )
+
+            fixed = 0
+            for pk, stored, actual in drifted.iterator():
+                self.stdout.write(f"  ⚠️  #{pk}: stored {stored}, actual {actual}")
+                if not dry_run:
+                    # Recount inside the UPDATE so likes toggled since the
+                    # check above are not lost
+                    model.objects.filter(pk=pk).update(
+                        likes_count=Coalesce(Subquery(self.like_count(model)), 0)
+                    )
+                fixed += 1
+
+            if fixed:
+                self.stdout.write(f"  {'Would fix' if dry_run else '✅ Fixed'} {fixed}")
+            else:
+                self.stdout.write("  ✅ All counters match")
+            total_fixed += fixed
+
+        verb = 'would be repaired' if dry_run else 'repaired'
+        self.stdout.write(
+            self.style.SUCCESS(f'\n✨ {total_fixed} like counters {verb}')
+        )
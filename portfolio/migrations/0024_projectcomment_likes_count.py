@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:03
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_likes_count(apps, schema_editor):
+    ProjectComment = apps.get_model("portfolio", "ProjectComment")
+    ProjectCommentLike = apps.get_model("portfolio", "ProjectCommentLike")
+    counts = (
+        ProjectCommentLike.objects.filter(comment=OuterRef("pk"))
+        .values("comment")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    ProjectComment.objects.update(likes_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0023_alter_achievement_image_alter_project_cover_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectcomment',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_likes_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0024_projectcomment_likes_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectcomment',
+            index=models.Index(fields=['project', 'is_approved', 'created_date', 'id'], name='project_comment_page_idx'),
+        ),
+    ]
@@ -246,22 +246,30 @@ class ProjectComment(models.Model):
     )
     author_name = models.CharField(max_length=100, default="Anonymous")
     body = models.TextField()
-    # likes = models.PositiveIntegerField(default=0) # Removed, `total_likes` property handles this
     created_date = models.DateTimeField(auto_now_add=True)
     is_approved = models.BooleanField(default=True)
+    # Maintained by the like toggle view; repair with `reconcile_like_counts`
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["created_date"]
         verbose_name = "Project Comment"
         verbose_name_plural = "Project Comments"
+        indexes = [
+            # Keyset pagination in portfolio.comments
+            models.Index(
+                fields=["project", "is_approved", "created_date", "id"],
+                name="project_comment_page_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author_name} on {self.project.title}"
 
     @property
     def total_likes(self):
-        """Get total number of likes for this comment."""
-        return self.user_likes.count()
+        """Get total number of likes for this comment (stored counter)."""
+        return self.likes_count
 
     def is_liked_by_user(self, user):
         """Check if a specific user has liked this comment."""
@@ -0,0 +1,116 @@
+"""
+Request-scoped identity map for configuration rows.
+
+Model properties such as Blog.author_name look up a configuration row every
+time they are read, which costs one query per card on list pages. Lookups
+made through this module are memoized for the life of one request and
+thrown away by RequestCacheMiddleware when the response is returned, so a
+page never sees data older than the request itself.
+
+Outside a request (shell, management commands, tests without the
+middleware) nothing is memoized and every call hits the loader.
+"""
+
+import contextvars
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+_identity_map = contextvars.ContextVar("request_identity_map", default=None)
+
+# Sentinel used to tell "not loaded yet" apart from "loaded, row missing"
+_MISSING = object()
+
+_watched_models = set()
+
+
+def request_cached(key, loader):
+    """
+    Return the value stored under `key` for the current request, calling
+    `loader()` the first time it is asked for.
+    """
+    identity_map = _identity_map.get()
+    if identity_map is None:
+        return loader()
+
+    value = identity_map.get(key, _MISSING)
+    if value is _MISSING:
+        value = loader()
+        identity_map[key] = value
+    return value
+
+
+def first_instance(model):
+    """Request-scoped equivalent of ``model.objects.first()``."""
+    _watch_model(model)
+    return request_cached(
+        ("first", model._meta.label_lower), model.objects.first
+    )
+
+
+def forget(key):
+    """Drop one entry from the current request's map, if any."""
+    identity_map = _identity_map.get()
+    if identity_map is not None:
+        identity_map.pop(key, None)
+
+
+def _watch_model(model):
+    """Forget the cached row when it is written during the same request."""
+    label = model._meta.label_lower
+    if label in _watched_models:
+        return
+    _watched_models.add(label)
+
+    def on_change(sender, **kwargs):
+        forget(("first", label))
+
+    # Keep a strong reference; the signals only hold weak ones by default
+    model._request_cache_receiver = on_change
+    uid = f"request-cache-{label}"
+    post_save.connect(on_change, sender=model, dispatch_uid=uid + "-save")
+    post_delete.connect(on_change, sender=model, dispatch_uid=uid + "-delete")
+
+
+def activate():
+    """Start a fresh identity map; returns a token for deactivate()."""
+    return _identity_map.set({})
+
+
+def deactivate(token):
+    _identity_map.reset(token)
+
+
+class RequestCacheMiddleware:
+    """Give every request its own identity map and clear it afterwards."""
+
+    # A sync-only middleware would make async views run one at a time
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # TemplateResponses are rendered inside get_response(), so template
+        # lookups still see the map
+        token = activate()
+        try:
+            return self.get_response(request)
+        finally:
+            deactivate(token)
+
+    async def __acall__(self, request):
+        # Sync views run through sync_to_async, which copies this context
+        token = activate()
+        try:
+            return await self.get_response(request)
+        finally:
+            deactivate(token)
@@ -3,7 +3,7 @@ Comprehensive tests for the portfolio app.
 Tests models, views, forms, and utilities.
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
@@ -21,6 +21,7 @@ from portfolio.models import (
     Achievement,
     ContactSubmission,
     ProjectImage,
+    Resume,
 )
 from portfolio.forms import ContactForm
 from tests.factories import (
@@ -484,6 +485,633 @@ class PortfolioUtilsTest(TestCase):
         self.assertEqual(project.slug, expected_slug)
 
 
+@pytest.mark.views
+class SkillCategoryLoaderTest(TestCase):
+    """Test the single-pass skill category loader used by HomeView."""
+
+    def create_skills(self, per_category, technologies_per_skill=2):
+        from portfolio.models import Technology
+
+        for category_code, _ in Skill.SKILL_CATEGORIES:
+            for index in range(per_category):
+                skill = Skill.objects.create(
+                    title=f"{category_code} skill {Skill.objects.count()}",
+                    category=category_code,
+                    icon="fa-solid fa-code",
+                    order=index % 3,
+                    is_featured=index == per_category - 1,
+                )
+                for tech_index in range(technologies_per_skill):
+                    technology, _ = Technology.objects.get_or_create(
+                        name=f"{category_code}-tech-{index + tech_index}"
+                    )
+                    skill.technologies.add(technology)
+
+    def legacy_skill_categories(self):
+        """The previous per-category implementation, kept for comparison."""
+        from portfolio.models import Technology
+
+        result = []
+        for category_code, category_name in Skill.SKILL_CATEGORIES:
+            skills = Skill.objects.filter(category=category_code).order_by(
+                "order", "title"
+            )
+            if skills.exists():
+                result.append(
+                    {
+                        "code": category_code,
+                        "name": category_name,
+                        "skills_count": skills.count(),
+                        "technologies": list(
+                            Technology.objects.filter(skill__category=category_code)
+                            .distinct()[:6]
+                        ),
+                        "main_skill": skills.filter(is_featured=True).first()
+                        or skills.first(),
+                    }
+                )
+        return result
+
+    def test_output_matches_previous_implementation(self):
+        """The grouped loader returns the same cards as before."""
+        from portfolio.views import build_skill_categories
+
+        self.create_skills(per_category=5, technologies_per_skill=3)
+        Skill.objects.filter(category="soft_skills").delete()
+
+        self.assertEqual(build_skill_categories(), self.legacy_skill_categories())
+
+    def test_query_count_is_constant(self):
+        """Two queries regardless of how many categories and skills exist."""
+        from portfolio.views import build_skill_categories
+
+        self.create_skills(per_category=1)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(build_skill_categories()), 4)
+
+        self.create_skills(per_category=10, technologies_per_skill=4)
+        with self.assertNumQueries(2):
+            categories = build_skill_categories()
+        self.assertTrue(all(len(c["technologies"]) == 6 for c in categories))
+
+    def test_empty_database(self):
+        """No skills means no category cards."""
+        from portfolio.views import build_skill_categories
+
+        self.assertEqual(build_skill_categories(), [])
+
+
+# ===== CACHE TESTS =====
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.mark.utils
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingletonCacheTest(TestCase):
+    """Test the versioned per-process singleton cache."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from portfolio.cache import clear_singleton_caches
+
+        cache.clear()
+        clear_singleton_caches()
+
+    def test_repeated_reads_hit_local_copy(self):
+        """Only the first read goes to the database."""
+        from portfolio.cache import singleton_cache
+
+        SiteConfiguration.objects.create(hero_name="Cached Name")
+        site_cache = singleton_cache(SiteConfiguration)
+
+        self.assertEqual(site_cache.get().hero_name, "Cached Name")
+        with self.assertNumQueries(0):
+            self.assertEqual(site_cache.get().hero_name, "Cached Name")
+
+        stats = site_cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_missing_row_is_cached_as_none(self):
+        """A missing singleton is cached instead of re-queried."""
+        from portfolio.cache import singleton_cache
+
+        resume_cache = singleton_cache(Resume)
+        self.assertIsNone(resume_cache.get())
+        with self.assertNumQueries(0):
+            self.assertIsNone(resume_cache.get())
+
+    def test_save_invalidates_other_workers(self):
+        """A save bumps the shared version so other processes reload."""
+        from portfolio.cache import SingletonCache, singleton_cache
+
+        config = SiteConfiguration.objects.create(hero_name="Before")
+        singleton_cache(SiteConfiguration).get()
+
+        # A second instance only sees the shared version, like another worker
+        other_worker = SingletonCache(SiteConfiguration)
+        self.assertEqual(other_worker.get().hero_name, "Before")
+
+        config.hero_name = "After"
+        with self.captureOnCommitCallbacks(execute=True):
+            config.save()
+
+        self.assertEqual(other_worker.get().hero_name, "After")
+        self.assertEqual(singleton_cache(SiteConfiguration).get().hero_name, "After")
+
+    def test_version_is_bumped_on_commit(self):
+        """Other workers keep the old version until the write commits."""
+        from django.core.cache import cache
+
+        from portfolio.cache import singleton_cache
+
+        config = SiteConfiguration.objects.create(hero_name="Before")
+        site_cache = singleton_cache(SiteConfiguration)
+        site_cache.get()
+        version = cache.get(site_cache.version_key)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            config.hero_name = "After"
+            config.save()
+            # Still inside the transaction: the shared version is unchanged
+            self.assertEqual(cache.get(site_cache.version_key), version)
+            # The writing worker drops its own copy straight away
+            self.assertEqual(site_cache.get().hero_name, "After")
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(cache.get(site_cache.version_key), version)
+
+    def test_delete_invalidates(self):
+        """Deleting the row makes the context processor return None."""
+        from portfolio.context_processors import site_context
+
+        config = SiteConfiguration.objects.create()
+        self.assertEqual(site_context(None)["config"], config)
+
+        config.delete()
+        self.assertIsNone(site_context(None)["config"])
+
+    def test_site_context_is_query_free_when_warm(self):
+        """Warm renders of the context processor do not touch the database."""
+        from portfolio.context_processors import site_context
+
+        SiteConfiguration.objects.create()
+        site_context(None)
+        with self.assertNumQueries(0):
+            context = site_context(None)
+        self.assertIsNotNone(context["config"])
+        self.assertIsNone(context["resume"])
+        self.assertIsNone(context["video_resume"])
+
+    def test_site_context_reads_versions_in_one_round_trip(self):
+        """The three version keys come from a single get_many."""
+        from unittest.mock import patch
+
+        from django.core.cache import cache
+
+        from portfolio.context_processors import site_context
+
+        site_context(None)
+        with patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+            site_context(None)
+
+        get_many.assert_called_once()
+        self.assertEqual(len(get_many.call_args.args[0]), 3)
+
+
+@pytest.mark.utils
+@override_settings(TRACK_CONTEXT_ACCESS=True)
+class LazyContextTest(TestCase):
+    """Test lazy context processor values and the access report."""
+
+    def setUp(self):
+        from portfolio.cache import clear_singleton_caches
+        from portfolio.lazy_context import reset_context_access_report
+
+        clear_singleton_caches()
+        reset_context_access_report()
+
+    def test_warm_renders_do_not_query(self):
+        """Once the singletons are cached, renders run no queries for them."""
+        from django.template import RequestContext, Template
+        from django.test import RequestFactory
+
+        request = RequestFactory().get("/robots.txt")
+        template = Template("User-agent: *")
+        template.render(RequestContext(request, {}))
+        with self.assertNumQueries(0):
+            template.render(RequestContext(request, {}))
+
+    def test_values_evaluate_on_read(self):
+        """Reading a lazy key in a template queries it and records the access."""
+        from django.template import RequestContext, Template
+        from django.test import RequestFactory
+        from portfolio.lazy_context import (
+            context_access_report,
+            reset_context_access_report,
+        )
+
+        request = RequestFactory().get("/admin/")
+        request.user = User.objects.create_user("staff", is_staff=True)
+        template = Template("{{ total_projects }}")
+        # Warm the singleton cache so only the count is left to run
+        template.render(RequestContext(request, {}))
+        reset_context_access_report()
+
+        with self.assertNumQueries(1):
+            rendered = template.render(RequestContext(request, {}))
+
+        self.assertEqual(rendered, "0")
+        report = context_access_report()
+        self.assertEqual(list(report.values()), [["total_projects"]])
+
+    def test_admin_counts_are_lazy(self):
+        """Admin counts only run when the dashboard template reads them."""
+        from django.contrib.auth.models import AnonymousUser
+        from django.test import RequestFactory
+        from config.admin_context import admin_dashboard_context
+
+        request = RequestFactory().get("/admin/portfolio/project/")
+        request.user = User.objects.create_user("staff", is_staff=True)
+
+        with self.assertNumQueries(0):
+            context = admin_dashboard_context(request)
+        with self.assertNumQueries(1):
+            self.assertEqual(int(str(context["total_projects"])), 0)
+
+        request.user = AnonymousUser()
+        self.assertEqual(admin_dashboard_context(request), {})
+
+
+@pytest.mark.views
+@override_settings(CACHES=LOCMEM_CACHES)
+class PageCacheTest(TestCase):
+    """Test the full-page cache and its model-dependency invalidation."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = Client()
+
+    def test_second_request_served_from_cache(self):
+        """The second anonymous request skips the view entirely."""
+        first = self.client.get(reverse("portfolio:project_list"))
+        self.assertEqual(first["X-Page-Cache"], "miss")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("portfolio:project_list"))
+        self.assertEqual(second["X-Page-Cache"], "hit")
+        self.assertEqual(second.content, first.content)
+        self.assertIn("Cookie", second["Vary"])
+
+    def test_save_evicts_only_dependent_pages(self):
+        """Saving a Project evicts the project list but not the resources list."""
+        from roshan.models import ResourceCategory
+
+        self.client.get(reverse("portfolio:project_list"))
+        self.client.get(reverse("roshan:resources"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(
+                title="Fresh Project", summary="Summary", content="<p>Content</p>"
+            )
+
+        response = self.client.get(reverse("portfolio:project_list"))
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertContains(response, "Fresh Project")
+        response = self.client.get(reverse("roshan:resources"))
+        self.assertEqual(response["X-Page-Cache"], "hit")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ResourceCategory.objects.create(name="Books")
+        response = self.client.get(reverse("roshan:resources"))
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_site_configuration_evicts_every_page(self):
+        """Site-wide singletons are a dependency of every cached page."""
+        self.client.get(reverse("portfolio:project_list"))
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteConfiguration.objects.create(hero_name="New Hero")
+
+        response = self.client.get(reverse("portfolio:project_list"))
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_pages_are_evicted_when_the_write_commits(self):
+        """A page cached before the commit does not outlive the edit."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            Project.objects.create(
+                title="Uncommitted", summary="Summary", content="<p>Content</p>"
+            )
+            # Rendered while the write is still uncommitted
+            self.client.get(reverse("portfolio:project_list"))
+            response = self.client.get(reverse("portfolio:project_list"))
+            self.assertEqual(response["X-Page-Cache"], "hit")
+
+        for callback in callbacks:
+            callback()
+        response = self.client.get(reverse("portfolio:project_list"))
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_query_string_is_part_of_key(self):
+        """Filtered and sorted variants are cached separately."""
+        self.client.get(reverse("portfolio:project_list"))
+        response = self.client.get(
+            reverse("portfolio:project_list"), {"sort": "oldest"}
+        )
+        self.assertEqual(response["X-Page-Cache"], "miss")
+
+    def test_authenticated_requests_bypass_cache(self):
+        """Logged-in users always get a freshly rendered page."""
+        user = User.objects.create_user(username="reader", password="pass12345")
+        self.client.force_login(user)
+
+        self.client.get(reverse("portfolio:project_list"))
+        response = self.client.get(reverse("portfolio:project_list"))
+        self.assertFalse(response.has_header("X-Page-Cache"))
+
+    def test_csrf_token_is_per_visitor(self):
+        """Cached forms carry a token that matches each visitor's cookie."""
+        import re
+        from django.middleware.csrf import _unmask_cipher_token
+        from portfolio.cache import CSRF_PLACEHOLDER
+
+        first_client = Client(enforce_csrf_checks=True)
+        second_client = Client(enforce_csrf_checks=True)
+        first_client.get(reverse("portfolio:home"))
+        response = second_client.get(reverse("portfolio:home"))
+
+        self.assertEqual(response["X-Page-Cache"], "hit")
+        self.assertNotContains(response, CSRF_PLACEHOLDER)
+        tokens = set(
+            re.findall(
+                r'name="csrfmiddlewaretoken" value="([^"]+)"',
+                response.content.decode(),
+            )
+        )
+        self.assertTrue(tokens)
+        secret = second_client.cookies["csrftoken"].value
+        self.assertNotEqual(secret, first_client.cookies["csrftoken"].value)
+        for token in tokens:
+            self.assertEqual(_unmask_cipher_token(token), secret)
+
+
+# ===== LIKE COUNTER TESTS =====
+
+
+@pytest.mark.views
+class ProjectCommentLikeCounterTest(TestCase):
+    """Test the stored like counters and their reconciliation."""
+
+    def setUp(self):
+        from portfolio.models import ProjectComment
+
+        self.project = Project.objects.create(
+            title="Counter Project", summary="Summary", content="<p>Content</p>"
+        )
+        self.comments = [
+            ProjectComment.objects.create(
+                project=self.project, author_name="Reader", body=f"Comment {index}"
+            )
+            for index in range(3)
+        ]
+        self.user = User.objects.create_user(username="liker", password="pass12345")
+
+    def test_toggle_updates_stored_count(self):
+        """Liking and unliking keep likes_count in step."""
+        self.client.force_login(self.user)
+        comment = self.comments[0]
+        url = reverse("portfolio:toggle_project_comment_like", args=[comment.id])
+
+        self.assertEqual(self.client.post(url).json()["total_likes"], 1)
+        comment.refresh_from_db()
+        self.assertEqual(comment.likes_count, 1)
+
+        self.assertEqual(self.client.post(url).json()["total_likes"], 0)
+        comment.refresh_from_db()
+        self.assertEqual(comment.likes_count, 0)
+
+    def test_load_more_comments_has_no_per_comment_counts(self):
+        """The load-more endpoint's query count does not grow per comment."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from portfolio.models import ProjectComment
+
+        url = reverse("portfolio:load_more_project_comments", args=[self.project.slug])
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for index in range(5):
+            ProjectComment.objects.create(
+                project=self.project, author_name="Reader", body=f"More {index}"
+            )
+        with CaptureQueriesContext(connection) as many:
+            data = self.client.get(url).json()
+
+        self.assertEqual(len(data["comments"]), 8)
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+    def test_reconcile_command_repairs_drift(self):
+        """reconcile_like_counts recounts drifted rows only."""
+        from io import StringIO
+        from django.core.management import call_command
+        from portfolio.models import ProjectComment, ProjectCommentLike
+
+        drifted, untouched, overcounted = self.comments
+        ProjectCommentLike.objects.create(comment=drifted, user=self.user)
+        ProjectComment.objects.filter(pk=overcounted.pk).update(likes_count=7)
+
+        out = StringIO()
+        call_command("reconcile_like_counts", "--dry-run", stdout=out)
+        self.assertIn("2 like counters would be repaired", out.getvalue())
+        overcounted.refresh_from_db()
+        self.assertEqual(overcounted.likes_count, 7)
+
+        call_command("reconcile_like_counts", stdout=StringIO())
+        for comment, expected in ((drifted, 1), (untouched, 0), (overcounted, 0)):
+            comment.refresh_from_db()
+            self.assertEqual(comment.likes_count, expected)
+
+
+# ===== COMMENT PAGINATION TESTS =====
+
+
+@pytest.mark.views
+class CommentCursorPaginationTest(TestCase):
+    """Test keyset pagination of project comments."""
+
+    def setUp(self):
+        from django.utils import timezone
+        from portfolio.models import ProjectComment
+
+        self.project = Project.objects.create(
+            title="Paged Project", summary="Summary", content="<p>Content</p>"
+        )
+        for index in range(23):
+            ProjectComment.objects.create(
+                project=self.project, author_name="Reader", body=f"Comment {index}"
+            )
+        # Ties on created_date must still page deterministically by id
+        ProjectComment.objects.update(created_date=timezone.now())
+        self.url = reverse(
+            "portfolio:load_more_project_comments", args=[self.project.slug]
+        )
+
+    def test_pages_cover_every_comment_once(self):
+        """Following next_cursor visits each comment once, newest first."""
+        from portfolio.models import ProjectComment
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"cursor": cursor} if cursor else {}
+            data = self.client.get(self.url, params).json()
+            seen.extend(comment["id"] for comment in data["comments"])
+            cursor = data["next_cursor"]
+            self.assertEqual(data["has_more"], cursor is not None)
+            if not cursor:
+                break
+
+        expected = list(
+            ProjectComment.objects.order_by("-created_date", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(seen, expected)
+
+    def test_page_does_not_count_comments(self):
+        """A page is fetched without a COUNT over the comment set."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        first = self.client.get(self.url).json()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {"cursor": first["next_cursor"]})
+
+        self.assertFalse(
+            any("COUNT(" in query["sql"].upper() for query in queries.captured_queries)
+        )
+
+    def test_invalid_cursor_returns_400(self):
+        """A garbled cursor is rejected instead of raising."""
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_detail_page_renders_first_page(self):
+        """The detail page renders five comments and the next cursor."""
+        user = User.objects.create_user(username="reader", password="pass12345")
+        self.client.force_login(user)
+        response = self.client.get(
+            reverse("portfolio:project_detail", args=[self.project.slug])
+        )
+        self.assertEqual(len(response.context["comments"]), 5)
+        self.assertEqual(response.context["total_comments"], 23)
+        self.assertContains(
+            response, f'data-next-cursor="{response.context["next_comment_cursor"]}"'
+        )
+
+
+# ===== ADMIN EXPORT TESTS =====
+
+
+@pytest.mark.views
+class StreamingExportTest(TestCase):
+    """Test the streaming CSV / JSON Lines admin exports."""
+
+    def setUp(self):
+        from portfolio.models import NewsletterSubscriber
+
+        self.subscribers = [
+            NewsletterSubscriber.objects.create(email=f"reader{i}@example.com")
+            for i in range(5)
+        ]
+
+    def _body(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_rows_are_read_in_keyset_chunks(self):
+        from portfolio.exports import export_rows
+        from portfolio.models import NewsletterSubscriber
+
+        # 2 + 2 + 1 rows; the short last page ends the export
+        with self.assertNumQueries(3):
+            rows = list(
+                export_rows(NewsletterSubscriber.objects.all(), ["email"], chunk_size=2)
+            )
+        self.assertEqual(rows, [(s.email,) for s in self.subscribers])
+
+    def test_csv_and_jsonl_formats(self):
+        import json
+
+        from portfolio.exports import streaming_export
+        from portfolio.models import NewsletterSubscriber
+
+        queryset = NewsletterSubscriber.objects.filter(
+            pk__in=[s.pk for s in self.subscribers[:2]]
+        )
+        csv_response = streaming_export(
+            queryset, ["id", "email"], "subscribers", "csv", chunk_size=1
+        )
+        self.assertTrue(csv_response.streaming)
+        self.assertIn("subscribers.csv", csv_response["Content-Disposition"])
+        self.assertEqual(
+            self._body(csv_response).splitlines(),
+            ["id,email"] + [f"{s.pk},{s.email}" for s in self.subscribers[:2]],
+        )
+
+        jsonl_response = streaming_export(
+            queryset, ["id", "email", "subscribed_date"], "subscribers", "jsonl"
+        )
+        records = [
+            json.loads(line) for line in self._body(jsonl_response).splitlines()
+        ]
+        self.assertEqual(
+            [r["email"] for r in records], [s.email for s in self.subscribers[:2]]
+        )
+        self.assertIn("subscribed_date", records[0])
+
+    async def test_asgi_requests_get_an_async_stream(self):
+        """Under ASGI the export is read chunk by chunk, not collected first."""
+        from django.contrib.admin.sites import site
+        from django.test import AsyncRequestFactory
+
+        from portfolio.models import NewsletterSubscriber
+
+        model_admin = site._registry[NewsletterSubscriber]
+        response = model_admin.export(
+            AsyncRequestFactory().post("/"), NewsletterSubscriber.objects.all(), "csv"
+        )
+
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(body.decode().splitlines()), len(self.subscribers) + 1)
+
+    def test_admin_action_streams_selected_rows(self):
+        User.objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.login(username="admin", password="password")
+        selected = self.subscribers[1:3]
+        response = self.client.post(
+            reverse("admin:portfolio_newslettersubscriber_changelist"),
+            {
+                "action": "export_as_csv",
+                "_selected_action": [s.pk for s in selected],
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = self._body(response).splitlines()
+        self.assertEqual(lines[0], "id,email,subscribed_date")
+        self.assertEqual(
+            [line.split(",")[1] for line in lines[1:]], [s.email for s in selected]
+        )
+
+
 # ===== PERFORMANCE TESTS =====
 
 
@@ -2,15 +2,17 @@ from django.http import JsonResponse, HttpResponseRedirect
 from django.urls import reverse
 from django.contrib import messages
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.generic import TemplateView, ListView, DetailView
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 import json
+from collections import defaultdict
 
 # Import all models from your models.py
 from .models import (
@@ -32,11 +34,77 @@ from .models import (
 
 # Import all forms from your forms.py
 from .forms import ContactForm, NewsletterForm
+from .cache import cache_page_for_models
+from .comments import InvalidCursor, comment_page, comment_page_response
+from roshan.visitors import record_visit
 
 
 # =========================================================================
 # HOME PAGE VIEW
 # =========================================================================
+def build_skill_categories(technologies_per_category=6):
+    """
+    Build the skill category cards for the home page.
+
+    Uses one query for all skills and one for the (technology, category)
+    pairs, then groups them in Python. The query count stays the same no
+    matter how many categories or skills exist.
+    """
+    skills_by_category = defaultdict(list)
+    for skill in Skill.objects.order_by("order", "title"):
+        skills_by_category[skill.category].append(skill)
+
+    # Distinct technologies per category, in Technology's default name order
+    technologies_by_category = defaultdict(list)
+    technology_rows = (
+        Technology.objects.filter(skill__isnull=False)
+        .annotate(skill_category=F("skill__category"))
+        .order_by("name")
+        .distinct()
+    )
+    for technology in technology_rows:
+        category_technologies = technologies_by_category[technology.skill_category]
+        if len(category_technologies) < technologies_per_category:
+            category_technologies.append(technology)
+
+    skill_categories = []
+    for category_code, category_name in Skill.SKILL_CATEGORIES:
+        skills_in_category = skills_by_category.get(category_code)
+        if not skills_in_category:
+            continue
+
+        # The featured skill for this category, or its first skill
+        main_skill = next(
+            (skill for skill in skills_in_category if skill.is_featured),
+            skills_in_category[0],
+        )
+
+        skill_categories.append(
+            {
+                "code": category_code,
+                "name": category_name,
+                "skills_count": len(skills_in_category),
+                "technologies": technologies_by_category[category_code],
+                "main_skill": main_skill,  # This will be used for linking to detail page
+            }
+        )
+
+    return skill_categories
+
+
+@method_decorator(
+    cache_page_for_models(
+        Skill,
+        Technology,
+        Experience,
+        Project,
+        Achievement,
+        Category,
+        "blog.Blog",
+        "roshan.AboutMeConfiguration",
+    ),
+    name="dispatch",
+)
 class HomeView(TemplateView):
     """View for the homepage. Gathers context from multiple models."""
 
@@ -48,39 +116,7 @@ class HomeView(TemplateView):
         # =================================================================
         # NEW & UPDATED: Skill Categories for Skills Section
         # =================================================================
-        from django.db.models import Count
-
-        # Get skill categories with counts and first few technologies
-        skill_categories = []
-        for category_code, category_name in Skill.SKILL_CATEGORIES:
-            skills_in_category = Skill.objects.filter(category=category_code).order_by(
-                "order"
-            )
-            if skills_in_category.exists():
-                # Get the main/featured skill for this category or first skill
-                main_skill = (
-                    skills_in_category.filter(is_featured=True).first()
-                    or skills_in_category.first()
-                )
-
-                # Get technologies from skills in this category
-                technologies = Technology.objects.filter(
-                    skill__category=category_code
-                ).distinct()[
-                    :6
-                ]  # Limit to 6 technologies per category
-
-                skill_categories.append(
-                    {
-                        "code": category_code,
-                        "name": category_name,
-                        "skills_count": skills_in_category.count(),
-                        "technologies": technologies,
-                        "main_skill": main_skill,  # This will be used for linking to detail page
-                    }
-                )
-
-        context["skill_categories"] = skill_categories
+        context["skill_categories"] = build_skill_categories()
 
         # =================================================================
         # Fetch data for the rest of the homepage sections
@@ -100,6 +136,9 @@ class HomeView(TemplateView):
 # =========================================================================
 # PROJECT VIEWS
 # =========================================================================
+@method_decorator(
+    cache_page_for_models(Project, Category, Technology), name="dispatch"
+)
 class ProjectListView(ListView):
     """View for the main projects list page with filtering and pagination."""
 
@@ -144,29 +183,25 @@ class ProjectDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         project = self.get_object()
+        approved_comments = project.comments.filter(is_approved=True)
 
-        # Get initial 5 comments for display
-        initial_comments = project.comments.filter(is_approved=True).order_by(
-            "-created_date"
-        )[:5]
-        context["comments"] = initial_comments
-
-        # Add user's liked comments for proper state management
-        if self.request.user.is_authenticated:
-            user_liked_comments = ProjectCommentLike.objects.filter(
-                user=self.request.user, comment__in=initial_comments
-            ).values_list("comment_id", flat=True)
-            context["user_liked_comments"] = list(user_liked_comments)
-        else:
-            context["user_liked_comments"] = []
-
-        # Check if there are more comments beyond the initial 5
-        total_comments_count = project.comments.filter(is_approved=True).count()
-        context["has_more_comments"] = total_comments_count > 5
-        context["total_comments"] = total_comments_count
+        # Only the first page is rendered; the rest load by cursor
+        page = comment_page(
+            approved_comments, ProjectCommentLike, self.request.user, page_size=5
+        )
+        context["comments"] = page["comments"]
+        context["user_liked_comments"] = page["liked_ids"]
+        context["next_comment_cursor"] = page["next_cursor"]
+        context["has_more_comments"] = page["next_cursor"] is not None
+        context["total_comments"] = approved_comments.count()
 
         return context
 
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        record_visit(self.object, request)
+        return response
+
     def post(self, request, *args, **kwargs):
         # Check if user is authenticated
         if not request.user.is_authenticated:
@@ -202,43 +237,20 @@ class ProjectDetailView(DetailView):
 
 
 def load_more_project_comments(request, slug):
-    """AJAX view to load more project comments."""
+    """AJAX view returning the next page of project comments after `cursor`."""
     if request.method == "GET":
         project = get_object_or_404(Project, slug=slug)
-        offset = int(request.GET.get("offset", 0))
-
-        # Load 10 comments starting from the offset
-        comments = project.comments.filter(is_approved=True).order_by("-created_date")[
-            offset : offset + 10
-        ]
-        total_comments = project.comments.filter(is_approved=True).count()
-
-        # Get user's liked comments if authenticated
-        user_liked_comments = []
-        if request.user.is_authenticated:
-            user_liked_comments = ProjectCommentLike.objects.filter(
-                user=request.user, comment__in=comments
-            ).values_list("comment_id", flat=True)
-            user_liked_comments = list(user_liked_comments)
-
-        comments_data = []
-        for comment in comments:
-            comments_data.append(
-                {
-                    "id": comment.id,
-                    "author_name": comment.author_name,
-                    "body": comment.body,
-                    "likes": comment.total_likes,  # Use the new property
-                    "is_liked": comment.id in user_liked_comments,
-                    "created_at": comment.created_date.strftime(
-                        "%B %d, %Y at %I:%M %p"
-                    ),
-                }
+        try:
+            page = comment_page(
+                project.comments.filter(is_approved=True),
+                ProjectCommentLike,
+                request.user,
+                cursor=request.GET.get("cursor"),
             )
+        except InvalidCursor:
+            return JsonResponse({"error": "Invalid cursor"}, status=400)
 
-        return JsonResponse(
-            {"comments": comments_data, "has_more": total_comments > (offset + 10)}
-        )
+        return JsonResponse(comment_page_response(page))
 
     return JsonResponse({"error": "Invalid request"}, status=400)
 
@@ -328,7 +340,10 @@ class ContactSubmissionView(View):
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
             form = ContactForm(request.POST)
             if form.is_valid():
-                form.save()
+                # The notification outbox rows are written by a post_save
+                # signal; keep them in the submission's transaction
+                with transaction.atomic():
+                    form.save()
                 return JsonResponse(
                     {
                         "status": "success",
@@ -350,7 +365,8 @@ class ContactSubmissionView(View):
         else:
             form = ContactForm(request.POST)
             if form.is_valid():
-                form.save()
+                with transaction.atomic():
+                    form.save()
                 messages.success(
                     request, "Thank you for your message! I'll get back to you soon."
                 )
@@ -467,18 +483,28 @@ def toggle_project_comment_like(request, comment_id):
     """AJAX view to toggle like/unlike for project comments."""
     try:
         comment = get_object_or_404(ProjectComment, id=comment_id)
-        like, created = ProjectCommentLike.objects.get_or_create(
-            comment=comment, user=request.user
-        )
+        with transaction.atomic():
+            like, created = ProjectCommentLike.objects.get_or_create(
+                comment=comment, user=request.user
+            )
 
-        if not created:
-            like.delete()
-            liked = False
-        else:
-            liked = True
+            if not created:
+                # Only the request that actually removed the row decrements
+                deleted, _ = like.delete()
+                if deleted:
+                    ProjectComment.objects.filter(
+                        pk=comment.pk, likes_count__gt=0
+                    ).update(likes_count=F("likes_count") - 1)
+                liked = False
+            else:
+                ProjectComment.objects.filter(pk=comment.pk).update(
+                    likes_count=F("likes_count") + 1
+                )
+                liked = True
 
+        comment.refresh_from_db(fields=["likes_count"])
         return JsonResponse(
-            {"success": True, "liked": liked, "total_likes": comment.total_likes}
+            {"success": True, "liked": liked, "total_likes": comment.likes_count}
         )
 
     except ProjectComment.DoesNotExist:
@@ -1,12 +1,15 @@
 import csv
 from django.http import HttpResponse
 from django.contrib import admin
+from portfolio.exports import StreamingExportMixin
+from .rollups import with_recent_views
 from .models import (
     AboutMeConfiguration,
     ResourcesConfiguration,
     ResourceCategory,
     Resource,
     ResourceView,
+    ResourceViewDaily,
     SpotifyPlaylist,
     SpotifyTrack,
     SpotifyToken,
@@ -113,6 +116,7 @@ class ResourceAdmin(admin.ModelAdmin):
         "resource_type",
         "author",
         "personal_rating",
+        "recent_views",
         "is_featured",
         "is_active",
         "created_date",
@@ -162,6 +166,16 @@ class ResourceAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        # Popularity comes from the daily rollups, not the raw view table
+        return with_recent_views(super().get_queryset(request))
+
+    def recent_views(self, obj):
+        return obj.recent_views
+
+    recent_views.short_description = "Views (30 days)"
+    recent_views.admin_order_field = "recent_views"
+
     # Custom actions
     def mark_as_featured(self, request, queryset):
         queryset.update(is_featured=True)
@@ -191,15 +205,45 @@ class ResourceAdmin(admin.ModelAdmin):
     ]
 
 
+@admin.register(ResourceViewDaily)
+class ResourceViewDailyAdmin(admin.ModelAdmin):
+    """Admin for resource view analytics, read from the daily rollups."""
+
+    list_display = ("resource", "date", "views", "unique_visitors")
+    list_filter = ("date", "resource__resource_type")
+    search_fields = ("resource__title",)
+    date_hierarchy = "date"
+    ordering = ("-date", "-views")
+    list_select_related = ("resource",)
+
+    # Make it read-only since this is analytics data
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(ResourceView)
-class ResourceViewAdmin(admin.ModelAdmin):
-    """Admin for resource view analytics."""
+class ResourceViewAdmin(StreamingExportMixin, admin.ModelAdmin):
+    """Raw hits within the retention window; reports use the daily rollups."""
 
     list_display = ("resource", "viewed_date", "ip_address")
-    list_filter = ("viewed_date", "resource__resource_type")
+    list_filter = ("resource__resource_type",)
     search_fields = ("resource__title", "ip_address")
-    date_hierarchy = "viewed_date"
     ordering = ("-viewed_date",)
+    list_select_related = ("resource",)
+    # Avoid a COUNT(*) over the raw table on every page
+    show_full_result_count = False
+    actions = ["export_as_csv", "export_as_jsonl"]
+    export_fields = (
+        "id",
+        "resource_id",
+        "resource__title",
+        "viewed_date",
+        "ip_address",
+        "user_agent",
+    )
 
     # Make it read-only since this is analytics data
     def has_add_permission(self, request):
@@ -1,6 +1,16 @@
+import atexit
+
 from django.apps import AppConfig
 
 
 class RoshanConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'roshan'
+
+    def ready(self):
+        from . import view_recorder, visitors
+
+        # Write buffered resource views and visitor sketches before the
+        # worker exits
+        atexit.register(view_recorder.flush_on_shutdown)
+        atexit.register(visitors.flush_on_shutdown)
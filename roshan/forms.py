@@ -9,6 +9,7 @@ class ResourceFilterForm(forms.Form):
         ("newest", "Newest First"),
         ("oldest", "Oldest First"),
         ("rating", "Highest Rated"),
+        ("popular", "Most Viewed"),
         ("title", "Title A-Z"),
     ]
 
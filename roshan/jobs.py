@@ -0,0 +1,24 @@
+"""Scheduled jobs for the roshan app (see scheduler.registry)."""
+
+from scheduler.registry import job
+
+from .models import SpotifyToken
+from .rollups import prune_raw_views, rollup_pending
+
+
+@job("0 */6 * * *", timeout=900)
+def sync_spotify_playlists():
+    """Refresh the Spotify playlists the admin sync button would fetch."""
+    from .views import sync_all_playlists
+
+    if not SpotifyToken.objects.exists():
+        return "Spotify is not connected; skipped"
+    return f"Synced {sync_all_playlists()} playlists"
+
+
+@job("15 1 * * *")
+def rollup_resource_views():
+    """Same work as `manage.py rollup_resource_views`."""
+    rolled = rollup_pending()
+    deleted = prune_raw_views()
+    return f"Rolled up {len(rolled)} days, pruned {deleted} raw views"
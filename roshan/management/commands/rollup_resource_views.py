@@ -0,0 +1,37 @@
+"""
+Django management command to roll up raw resource views into daily totals
+"""
+from django.core.management.base import BaseCommand
+
+from roshan.rollups import prune_raw_views, rollup_pending
+
+
+class Command(BaseCommand):
+    help = 'Aggregate ResourceView rows into daily rollups and prune old raw rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-prune',
+            action='store_true',
+            help='Only build rollups; keep every raw row',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='Days of raw rows to keep (default: RESOURCE_VIEW_RETENTION_DAYS)',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('📊 Rolling up resource views...')
+        rolled = rollup_pending()
+        for day, rows in rolled.items():
+            self.stdout.write(f"  ✅ {day}: {rows} resources")
+        if not rolled:
+            self.stdout.write('  No views to roll up')
+
+        if not options['no_prune']:
+            self.stdout.write('\n🧹 Pruning raw views...')
+            deleted = prune_raw_views(retention_days=options['retention_days'])
+            self.stdout.write(f"  🗑️  Deleted {deleted} raw rows")
+
+        self.stdout.write(self.style.SUCCESS('\n✨ Resource view rollup complete'))
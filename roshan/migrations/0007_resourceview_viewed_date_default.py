@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roshan', '0006_alter_aboutmeconfiguration_profile_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resourceview',
+            name='viewed_date',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roshan', '0007_resourceview_viewed_date_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('unique_visitors', models.PositiveIntegerField(default=0, help_text='Distinct IP addresses that day')),
+            ],
+            options={
+                'verbose_name': 'Resource View (Daily)',
+                'verbose_name_plural': 'Resource Views (Daily)',
+                'ordering': ['-date', '-views'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='resourceview',
+            index=models.Index(fields=['viewed_date'], name='resource_view_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='resourceviewdaily',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='roshan.resource'),
+        ),
+        migrations.AddIndex(
+            model_name='resourceviewdaily',
+            index=models.Index(fields=['date'], name='resource_view_daily_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='resourceviewdaily',
+            constraint=models.UniqueConstraint(fields=('resource', 'date'), name='unique_resource_view_day'),
+        ),
+    ]
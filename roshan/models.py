@@ -1,3 +1,5 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.text import slugify
 from django.utils import timezone
@@ -378,18 +380,81 @@ class ResourceView(models.Model):
     resource = models.ForeignKey(
         Resource, on_delete=models.CASCADE, related_name="views"
     )
-    viewed_date = models.DateTimeField(auto_now_add=True)
+    # Set when the hit happens, not when the buffered row is written
+    viewed_date = models.DateTimeField(default=timezone.now, editable=False)
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     user_agent = models.TextField(blank=True)
 
     class Meta:
         verbose_name = "Resource View"
         verbose_name_plural = "Resource Views"
+        indexes = [
+            # Rollups and retention both scan by date
+            models.Index(fields=["viewed_date"], name="resource_view_date_idx"),
+        ]
 
     def __str__(self):
         return f"View of {self.resource.title} on {self.viewed_date.date()}"
 
 
+class ResourceViewDaily(models.Model):
+    """
+    Per-resource, per-day rollup of ResourceView rows.
+
+    Built by `manage.py rollup_resource_views`; raw rows older than
+    RESOURCE_VIEW_RETENTION_DAYS are deleted once their day is rolled up.
+    """
+
+    resource = models.ForeignKey(
+        Resource, on_delete=models.CASCADE, related_name="daily_views"
+    )
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    unique_visitors = models.PositiveIntegerField(
+        default=0, help_text="Distinct IP addresses that day"
+    )
+
+    class Meta:
+        verbose_name = "Resource View (Daily)"
+        verbose_name_plural = "Resource Views (Daily)"
+        ordering = ["-date", "-views"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["resource", "date"], name="unique_resource_view_day"
+            ),
+        ]
+        indexes = [models.Index(fields=["date"], name="resource_view_daily_date_idx")]
+
+    def __str__(self):
+        return f"{self.resource.title} on {self.date}: {self.views} views"
+
+
+class VisitorSketch(models.Model):
+    """
+    HyperLogLog sketch of the visitors to one object (resource, blog post,
+    project...) on one day. See roshan.visitors for recording and counting.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    content_object = GenericForeignKey("content_type", "object_id")
+    date = models.DateField()
+    registers = models.BinaryField()
+
+    class Meta:
+        verbose_name = "Visitor Sketch"
+        verbose_name_plural = "Visitor Sketches"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "date"],
+                name="unique_visitor_sketch_day",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Visitors of {self.content_type.model} #{self.object_id} on {self.date}"
+
+
 # =========================================================================
 # SPOTIFY/MUSIC MODELS (from music app)
 # =========================================================================
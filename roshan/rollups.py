@@ -0,0 +1,145 @@
+"""
+Daily rollups and retention for ResourceView analytics.
+
+Raw ResourceView rows are aggregated into one ResourceViewDaily row per
+resource and day (views and distinct IPs). Reports and popularity sorting
+read the rollups; raw rows are kept for RESOURCE_VIEW_RETENTION_DAYS and
+then deleted in chunks so a prune never holds a long lock on MySQL.
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from portfolio.cache import invalidate_pages_for_model
+
+from .models import ResourceView, ResourceViewDaily
+
+logger = logging.getLogger(__name__)
+
+
+def _day_bounds(day):
+    """Aware [start, end) datetimes of a local calendar day."""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def rollup_day(day):
+    """(Re)build the rollup rows for one day; returns the number of rows."""
+    start, end = _day_bounds(day)
+    totals = (
+        ResourceView.objects.filter(viewed_date__gte=start, viewed_date__lt=end)
+        .values("resource")
+        .annotate(views=Count("id"), unique_visitors=Count("ip_address", distinct=True))
+    )
+    rows = [
+        ResourceViewDaily(
+            resource_id=total["resource"],
+            date=day,
+            views=total["views"],
+            unique_visitors=total["unique_visitors"],
+        )
+        for total in totals
+    ]
+    if connection.features.supports_update_conflicts_with_target:
+        ResourceViewDaily.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["resource", "date"],
+            update_fields=["views", "unique_visitors"],
+        )
+    else:
+        # MySQL cannot name the conflict target, so replace the day's rows
+        with transaction.atomic():
+            ResourceViewDaily.objects.filter(date=day).delete()
+            ResourceViewDaily.objects.bulk_create(rows)
+    # bulk_create sends no post_save, so the "popular" pages are not evicted
+    # by the page cache's signal handlers
+    transaction.on_commit(lambda: invalidate_pages_for_model(ResourceViewDaily))
+    return len(rows)
+
+
+def rollup_pending(today=None):
+    """
+    Roll up every day that may have changed since the last run.
+
+    The latest rolled-up day and the one before it are always rebuilt: the
+    latest may have been partial, and buffered hits can land a little after
+    midnight with the previous day's timestamp.
+    """
+    today = today or timezone.localdate()
+    latest = ResourceViewDaily.objects.order_by("-date").values_list(
+        "date", flat=True
+    ).first()
+    if latest:
+        day = latest - timedelta(days=1)
+    else:
+        first_view = ResourceView.objects.order_by("viewed_date").values_list(
+            "viewed_date", flat=True
+        ).first()
+        if first_view is None:
+            return {}
+        day = timezone.localtime(first_view).date()
+
+    rolled = {}
+    while day <= today:
+        rolled[day] = rollup_day(day)
+        day += timedelta(days=1)
+    return rolled
+
+
+def prune_raw_views(retention_days=None, chunk_size=None):
+    """
+    Delete raw views older than the retention window, in chunks.
+
+    Only days that are already rolled up (and will not be rebuilt by
+    rollup_pending) are pruned, so the rollups never lose hits.
+    """
+    if retention_days is None:
+        retention_days = getattr(settings, "RESOURCE_VIEW_RETENTION_DAYS", 90)
+    chunk_size = chunk_size or getattr(settings, "RESOURCE_VIEW_DELETE_CHUNK", 1000)
+
+    latest = ResourceViewDaily.objects.order_by("-date").values_list(
+        "date", flat=True
+    ).first()
+    if latest is None:
+        return 0
+
+    retention_start, _ = _day_bounds(
+        timezone.localdate() - timedelta(days=max(retention_days, 1))
+    )
+    rebuild_start, _ = _day_bounds(latest - timedelta(days=1))
+    cutoff = min(retention_start, rebuild_start)
+
+    deleted = 0
+    while True:
+        chunk = list(
+            ResourceView.objects.filter(viewed_date__lt=cutoff).values_list(
+                "pk", flat=True
+            )[:chunk_size]
+        )
+        if not chunk:
+            break
+        count, _ = ResourceView.objects.filter(pk__in=chunk).delete()
+        deleted += count
+
+    if deleted:
+        logger.info(f"Pruned {deleted} raw resource views older than {cutoff}")
+    return deleted
+
+
+def with_recent_views(queryset, days=30):
+    """Annotate resources with `recent_views` summed from the daily rollups."""
+    since = timezone.localdate() - timedelta(days=days)
+    recent = (
+        ResourceViewDaily.objects.filter(resource=OuterRef("pk"), date__gte=since)
+        .values("resource")
+        .annotate(total=Sum("views"))
+        .values("total")
+    )
+    return queryset.annotate(recent_views=Coalesce(Subquery(recent), 0))
@@ -5,7 +5,7 @@ Tests resource management, personal content, and related functionality.
 
 import json
 from unittest.mock import Mock, patch
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
@@ -529,6 +529,359 @@ class RoshanUtilityTest(BaseTestCase):
             pass
 
 
+# ===== RESOURCE VIEW RECORDING TESTS =====
+
+BROWSER_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/126.0"
+
+
+@pytest.mark.unit
+class ResourceViewRecorderTest(TestCase):
+    """Test buffered, batched ResourceView recording."""
+
+    def setUp(self):
+        self.resource = Resource.objects.create(
+            title="Buffered Resource", description="<p>Description</p>"
+        )
+
+    def make_recorder(self, **kwargs):
+        from roshan.view_recorder import ResourceViewRecorder
+
+        options = {"batch_size": 3, "flush_interval": 3600, "max_buffer": 10}
+        options.update(kwargs)
+        return ResourceViewRecorder(**options)
+
+    def test_flushes_in_one_batch_at_size_threshold(self):
+        """Hits are buffered until the batch is full, then bulk inserted."""
+        recorder = self.make_recorder()
+
+        with self.assertNumQueries(0):
+            recorder.record(self.resource.pk, "10.0.0.1", BROWSER_UA)
+            recorder.record(self.resource.pk, "10.0.0.2", BROWSER_UA)
+        self.assertEqual(ResourceView.objects.count(), 0)
+
+        # One lookup of live resources plus one INSERT for the batch
+        with self.assertNumQueries(2):
+            recorder.record(self.resource.pk, "10.0.0.3", BROWSER_UA)
+        self.assertEqual(ResourceView.objects.count(), 3)
+        self.assertEqual(recorder.pending(), 0)
+
+    def test_flushes_at_time_threshold(self):
+        """A hit arriving after the flush interval writes the buffer."""
+        recorder = self.make_recorder(flush_interval=60)
+        with patch("roshan.view_recorder.time.monotonic", return_value=1000):
+            recorder.record(self.resource.pk, "10.0.0.1", BROWSER_UA)
+        with patch("roshan.view_recorder.time.monotonic", return_value=1061):
+            recorder.record(self.resource.pk, "10.0.0.2", BROWSER_UA)
+
+        self.assertEqual(ResourceView.objects.count(), 2)
+
+    def test_bots_and_overflow_are_dropped_and_counted(self):
+        """Crawlers never reach the buffer and a full buffer sheds hits."""
+        recorder = self.make_recorder(batch_size=100, max_buffer=2)
+
+        self.assertFalse(recorder.record(self.resource.pk, "10.0.0.1", "Googlebot/2.1"))
+        self.assertFalse(recorder.record(self.resource.pk, "10.0.0.1", ""))
+        for _ in range(3):
+            recorder.record(self.resource.pk, "10.0.0.1", BROWSER_UA)
+
+        stats = recorder.stats()
+        self.assertEqual(stats["dropped_bots"], 2)
+        self.assertEqual(stats["dropped_overflow"], 1)
+        self.assertEqual(stats["pending"], 2)
+        self.assertEqual(stats["dropped"], 3)
+
+    def test_flush_skips_deleted_resources(self):
+        """Hits for a resource deleted before the flush are discarded."""
+        recorder = self.make_recorder(batch_size=100)
+        other = Resource.objects.create(
+            title="Short Lived", description="<p>Description</p>"
+        )
+        recorder.record(self.resource.pk, "10.0.0.1", BROWSER_UA)
+        recorder.record(other.pk, "10.0.0.1", BROWSER_UA)
+        other.delete()
+
+        self.assertEqual(recorder.flush(), 1)
+        self.assertEqual(recorder.stats()["dropped_errors"], 1)
+        self.assertEqual(ResourceView.objects.get().resource, self.resource)
+
+    def test_failed_flush_does_not_reach_the_request(self):
+        """Any error from the size-triggered flush is logged, not raised."""
+        recorder = self.make_recorder(batch_size=1)
+
+        with patch.object(
+            ResourceView.objects, "bulk_create", side_effect=ValueError("bad row")
+        ), self.assertLogs("roshan.view_recorder", level="ERROR"):
+            self.assertTrue(recorder.record(self.resource.pk, "10.0.0.1", BROWSER_UA))
+
+        self.assertEqual(recorder.stats()["dropped_errors"], 1)
+        self.assertEqual(recorder.pending(), 0)
+
+    def test_detail_view_records_through_buffer(self):
+        """The detail page buffers the hit instead of inserting it."""
+        from roshan.view_recorder import recorder
+
+        recorder.clear()
+        response = self.client.get(
+            reverse("roshan:resource_detail", args=[self.resource.slug]),
+            HTTP_USER_AGENT=BROWSER_UA,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(recorder.pending(), 1)
+        self.assertEqual(recorder.flush(), 1)
+        self.assertEqual(ResourceView.objects.count(), 1)
+
+
+@pytest.mark.unit
+class ResourceViewRollupTest(TestCase):
+    """Test daily rollups, retention and rollup-based popularity."""
+
+    def setUp(self):
+        self.resource = Resource.objects.create(
+            title="Rolled Resource", description="<p>Description</p>"
+        )
+        self.today = timezone.localdate()
+
+    def add_views(self, resource, days_ago, ips):
+        from datetime import timedelta
+
+        viewed = timezone.now() - timedelta(days=days_ago)
+        ResourceView.objects.bulk_create(
+            [
+                ResourceView(resource=resource, ip_address=ip, viewed_date=viewed)
+                for ip in ips
+            ]
+        )
+
+    def test_rollup_counts_views_and_unique_ips(self):
+        """Each day gets view and distinct-IP totals, rebuilt idempotently."""
+        from roshan.rollups import rollup_pending
+
+        self.add_views(self.resource, 1, ["10.0.0.1", "10.0.0.1", "10.0.0.2"])
+        self.add_views(self.resource, 0, ["10.0.0.3"])
+
+        rollup_pending()
+        rollup_pending()
+
+        daily = ResourceViewDaily.objects.filter(resource=self.resource)
+        self.assertEqual(
+            sorted(daily.values_list("views", "unique_visitors")), [(1, 1), (3, 2)]
+        )
+
+    def test_rollup_without_conflict_target_replaces_the_day(self):
+        """Backends like MySQL rebuild a day by deleting and re-inserting it."""
+        from unittest.mock import patch
+
+        from django.db import connection
+        from roshan.rollups import rollup_day
+
+        self.add_views(self.resource, 0, ["10.0.0.1"])
+        rollup_day(self.today)
+        self.add_views(self.resource, 0, ["10.0.0.2", "10.0.0.2"])
+
+        with patch.object(
+            connection.features, "supports_update_conflicts_with_target", False
+        ):
+            self.assertEqual(rollup_day(self.today), 1)
+
+        daily = ResourceViewDaily.objects.get(resource=self.resource)
+        self.assertEqual((daily.views, daily.unique_visitors), (3, 2))
+
+    def test_rollup_evicts_dependent_pages_on_commit(self):
+        """The cached "popular" pages are orphaned once the rollup commits."""
+        from django.core.cache import cache
+        from portfolio.cache import _page_version_key
+        from roshan.rollups import rollup_day
+
+        self.add_views(self.resource, 0, ["10.0.0.1"])
+        key = _page_version_key(ResourceViewDaily)
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+        with override_settings(CACHES=locmem):
+            cache.set(key, 1, None)
+            with self.captureOnCommitCallbacks() as callbacks:
+                rollup_day(self.today)
+                self.assertEqual(cache.get(key), 1)
+
+            for callback in callbacks:
+                callback()
+            self.assertNotEqual(cache.get(key), 1)
+
+    def test_prune_deletes_only_old_rolled_up_rows_in_chunks(self):
+        """Raw rows past retention go; rollups and recent rows stay."""
+        from django.db.models import Sum
+        from roshan.rollups import prune_raw_views, rollup_pending
+
+        self.add_views(self.resource, 40, [f"10.0.0.{i}" for i in range(5)])
+        self.add_views(self.resource, 1, ["10.0.1.1"])
+        rollup_pending()
+
+        deleted = prune_raw_views(retention_days=30, chunk_size=2)
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(ResourceView.objects.count(), 1)
+        self.assertEqual(
+            ResourceViewDaily.objects.aggregate(total=Sum("views"))["total"], 6
+        )
+
+    def test_prune_without_rollups_keeps_everything(self):
+        """Nothing is deleted before it has been rolled up."""
+        from roshan.rollups import prune_raw_views
+
+        self.add_views(self.resource, 400, ["10.0.0.1"])
+        self.assertEqual(prune_raw_views(retention_days=30), 0)
+        self.assertEqual(ResourceView.objects.count(), 1)
+
+    def test_popular_sort_reads_rollups(self):
+        """Most viewed ordering uses the recent rollup totals."""
+        popular = Resource.objects.create(
+            title="Popular Resource", description="<p>Description</p>"
+        )
+        ResourceViewDaily.objects.create(
+            resource=popular, date=self.today, views=50, unique_visitors=20
+        )
+        ResourceViewDaily.objects.create(
+            resource=self.resource, date=self.today, views=5, unique_visitors=5
+        )
+
+        response = self.client.get(reverse("roshan:resources"), {"sort": "popular"})
+        self.assertEqual(
+            [resource.title for resource in response.context["resources"]],
+            ["Popular Resource", "Rolled Resource"],
+        )
+
+    def test_command_rolls_up_and_prunes(self):
+        """rollup_resource_views builds rollups and reports what it pruned."""
+        from io import StringIO
+        from django.core.management import call_command
+
+        self.add_views(self.resource, 200, ["10.0.0.1"])
+        self.add_views(self.resource, 0, ["10.0.0.2"])
+
+        out = StringIO()
+        call_command("rollup_resource_views", stdout=out)
+
+        self.assertTrue(ResourceViewDaily.objects.exists())
+        self.assertEqual(ResourceView.objects.count(), 1)
+        self.assertIn("Deleted 1 raw rows", out.getvalue())
+
+
+@pytest.mark.unit
+class HyperLogLogTest(TestCase):
+    """Test the HyperLogLog sketch used for unique visitors."""
+
+    def test_estimate_within_error_bound(self):
+        """10k distinct values are estimated within 5%."""
+        from roshan.hyperloglog import HyperLogLog
+
+        sketch = HyperLogLog()
+        for index in range(10000):
+            sketch.add(f"192.0.2.{index}")
+            sketch.add(f"192.0.2.{index}")  # duplicates do not count
+
+        self.assertAlmostEqual(sketch.count(), 10000, delta=500)
+        self.assertEqual(len(sketch.to_bytes()), 4096)
+
+    def test_merge_is_union_and_round_trips(self):
+        """Merging two sketches estimates the size of the union."""
+        from roshan.hyperloglog import HyperLogLog
+
+        first, second = HyperLogLog(), HyperLogLog()
+        for index in range(300):
+            first.add(index)
+        for index in range(200, 500):
+            second.add(index)
+
+        merged = HyperLogLog.from_bytes(first.to_bytes()).merge(second)
+        self.assertAlmostEqual(merged.count(), 500, delta=25)
+        with self.assertRaises(ValueError):
+            first.merge(HyperLogLog(precision=10))
+
+
+@pytest.mark.unit
+class UniqueVisitorsTest(TestCase):
+    """Test recording and counting unique visitors per object."""
+
+    def setUp(self):
+        self.resource = Resource.objects.create(
+            title="Visited Resource", description="<p>Description</p>"
+        )
+
+    def test_sketches_merge_across_workers_and_days(self):
+        """Two workers' sketches for the same day merge in the database."""
+        from datetime import timedelta
+        from roshan.visitors import VisitorSketchBuffer, unique_visitors
+
+        worker_a = VisitorSketchBuffer(batch_size=1000)
+        worker_b = VisitorSketchBuffer(batch_size=1000)
+        for index in range(40):
+            worker_a.observe(self.resource, f"10.0.0.{index}")
+        for index in range(20, 60):
+            worker_b.observe(self.resource, f"10.0.0.{index}")
+        worker_a.flush()
+        worker_b.flush()
+
+        self.assertEqual(VisitorSketch.objects.count(), 1)
+        self.assertAlmostEqual(unique_visitors(self.resource), 60, delta=3)
+
+        old = VisitorSketch.objects.get()
+        old.date -= timedelta(days=10)
+        old.save()
+        since = timezone.localdate() - timedelta(days=7)
+        self.assertEqual(unique_visitors(self.resource, since=since), 0)
+
+    def test_detail_view_records_visitor_and_skips_bots(self):
+        """Resource pages count browsers, not crawlers."""
+        from roshan.view_recorder import recorder
+        from roshan.visitors import buffer, unique_visitors
+
+        buffer.clear()
+        url = reverse("roshan:resource_detail", args=[self.resource.slug])
+        self.client.get(url, HTTP_USER_AGENT=BROWSER_UA, REMOTE_ADDR="10.1.1.1")
+        self.client.get(url, HTTP_USER_AGENT=BROWSER_UA, REMOTE_ADDR="10.1.1.1")
+        self.client.get(url, HTTP_USER_AGENT=BROWSER_UA, REMOTE_ADDR="10.1.1.2")
+        self.client.get(url, HTTP_USER_AGENT="Bingbot/2.0", REMOTE_ADDR="10.1.1.3")
+
+        # Pending sketches in this process are included before a flush
+        self.assertEqual(unique_visitors(self.resource), 2)
+        buffer.flush()
+        self.assertEqual(unique_visitors(self.resource), 2)
+        recorder.clear()
+
+    def test_malformed_sketch_does_not_fail_the_flush(self):
+        """A corrupt stored row is logged and the other sketches still merge."""
+        from django.contrib.contenttypes.models import ContentType
+        from roshan.visitors import VisitorSketchBuffer
+
+        other = Resource.objects.create(
+            title="Other Resource", description="<p>Description</p>"
+        )
+        VisitorSketch.objects.create(
+            content_type=ContentType.objects.get_for_model(Resource),
+            object_id=self.resource.pk,
+            date=timezone.localdate(),
+            registers=b"broken",
+        )
+        worker = VisitorSketchBuffer(batch_size=1000)
+        worker.observe(self.resource, "10.0.0.1")
+        worker.observe(other, "10.0.0.2")
+
+        with self.assertLogs("roshan.visitors", level="ERROR"):
+            self.assertEqual(worker.flush(), 1)
+        self.assertTrue(VisitorSketch.objects.filter(object_id=other.pk).exists())
+
+    def test_forwarded_client_ip_is_used(self):
+        """The first X-Forwarded-For hop identifies the visitor."""
+        from django.test import RequestFactory
+        from roshan.view_recorder import get_client_ip
+
+        request = RequestFactory().get(
+            "/", HTTP_X_FORWARDED_FOR="203.0.113.7, 10.0.0.1", REMOTE_ADDR="10.0.0.1"
+        )
+        self.assertEqual(get_client_ip(request), "203.0.113.7")
+        self.assertEqual(get_client_ip(RequestFactory().get("/")), "127.0.0.1")
+
+
 # ===== ROSHAN INTEGRATION TESTS =====
 
 
@@ -0,0 +1,170 @@
+"""
+Buffered recording of ResourceView rows.
+
+Resource detail pages used to INSERT one ResourceView per GET, which under a
+crawler burst meant one write transaction per hit. Hits are now appended to
+a per-process buffer and written with a single bulk_create() once the buffer
+reaches RESOURCE_VIEW_BATCH_SIZE rows or the oldest buffered hit is older
+than RESOURCE_VIEW_FLUSH_INTERVAL seconds. Known bots are dropped before
+they reach the buffer, and whatever is left is flushed when the process
+exits.
+
+A quiet worker can hold up to BATCH_SIZE - 1 hits until its next hit or
+shutdown; call flush() (e.g. from a scheduled job) for tighter reporting.
+"""
+
+import logging
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BOT_PATTERN = (
+    r"bot|crawl|spider|slurp|facebookexternalhit|embedly|preview|"
+    r"curl|wget|python-requests|httpx|headless|lighthouse|pingdom|uptime"
+)
+
+
+class ResourceViewRecorder:
+    """Per-process buffer of ResourceView rows, flushed in batches."""
+
+    def __init__(self, batch_size=None, flush_interval=None, max_buffer=None):
+        self.batch_size = batch_size or getattr(
+            settings, "RESOURCE_VIEW_BATCH_SIZE", 50
+        )
+        self.flush_interval = flush_interval or getattr(
+            settings, "RESOURCE_VIEW_FLUSH_INTERVAL", 30
+        )
+        self.max_buffer = max_buffer or getattr(
+            settings, "RESOURCE_VIEW_MAX_BUFFER", 5000
+        )
+        self.bot_pattern = re.compile(
+            getattr(settings, "RESOURCE_VIEW_BOT_PATTERN", DEFAULT_BOT_PATTERN),
+            re.IGNORECASE,
+        )
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._oldest = None
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped_bots = 0
+        self.dropped_overflow = 0
+        self.dropped_errors = 0
+
+    def is_bot(self, user_agent):
+        # Browsers always send a user agent; an empty one is a script
+        return not user_agent or bool(self.bot_pattern.search(user_agent))
+
+    def record(self, resource_id, ip_address, user_agent):
+        """Buffer one hit; returns False if the hit was dropped."""
+        if self.is_bot(user_agent):
+            with self._lock:
+                self.dropped_bots += 1
+            return False
+
+        from .models import ResourceView
+
+        view = ResourceView(
+            resource_id=resource_id,
+            ip_address=ip_address,
+            user_agent=user_agent[:500],
+            viewed_date=timezone.now(),
+        )
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                # The database is not keeping up; shed load instead of memory
+                self.dropped_overflow += 1
+                return False
+            self._buffer.append(view)
+            self.recorded += 1
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            due = len(self._buffer) >= self.batch_size or (
+                time.monotonic() - self._oldest >= self.flush_interval
+            )
+
+        if due:
+            self.flush()
+        return True
+
+    def flush(self):
+        """Write every buffered hit with one bulk_create; returns rows written."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._oldest = None
+        if not batch:
+            return 0
+
+        from .models import Resource, ResourceView
+
+        try:
+            # A resource deleted since the hit would fail the whole batch
+            live_ids = set(
+                Resource.objects.filter(
+                    pk__in={view.resource_id for view in batch}
+                ).values_list("pk", flat=True)
+            )
+            rows = [view for view in batch if view.resource_id in live_ids]
+            ResourceView.objects.bulk_create(rows, batch_size=self.batch_size)
+        except Exception as e:
+            # Size- and time-triggered flushes run in the visitor's request;
+            # losing a batch of hits must not turn the page into a 500
+            logger.error(f"Dropped {len(batch)} resource views: {e}", exc_info=True)
+            with self._lock:
+                self.dropped_errors += len(batch)
+            return 0
+
+        with self._lock:
+            self.flushed += len(rows)
+            self.dropped_errors += len(batch) - len(rows)
+        return len(rows)
+
+    def clear(self):
+        """Discard buffered hits without writing them (used by tests)."""
+        with self._lock:
+            self._buffer = []
+            self._oldest = None
+
+    def pending(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def stats(self):
+        """Counters for this process since it started."""
+        with self._lock:
+            return {
+                "recorded": self.recorded,
+                "flushed": self.flushed,
+                "pending": len(self._buffer),
+                "dropped_bots": self.dropped_bots,
+                "dropped_overflow": self.dropped_overflow,
+                "dropped_errors": self.dropped_errors,
+                "dropped": self.dropped_bots
+                + self.dropped_overflow
+                + self.dropped_errors,
+            }
+
+
+def get_client_ip(request):
+    """Client IP address, taking the first X-Forwarded-For hop if present."""
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+recorder = ResourceViewRecorder()
+
+
+def flush_on_shutdown():
+    """atexit hook registered by RoshanConfig.ready()."""
+    try:
+        written = recorder.flush()
+        if written:
+            logger.info(f"Flushed {written} resource views on shutdown")
+    except Exception as e:
+        logger.error(f"Could not flush resource views on shutdown: {e}")
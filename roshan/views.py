@@ -11,6 +11,7 @@ from django.views.generic import TemplateView, ListView, DetailView
 from django.views import View
 from django.utils import timezone
 from django.db.models import Q
+from django.utils.decorators import method_decorator
 from django.core.paginator import Paginator
 from datetime import timedelta
 
@@ -19,7 +20,7 @@ from .models import (
     ResourcesConfiguration,
     ResourceCategory,
     Resource,
-    ResourceView,
+    ResourceViewDaily,
     SpotifyPlaylist,
     SpotifyTrack,
     SpotifyToken,
@@ -27,6 +28,10 @@ from .models import (
     ManualTrack,
 )
 from .forms import ResourceFilterForm, ManualPlaylistForm, ManualTrackForm
+from .rollups import with_recent_views
+from .view_recorder import get_client_ip, recorder as view_recorder
+from .visitors import record_visit
+from portfolio.cache import cache_page_for_models
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +67,16 @@ class AboutMeView(TemplateView):
 # =========================================================================
 
 
+@method_decorator(
+    cache_page_for_models(
+        Resource,
+        ResourceCategory,
+        ResourcesConfiguration,
+        ResourceViewDaily,
+        "portfolio.Technology",
+    ),
+    name="dispatch",
+)
 class ResourcesListView(ListView):
     """View for the resources list page with filtering and pagination."""
 
@@ -98,6 +113,10 @@ class ResourcesListView(ListView):
             queryset = queryset.order_by("created_date")
         elif sort_by == "rating":
             queryset = queryset.order_by("-personal_rating", "-created_date")
+        elif sort_by == "popular":
+            queryset = with_recent_views(queryset).order_by(
+                "-recent_views", "-created_date"
+            )
         elif sort_by == "title":
             queryset = queryset.order_by("title")
         else:  # newest
@@ -143,22 +162,22 @@ class ResourceDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        resource = self.get_object()
 
         # Get related resources
-        context["related_resources"] = self._get_related_resources(resource)
+        context["related_resources"] = self._get_related_resources(self.object)
 
         return context
 
     def get(self, request, *args, **kwargs):
-        # Record view
-        resource = self.get_object()
-        ResourceView.objects.create(
-            resource=resource,
-            ip_address=self._get_client_ip(request),
-            user_agent=request.META.get("HTTP_USER_AGENT", "")[:500],
+        response = super().get(request, *args, **kwargs)
+        # Record view (buffered; written in batches by the recorder)
+        view_recorder.record(
+            self.object.pk,
+            get_client_ip(request),
+            request.META.get("HTTP_USER_AGENT", ""),
         )
-        return super().get(request, *args, **kwargs)
+        record_visit(self.object, request)
+        return response
 
     def _get_related_resources(self, resource):
         """Get related resources based on categories and technologies."""
@@ -178,15 +197,6 @@ class ResourceDetailView(DetailView):
         except Exception:
             return Resource.objects.none()
 
-    def _get_client_ip(self, request):
-        """Get client IP address from request."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        return ip
-
 
 # =========================================================================
 # MUSIC/PLAYLIST VIEWS
@@ -646,26 +656,7 @@ def sync_playlists(request):
         return JsonResponse({"success": False, "error": "Method not allowed"})
 
     try:
-        token = get_valid_token()
-        if not token:
-            return JsonResponse(
-                {"success": False, "error": "No valid Spotify token available"}
-            )
-
-        # Fetch playlists from Spotify
-        playlists_data = fetch_spotify_playlists(token.access_token)
-
-        if not playlists_data:
-            return JsonResponse(
-                {"success": False, "error": "Failed to fetch playlists from Spotify"}
-            )
-
-        synced_count = 0
-        for playlist_data in playlists_data.get("items", []):
-            playlist, created = sync_single_playlist(playlist_data, token.access_token)
-            if playlist:
-                synced_count += 1
-
+        synced_count = sync_all_playlists()
         return JsonResponse(
             {
                 "success": True,
@@ -674,6 +665,8 @@ def sync_playlists(request):
             }
         )
 
+    except SpotifySyncError as e:
+        return JsonResponse({"success": False, "error": str(e)})
     except Exception as e:
         logger.error(f"Error syncing playlists: {e}")
         return JsonResponse({"success": False, "error": str(e)})
@@ -684,6 +677,31 @@ def sync_playlists(request):
 # =========================================================================
 
 
+class SpotifySyncError(Exception):
+    """Playlists could not be fetched (no valid token, or the API failed)."""
+
+
+def sync_all_playlists():
+    """
+    Fetch the connected account's playlists and store them; returns how many
+    were synced. Used by the admin sync button and the scheduled sync job.
+    """
+    token = get_valid_token()
+    if not token:
+        raise SpotifySyncError("No valid Spotify token available")
+
+    playlists_data = fetch_spotify_playlists(token.access_token)
+    if not playlists_data:
+        raise SpotifySyncError("Failed to fetch playlists from Spotify")
+
+    synced_count = 0
+    for playlist_data in playlists_data.get("items", []):
+        playlist, created = sync_single_playlist(playlist_data, token.access_token)
+        if playlist:
+            synced_count += 1
+    return synced_count
+
+
 def exchange_code_for_tokens(code):
     """Exchange authorization code for access and refresh tokens"""
     token_url = "https://accounts.spotify.com/api/token"
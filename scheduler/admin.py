@@ -0,0 +1,47 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import JobRun, ScheduledJob
+
+
+@admin.register(ScheduledJob)
+class ScheduledJobAdmin(admin.ModelAdmin):
+    """Job state written by run_scheduler; only the next run time is editable."""
+
+    list_display = ('name', 'schedule', 'next_run_at', 'last_run_at', 'last_status', 'locked_by')
+    list_filter = ('last_status',)
+    readonly_fields = ('name', 'schedule', 'locked_by', 'locked_until', 'last_run_at', 'last_status')
+    actions = ['run_soon']
+
+    def has_add_permission(self, request):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        # The scheduler may hold the lock meanwhile; don't write its columns back
+        if change:
+            obj.save(update_fields=['next_run_at'])
+        else:
+            super().save_model(request, obj, form, change)
+
+    @admin.action(description="▶️ Run selected jobs on the next scheduler tick")
+    def run_soon(self, request, queryset):
+        updated = queryset.update(next_run_at=timezone.now())
+        self.message_user(request, f"{updated} jobs will run on the next tick.")
+
+
+@admin.register(JobRun)
+class JobRunAdmin(admin.ModelAdmin):
+    list_display = ('job_name', 'status', 'started_at', 'duration_ms', 'host')
+    list_filter = ('status', 'job_name')
+    search_fields = ('job_name', 'result', 'error')
+    date_hierarchy = 'started_at'
+    readonly_fields = (
+        'job_name', 'status', 'host', 'started_at', 'finished_at',
+        'duration_ms', 'result', 'error',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
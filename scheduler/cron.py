@@ -0,0 +1,101 @@
+"""
+Minimal cron expression parsing for scheduled jobs.
+
+Supports the five standard fields (minute, hour, day of month, month, day
+of week, with 0 or 7 for Sunday), each as ``*``, a number, a range
+``a-b``, a step ``*/n`` or ``a-b/n``, or a comma separated list of those,
+plus the ``@hourly``, ``@daily``, ``@weekly`` and ``@monthly`` shortcuts.
+As in cron, when both day fields are restricted a day matching either one
+matches. Schedules are evaluated in the project's TIME_ZONE.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# (lowest, highest) value of each field
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+# Longest gap between two matches of a valid expression (Feb 29 only)
+SEARCH_LIMIT = timedelta(days=366 * 8)
+
+
+def _parse_field(text, low, high):
+    values = set()
+    for part in text.split(","):
+        rng, _, step = part.partition("/")
+        step = int(step) if step else 1
+        if rng == "*":
+            start, end = low, high
+        elif "-" in rng:
+            start, end = (int(value) for value in rng.split("-", 1))
+        else:
+            start = end = int(rng)
+        if not (low <= start <= end <= high) or step < 1:
+            raise ValueError(f"'{part}' is out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """A parsed cron expression; next_after() gives the following match."""
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        fields = ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression '{expression}' needs 5 fields, got {len(fields)}"
+            )
+        try:
+            parsed = [
+                _parse_field(text, low, high)
+                for text, (low, high) in zip(fields, FIELD_RANGES)
+            ]
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}") from e
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # Cron counts Sunday as 0 (or 7); Python's weekday() as 6
+        self.weekdays = {(day - 1) % 7 for day in weekdays}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def __str__(self):
+        return self.expression
+
+    def __repr__(self):
+        return f"CronSchedule({self.expression!r})"
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        in_week = day.weekday() in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, moment):
+        """First matching minute strictly after `moment` (an aware datetime)."""
+        local = timezone.localtime(moment).replace(tzinfo=None)
+        candidate = local.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + SEARCH_LIMIT
+
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = datetime.combine(
+                    candidate.date() + timedelta(days=1), time.min
+                )
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return timezone.make_aware(candidate)
+        raise ValueError(f"Cron expression '{self.expression}' never matches")
@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import JobRun
+from .registry import job
+from .utils import delete_in_chunks
+
+
+@job("0 3 * * *")
+def prune_job_runs():
+    """Delete run history older than SCHEDULER_RUN_RETENTION_DAYS."""
+    days = getattr(settings, "SCHEDULER_RUN_RETENTION_DAYS", 30)
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted = delete_in_chunks(JobRun.objects.filter(started_at__lt=cutoff))
+    return f"Deleted {deleted} runs older than {days} days"
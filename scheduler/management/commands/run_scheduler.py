@@ -0,0 +1,99 @@
+"""
+Django management command to run the periodic jobs registered in each
+app's jobs.py
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from scheduler.models import JobRun
+from scheduler.registry import autodiscover
+from scheduler.runner import claim, run_job, run_pending, seconds_until_next, sync_jobs
+
+
+class Command(BaseCommand):
+    help = 'Run scheduled maintenance jobs (Spotify sync, rollups, cache warming, pruning)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run the jobs that are due now and exit instead of polling',
+        )
+        parser.add_argument(
+            '--run',
+            metavar='JOB',
+            help='Run one job now, whatever its schedule, and exit',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List the registered jobs and when they run next',
+        )
+        parser.add_argument(
+            '--poll',
+            type=float,
+            default=30.0,
+            help='Longest sleep between checks for due jobs, in seconds (default: 30)',
+        )
+
+    def handle(self, *args, **options):
+        jobs = autodiscover()
+        states = sync_jobs(jobs)
+
+        if options['list']:
+            self.stdout.write('🗓️  Registered jobs:')
+            for name in sorted(jobs):
+                next_run = timezone.localtime(states[name].next_run_at)
+                self.stdout.write(
+                    f"  • {name:<32} {str(jobs[name].schedule):<16} "
+                    f"next: {next_run:%Y-%m-%d %H:%M:%S}"
+                )
+            return
+
+        if options['run']:
+            job = jobs.get(options['run'])
+            if job is None:
+                raise CommandError(
+                    f"Unknown job '{options['run']}'. "
+                    f"Choose from: {', '.join(sorted(jobs))}"
+                )
+            if not claim(job, force=True):
+                raise CommandError(f"Job '{job.name}' is running on another node")
+            self._report(run_job(job))
+            return
+
+        if options['once']:
+            for run in run_pending(jobs):
+                self._report(run)
+            return
+
+        self.stdout.write(f"⏰ Scheduler running {len(jobs)} jobs (Ctrl+C to stop)")
+        try:
+            while True:
+                # Long-lived process: drop connections the database timed out
+                close_old_connections()
+                for run in run_pending(jobs):
+                    self._report(run)
+                wait = seconds_until_next(jobs)
+                if wait is None:
+                    wait = options['poll']
+                # A due job locked by another node keeps `wait` at 0
+                time.sleep(max(1.0, min(options['poll'], wait)))
+        except KeyboardInterrupt:
+            self.stdout.write('\n👋 Stopped')
+
+    def _report(self, run):
+        if run.status == JobRun.Status.SUCCESS:
+            self.stdout.write(
+                f"  ✅ {run.job_name} ({run.duration_ms:.0f} ms): {run.result}"
+            )
+        else:
+            last_line = run.error.strip().splitlines()[-1] if run.error else ''
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  ⚠️  {run.job_name} failed ({run.duration_ms:.0f} ms): {last_line}"
+                )
+            )
@@ -0,0 +1,64 @@
+from django.db import models
+
+
+class ScheduledJob(models.Model):
+    """
+    Shared state of one registered job (see scheduler.registry).
+
+    Every node running ``manage.py run_scheduler`` reads the same row, so a
+    job runs once per slot however many nodes there are: a node claims a
+    due run by moving `next_run_at` on and taking the lock in one UPDATE.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    schedule = models.CharField(max_length=100)
+    next_run_at = models.DateTimeField()
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    last_status = models.CharField(max_length=10, blank=True)
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Scheduled Job'
+        verbose_name_plural = 'Scheduled Jobs'
+
+    def __str__(self):
+        return f"{self.name} ({self.schedule})"
+
+
+class JobRun(models.Model):
+    """One execution of a scheduled job, with its duration and outcome."""
+
+    class Status(models.TextChoices):
+        RUNNING = 'running', 'Running'
+        SUCCESS = 'success', 'Success'
+        FAILED = 'failed', 'Failed'
+
+    job_name = models.CharField(max_length=100)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.RUNNING
+    )
+    host = models.CharField(
+        max_length=100,
+        help_text="Node and process that ran the job"
+    )
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.FloatField(null=True, blank=True)
+    result = models.TextField(blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        verbose_name = 'Job Run'
+        verbose_name_plural = 'Job Runs'
+        indexes = [
+            models.Index(fields=['job_name', '-started_at'], name='job_run_recent_idx'),
+            models.Index(fields=['started_at'], name='job_run_started_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_name} at {self.started_at:%Y-%m-%d %H:%M} - {self.status}"
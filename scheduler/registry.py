@@ -0,0 +1,75 @@
+"""
+Registration of periodic jobs for ``manage.py run_scheduler``.
+
+Apps declare jobs in a ``jobs.py`` module, which the scheduler imports at
+startup (like admin.py for the admin site):
+
+    from scheduler.registry import job
+
+    @job("15 1 * * *")
+    def rollup_resource_views():
+        ...
+        return "summary stored with the run"
+
+The schedule is a cron expression (see scheduler.cron). `jitter` adds up to
+that many random seconds to every run time, so jobs sharing a schedule do
+not all start on the same second. `timeout` is how long a run holds the
+job's lock; a node that dies mid-run blocks the job for at most that long.
+"""
+
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils.module_loading import autodiscover_modules
+
+from .cron import CronSchedule
+
+registry = {}
+
+
+class Job:
+    """A registered job: the callable, its schedule and lock settings."""
+
+    def __init__(self, name, func, schedule, jitter=None, timeout=None):
+        self.name = name
+        self.func = func
+        self.schedule = CronSchedule(schedule)
+        self.jitter = (
+            jitter
+            if jitter is not None
+            else getattr(settings, "SCHEDULER_DEFAULT_JITTER", 30)
+        )
+        self.timeout = timeout or getattr(settings, "SCHEDULER_LOCK_TIMEOUT", 3600)
+
+    def __repr__(self):
+        return f"<Job {self.name} {self.schedule}>"
+
+    def next_run_after(self, moment):
+        """Next scheduled time after `moment`, with this job's jitter added."""
+        run_at = self.schedule.next_after(moment)
+        if self.jitter:
+            run_at += timedelta(seconds=random.uniform(0, self.jitter))
+        return run_at
+
+    def __call__(self):
+        return self.func()
+
+
+def job(schedule, name=None, jitter=None, timeout=None):
+    """Register the decorated function as a job running on `schedule`."""
+
+    def decorator(func):
+        job_name = name or func.__name__
+        if job_name in registry and registry[job_name].func is not func:
+            raise ValueError(f"A job named '{job_name}' is already registered")
+        registry[job_name] = Job(job_name, func, schedule, jitter, timeout)
+        return func
+
+    return decorator
+
+
+def autodiscover():
+    """Import every installed app's jobs module, registering its jobs."""
+    autodiscover_modules("jobs")
+    return registry
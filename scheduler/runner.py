@@ -0,0 +1,138 @@
+"""
+Running registered jobs: claiming due runs, locking and recording history.
+
+Each job has a ScheduledJob row. A node claims a run with a single
+conditional UPDATE that only matches while the run is due and the lock is
+free, and that moves `next_run_at` to the following slot and takes the lock
+at the same time, so exactly one node wins each slot. The lock is released
+when the run finishes, or expires after the job's timeout if the node dies.
+Every run is recorded as a JobRun with its duration and outcome.
+"""
+
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import JobRun, ScheduledJob
+from .registry import registry
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process in locks and run history
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def sync_jobs(jobs=None, now=None):
+    """
+    Create the state row of every registered job and reschedule jobs whose
+    cron expression changed. Returns {name: ScheduledJob}.
+    """
+    jobs = registry if jobs is None else jobs
+    now = now or timezone.now()
+    states = {state.name: state for state in ScheduledJob.objects.filter(name__in=jobs)}
+
+    for name, job in jobs.items():
+        state = states.get(name)
+        if state is None:
+            state, _ = ScheduledJob.objects.get_or_create(
+                name=name,
+                defaults={
+                    "schedule": job.schedule.expression,
+                    "next_run_at": job.next_run_after(now),
+                },
+            )
+            states[name] = state
+        elif state.schedule != job.schedule.expression:
+            state.schedule = job.schedule.expression
+            state.next_run_at = job.next_run_after(now)
+            state.save(update_fields=["schedule", "next_run_at"])
+    return states
+
+
+def claim(job, now=None, force=False):
+    """
+    Take the lock for a run of `job`; False if it is not due (unless
+    `force`) or another node holds the lock.
+    """
+    now = now or timezone.now()
+    due = ScheduledJob.objects.filter(name=job.name).filter(
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+    )
+    if not force:
+        due = due.filter(next_run_at__lte=now)
+    return bool(
+        due.update(
+            next_run_at=job.next_run_after(now),
+            locked_by=WORKER_ID,
+            locked_until=now + timedelta(seconds=job.timeout),
+        )
+    )
+
+
+def run_job(job):
+    """Run a claimed job, record a JobRun and release the lock."""
+    run = JobRun.objects.create(
+        job_name=job.name, host=WORKER_ID, started_at=timezone.now()
+    )
+    started = time.perf_counter()
+    try:
+        result = job()
+    except Exception as e:
+        run.status = JobRun.Status.FAILED
+        run.error = traceback.format_exc()
+        logger.error(
+            f"Scheduled job {job.name} failed: {e}",
+            exc_info=True,
+            extra={"job": job.name, "run_id": run.pk},
+        )
+    else:
+        run.status = JobRun.Status.SUCCESS
+        run.result = "" if result is None else str(result)
+
+    run.finished_at = timezone.now()
+    run.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    run.save(update_fields=["status", "result", "error", "finished_at", "duration_ms"])
+
+    ScheduledJob.objects.filter(name=job.name, locked_by=WORKER_ID).update(
+        locked_by="",
+        locked_until=None,
+        last_run_at=run.started_at,
+        last_status=run.status,
+    )
+    if run.status == JobRun.Status.SUCCESS:
+        logger.info(
+            f"Scheduled job {job.name} finished: {run.result}",
+            extra={"job": job.name, "run_id": run.pk, "duration_ms": run.duration_ms},
+        )
+    return run
+
+
+def run_pending(jobs=None, now=None):
+    """Run every job that is due and not locked elsewhere; returns the runs."""
+    jobs = registry if jobs is None else jobs
+    runs = []
+    for name in sorted(jobs):
+        if claim(jobs[name], now=now):
+            runs.append(run_job(jobs[name]))
+    return runs
+
+
+def seconds_until_next(jobs=None, now=None):
+    """Seconds until the earliest registered job is due (0 if one is due)."""
+    jobs = registry if jobs is None else jobs
+    now = now or timezone.now()
+    next_run = (
+        ScheduledJob.objects.filter(name__in=jobs)
+        .order_by("next_run_at")
+        .values_list("next_run_at", flat=True)
+        .first()
+    )
+    if next_run is None:
+        return None
+    return max((next_run - now).total_seconds(), 0)
@@ -0,0 +1,203 @@
+"""
+Tests for the scheduler app.
+Tests cron parsing, job locking, run history and the maintenance jobs.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from django.test import TestCase
+from django.utils import timezone
+
+from scheduler.cron import CronSchedule
+from scheduler.models import JobRun, ScheduledJob
+from scheduler.registry import Job
+from scheduler.runner import claim, run_job, run_pending, sync_jobs
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+# ===== CRON TESTS =====
+
+
+@pytest.mark.unit
+class CronScheduleTest(TestCase):
+    """Test cron expression parsing and next-run calculation."""
+
+    def test_steps_and_ranges(self):
+        schedule = CronSchedule("*/15 9-17 * * *")
+        self.assertEqual(
+            schedule.next_after(local(2026, 3, 2, 9, 7)), local(2026, 3, 2, 9, 15)
+        )
+        self.assertEqual(
+            schedule.next_after(local(2026, 3, 2, 17, 45)), local(2026, 3, 3, 9, 0)
+        )
+
+    def test_weekdays_and_aliases(self):
+        # 2026-03-02 is a Monday; 0 and 7 both mean Sunday
+        self.assertEqual(
+            CronSchedule("30 8 * * 0").next_after(local(2026, 3, 2, 12, 0)),
+            local(2026, 3, 8, 8, 30),
+        )
+        self.assertEqual(
+            CronSchedule("30 8 * * 7").next_after(local(2026, 3, 2, 12, 0)),
+            local(2026, 3, 8, 8, 30),
+        )
+        self.assertEqual(
+            CronSchedule("@daily").next_after(local(2026, 3, 2, 0, 0)),
+            local(2026, 3, 3, 0, 0),
+        )
+
+    def test_restricted_day_fields_match_either(self):
+        # The 15th or any Friday, as in cron
+        schedule = CronSchedule("0 0 15 * 5")
+        self.assertEqual(
+            schedule.next_after(local(2026, 3, 2, 0, 0)), local(2026, 3, 6, 0, 0)
+        )
+        self.assertEqual(
+            schedule.next_after(local(2026, 3, 13, 0, 0)), local(2026, 3, 15, 0, 0)
+        )
+
+    def test_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "*/0 * * * *", "a * * * *"):
+            with self.assertRaises(ValueError):
+                CronSchedule(expression)
+
+
+# ===== RUNNER TESTS =====
+
+
+@pytest.mark.unit
+class SchedulerRunnerTest(TestCase):
+    """Test claiming, locking and recording scheduled job runs."""
+
+    def setUp(self):
+        self.calls = []
+        self.job = Job(
+            "collect", lambda: self.calls.append(1) or "done", "*/5 * * * *", jitter=0
+        )
+        self.jobs = {"collect": self.job}
+        self.now = timezone.now()
+        sync_jobs(self.jobs, now=self.now)
+        ScheduledJob.objects.filter(name="collect").update(
+            next_run_at=self.now - timedelta(seconds=1)
+        )
+
+    def test_only_one_claim_wins_a_slot(self):
+        self.assertTrue(claim(self.job, now=self.now))
+        # Another node checking at the same moment
+        self.assertFalse(claim(self.job, now=self.now))
+
+        state = ScheduledJob.objects.get(name="collect")
+        self.assertGreater(state.next_run_at, self.now)
+        self.assertTrue(state.locked_by)
+
+    def test_lock_blocks_forced_runs_until_it_expires(self):
+        self.assertTrue(claim(self.job, now=self.now))
+        self.assertFalse(claim(self.job, now=self.now, force=True))
+
+        expired = self.now + timedelta(seconds=self.job.timeout + 1)
+        self.assertTrue(claim(self.job, now=expired, force=True))
+
+    def test_run_records_history_and_releases_lock(self):
+        runs = run_pending(self.jobs, now=self.now)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(self.calls, [1])
+        run = JobRun.objects.get()
+        self.assertEqual(run.status, JobRun.Status.SUCCESS)
+        self.assertEqual(run.result, "done")
+        self.assertIsNotNone(run.duration_ms)
+        state = ScheduledJob.objects.get(name="collect")
+        self.assertEqual(state.locked_by, "")
+        self.assertEqual(state.last_status, JobRun.Status.SUCCESS)
+
+        # Not due again until the next slot
+        self.assertEqual(run_pending(self.jobs, now=self.now), [])
+
+    def test_failed_run_is_recorded(self):
+        def broken():
+            raise RuntimeError("spotify is down")
+
+        job = Job("broken", broken, "@hourly", jitter=0)
+        sync_jobs({"broken": job}, now=self.now)
+        self.assertTrue(claim(job, force=True))
+
+        with self.assertLogs("scheduler.runner", level="ERROR"):
+            run = run_job(job)
+
+        self.assertEqual(run.status, JobRun.Status.FAILED)
+        self.assertIn("spotify is down", run.error)
+        self.assertEqual(ScheduledJob.objects.get(name="broken").locked_by, "")
+
+    def test_changed_schedule_is_rescheduled(self):
+        job = Job("collect", self.job.func, "0 4 * * *", jitter=0)
+        sync_jobs({"collect": job}, now=self.now)
+
+        state = ScheduledJob.objects.get(name="collect")
+        self.assertEqual(state.schedule, "0 4 * * *")
+        self.assertEqual(timezone.localtime(state.next_run_at).hour, 4)
+
+    def test_admin_edit_keeps_a_concurrent_lock(self):
+        """Saving the change form only writes next_run_at."""
+        from django.contrib.admin.sites import site
+
+        state = ScheduledJob.objects.get(name="collect")
+        # The scheduler claims the job while the form is open
+        self.assertTrue(claim(self.job, now=self.now))
+
+        state.next_run_at = self.now + timedelta(hours=1)
+        site._registry[ScheduledJob].save_model(None, state, None, change=True)
+
+        state.refresh_from_db()
+        self.assertEqual(state.next_run_at, self.now + timedelta(hours=1))
+        self.assertTrue(state.locked_by)
+
+
+# ===== MAINTENANCE JOB TESTS =====
+
+
+@pytest.mark.unit
+class MaintenanceJobTest(TestCase):
+    """Test the pruning jobs registered by the apps."""
+
+    def test_prune_ai_queries_keeps_recent_rows(self):
+        from ai.jobs import prune_ai_queries
+        from ai.models import AIQuery
+
+        old = AIQuery.objects.create(question="old")
+        AIQuery.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=400)
+        )
+        recent = AIQuery.objects.create(question="recent")
+
+        prune_ai_queries()
+
+        self.assertEqual(
+            list(AIQuery.objects.values_list("pk", flat=True)), [recent.pk]
+        )
+
+    def test_prune_contact_notifications_keeps_unfinished(self):
+        from notifications.jobs import prune_contact_notifications
+        from notifications.models import ContactNotification
+        from portfolio.models import ContactSubmission
+
+        Status = ContactNotification.NotificationStatus
+        for status in (Status.COMPLETED, Status.PENDING):
+            submission = ContactSubmission.objects.create(
+                name="Reader", email="reader@example.com", message="Hi"
+            )
+            # Saving the submission queues its notification
+            ContactNotification.objects.filter(contact_submission=submission).update(
+                status=status, updated_at=timezone.now() - timedelta(days=400)
+            )
+
+        prune_contact_notifications()
+
+        self.assertEqual(
+            list(ContactNotification.objects.values_list("status", flat=True)),
+            [Status.PENDING],
+        )
+        self.assertEqual(ContactSubmission.objects.count(), 2)
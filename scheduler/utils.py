@@ -0,0 +1,20 @@
+"""Helpers for maintenance jobs."""
+
+from django.conf import settings
+
+
+def delete_in_chunks(queryset, chunk_size=None):
+    """
+    Delete the rows of `queryset` a chunk at a time, so a large prune never
+    holds long locks or loads every row at once. Returns the rows deleted,
+    cascades included.
+    """
+    chunk_size = chunk_size or getattr(settings, "SCHEDULER_DELETE_CHUNK", 1000)
+    model = queryset.model
+    deleted = 0
+    while True:
+        chunk = list(queryset.values_list("pk", flat=True)[:chunk_size])
+        if not chunk:
+            return deleted
+        count, _ = model.objects.filter(pk__in=chunk).delete()
+        deleted += count
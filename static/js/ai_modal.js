@@ -125,24 +125,13 @@ document.addEventListener('DOMContentLoaded', function() {
             }
             textarea.style.height = 'auto';
             
-            // Submit form data
-            fetch(this.action, {
-                method: 'POST',
-                body: formData,
-                headers: {
-                    'X-Requested-With': 'XMLHttpRequest',
-                }
-            })
-            .then(response => response.json())
-            .then(data => {
-                removeTypingIndicator();
-                
-                if (data.success) {
-                    addMessageToChat('ai', data.response);
-                } else {
-                    addMessageToChat('ai', 'Sorry, I encountered an error. Please try again.');
-                }
-            })
+            // Stream the answer where the browser supports it, so text shows
+            // up as soon as it is generated
+            const request = this.dataset.streamUrl && window.ReadableStream && window.TextDecoder
+                ? streamAnswer(this.dataset.streamUrl, formData)
+                : fetchAnswer(this.action, formData);
+
+            request
             .catch(error => {
                 removeTypingIndicator();
                 addMessageToChat('ai', 'Sorry, I encountered an error. Please try again.');
@@ -155,6 +144,91 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    function fetchAnswer(url, formData) {
+        return fetch(url, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            removeTypingIndicator();
+            
+            if (data.success) {
+                addMessageToChat('ai', data.response);
+            } else {
+                addMessageToChat('ai', 'Sorry, I encountered an error. Please try again.');
+            }
+        });
+    }
+
+    function streamAnswer(url, formData) {
+        // Server-Sent Events over a POST: "chunk" events carry text, then
+        // "error" (optional) and "done"
+        return fetch(url, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'Accept': 'text/event-stream',
+                'X-Requested-With': 'XMLHttpRequest',
+            }
+        })
+        .then(response => {
+            if (!response.ok || !response.body) {
+                throw new Error(`Stream failed with status ${response.status}`);
+            }
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let answer = '';
+            let bubble = null;
+
+            function handleEvent(block) {
+                let event = 'message';
+                let data = '';
+                block.split('\n').forEach(line => {
+                    if (line.startsWith('event:')) event = line.slice(6).trim();
+                    else if (line.startsWith('data:')) data += line.slice(5).trim();
+                });
+                if (!data) return;
+                const payload = JSON.parse(data);
+
+                if (event === 'chunk' || event === 'error') {
+                    answer += event === 'chunk' ? payload.text : payload.message;
+                    if (!bubble) {
+                        removeTypingIndicator();
+                        addMessageToChat('ai', '');
+                        bubble = modal.querySelector('#ai-chat-messages .ai-message:last-child .message-bubble');
+                    }
+                    bubble.innerHTML = formatAIMessage(answer);
+                    const messagesContainer = modal.querySelector('#ai-chat-messages');
+                    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+                }
+            }
+
+            function read() {
+                return reader.read().then(({ done, value }) => {
+                    if (done) {
+                        if (buffer.trim()) handleEvent(buffer);
+                        if (!bubble) {
+                            throw new Error('Stream ended without an answer');
+                        }
+                        return;
+                    }
+                    buffer += decoder.decode(value, { stream: true });
+                    const blocks = buffer.split('\n\n');
+                    buffer = blocks.pop();
+                    blocks.forEach(handleEvent);
+                    return read();
+                });
+            }
+
+            return read();
+        });
+    }
+
     function formatAIMessage(message) {
         // Convert markdown-like formatting to HTML (WhatsApp style)
         let formatted = message;
@@ -61,9 +61,6 @@ document.addEventListener('DOMContentLoaded', () => {
     
     if (commentList) {
         const loadMoreBtn = document.getElementById('load-more-comments');
-        const allComments = Array.from(commentList.querySelectorAll('.comment-item'));
-        const COMMENTS_PER_PAGE = 5;
-        let commentsShown = 0;
 
         // --- Like Button Functionality ---
         commentList.addEventListener('click', async (e) => {
@@ -125,27 +122,74 @@ document.addEventListener('DOMContentLoaded', () => {
         });
 
         // --- Load More Comments Functionality ---
-        function loadMoreComments() {
-            const commentsToLoad = allComments.slice(commentsShown, commentsShown + COMMENTS_PER_PAGE);
-            
-            commentsToLoad.forEach(comment => {
-                comment.classList.remove('hidden'); // This makes the comment visible
-            });
-            
-            commentsShown += commentsToLoad.length;
-            
-            // Hide "Load More" button if all comments are now visible
-            if (loadMoreBtn && commentsShown >= allComments.length) {
-                loadMoreBtn.style.display = 'none';
+        // The first page is rendered by the server; later pages are fetched
+        // with the cursor returned by the previous page.
+        async function loadMoreComments() {
+            if (!loadMoreBtn || loadMoreBtn.disabled) return;
+
+            const originalText = loadMoreBtn.textContent;
+            loadMoreBtn.textContent = 'Loading...';
+            loadMoreBtn.disabled = true;
+
+            try {
+                const url = new URL(loadMoreBtn.dataset.url, window.location.origin);
+                url.searchParams.set('cursor', loadMoreBtn.dataset.nextCursor);
+                const response = await fetch(url);
+                const data = await response.json();
+
+                (data.comments || []).forEach(comment => {
+                    commentList.insertAdjacentHTML('beforeend', createCommentHTML(comment));
+                });
+                setAvatarColors();
+
+                if (data.next_cursor) {
+                    loadMoreBtn.dataset.nextCursor = data.next_cursor;
+                } else {
+                    loadMoreBtn.style.display = 'none';
+                }
+            } catch (error) {
+                console.error('Error loading comments:', error);
+            } finally {
+                loadMoreBtn.textContent = originalText;
+                loadMoreBtn.disabled = false;
             }
         }
 
+        function escapeHTML(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+
+        function createCommentHTML(comment) {
+            const likeButtonClass = comment.is_liked ? 'like-btn active' : 'like-btn';
+            const heartIconClass = comment.is_liked ? 'fa-solid fa-heart' : 'fa-regular fa-heart';
+
+            return `
+                <div class="comment-item card">
+                    <div class="comment-avatar" data-avatar-color="${comment.avatar_color}">
+                        ${escapeHTML(comment.initials)}
+                    </div>
+                    <div class="comment-body">
+                        <div class="comment-header">
+                            <h5>${escapeHTML(comment.author_name)}</h5>
+                            <span>${escapeHTML(comment.timesince)} ago</span>
+                        </div>
+                        <p>${escapeHTML(comment.body)}</p>
+                        <div class="comment-actions">
+                            <button class="${likeButtonClass}" data-comment-id="${comment.id}">
+                                <i class="${heartIconClass}"></i>
+                                <span class="like-count">${comment.likes}</span>
+                            </button>
+                        </div>
+                    </div>
+                </div>
+            `;
+        }
+
         if (loadMoreBtn) {
             loadMoreBtn.addEventListener('click', loadMoreComments);
         }
-        
-        // Initial load of the first page of comments
-        loadMoreComments();
     }
 
     // =========================================================================
@@ -209,11 +209,6 @@ document.addEventListener('DOMContentLoaded', () => {
     
     if (commentList) {
         const loadMoreBtn = document.getElementById('load-more-comments');
-        let commentsLoaded = 5; // Initial 5 comments are already loaded
-        
-        // Get the project slug from the URL
-        const pathParts = window.location.pathname.split('/');
-        const projectSlug = pathParts[pathParts.length - 2]; // Assuming URL structure: /projects/slug/
 
         // --- Like Button Functionality ---
         commentList.addEventListener('click', async (e) => {
@@ -283,8 +278,10 @@ document.addEventListener('DOMContentLoaded', () => {
             loadMoreBtn.textContent = 'Loading...';
             loadMoreBtn.disabled = true;
             
-            // Make AJAX request to load more comments
-            fetch(`/projects/${projectSlug}/load-more-comments/?offset=${commentsLoaded}`)
+            // Fetch the page after the last loaded comment
+            const url = new URL(loadMoreBtn.dataset.url, window.location.origin);
+            url.searchParams.set('cursor', loadMoreBtn.dataset.nextCursor);
+            fetch(url)
                 .then(response => response.json())
                 .then(data => {
                     if (data.comments && data.comments.length > 0) {
@@ -294,12 +291,13 @@ document.addEventListener('DOMContentLoaded', () => {
                             commentList.insertAdjacentHTML('beforeend', commentHTML);
                         });
                         
-                        commentsLoaded += data.comments.length;
-                        
-                        // Hide load more button if no more comments
-                        if (!data.has_more) {
-                            loadMoreBtn.style.display = 'none';
-                        }
+                    }
+
+                    // Hide load more button if no more comments
+                    if (data.next_cursor) {
+                        loadMoreBtn.dataset.nextCursor = data.next_cursor;
+                    } else {
+                        loadMoreBtn.style.display = 'none';
                     }
                     
                     // Reset button state
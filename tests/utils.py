@@ -15,6 +15,21 @@ class BaseTestCase(TestCase):
 
     def setUp(self):
         """Set up test fixtures before each test method."""
+        # Rolled-back rows never fire post_delete, so drop cached singletons
+        # and any hits buffered for rows that no longer exist
+        from ai.answer_cache import answer_cache
+        from ai.llm_utills import model_registry
+        from ai.utils import portfolio_context
+        from portfolio.cache import clear_singleton_caches
+        from roshan.view_recorder import recorder
+        from roshan.visitors import buffer as visitor_buffer
+
+        clear_singleton_caches()
+        recorder.clear()
+        visitor_buffer.clear()
+        model_registry.reset()
+        portfolio_context.clear()
+        answer_cache.clear()
         self.client = Client()
         self.user = User.objects.create_user(
             username="testuser", email="test@example.com", password="testpass123"